@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 
 @dataclass
@@ -37,3 +37,18 @@ class TaskDTO:
     is_completed: bool
     created_at: datetime
     updated_at: datetime
+    reminder_version: int = 0
+
+
+@dataclass
+class BulkTaskResultDTO:
+    """DTO for returning the result of a bulk create/update."""
+    created: List[TaskDTO]
+    updated: List[TaskDTO]
+
+
+@dataclass
+class TaskPageDTO:
+    """DTO for returning a page of tasks."""
+    items: List[TaskDTO]
+    next_cursor: Optional[str]
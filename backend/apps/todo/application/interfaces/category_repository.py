@@ -17,6 +17,11 @@ class ICategoryRepository(ABC):
         """Get category by ID."""
         pass
 
+    @abstractmethod
+    def get_many(self, category_ids: List[str]) -> List[Category]:
+        """Get categories by a list of IDs in a single lookup."""
+        pass
+
     @abstractmethod
     def get_all(self) -> List[Category]:
         """Get all categories."""
@@ -31,3 +36,20 @@ class ICategoryRepository(ABC):
     def delete(self, category_id: str) -> bool:
         """Delete a category."""
         pass
+
+    # Async variants for async views (Django async ORM)
+
+    @abstractmethod
+    async def aget_by_id(self, category_id: str) -> Optional[Category]:
+        """Get category by ID."""
+        pass
+
+    @abstractmethod
+    async def aget_many(self, category_ids: List[str]) -> List[Category]:
+        """Get categories by a list of IDs in a single lookup."""
+        pass
+
+    @abstractmethod
+    async def aget_all(self) -> List[Category]:
+        """Get all categories."""
+        pass
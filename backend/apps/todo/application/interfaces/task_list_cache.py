@@ -0,0 +1,48 @@
+from abc import ABC, abstractmethod
+from typing import Awaitable, Callable, Optional
+
+from apps.todo.application.dto.task_dto import TaskPageDTO
+
+
+class ITaskListCache(ABC):
+    """Interface for per-user task list cache."""
+
+    @abstractmethod
+    def get_or_load(self, user_id: int, key: str, loader: Callable[[], TaskPageDTO]) -> TaskPageDTO:
+        """Return a cached page or load it once, even under concurrent misses."""
+        pass
+
+    @abstractmethod
+    async def aget_or_load(
+        self,
+        user_id: int,
+        key: str,
+        loader: Callable[[], Awaitable[TaskPageDTO]]
+    ) -> TaskPageDTO:
+        """Async variant of get_or_load with an async loader."""
+        pass
+
+    @abstractmethod
+    def get_version_tag(self, user_id: int) -> Optional[str]:
+        """Tag that changes with every invalidation of the user's lists; None if unknown."""
+        pass
+
+    @abstractmethod
+    async def aget_version_tag(self, user_id: int) -> Optional[str]:
+        """Async variant of get_version_tag."""
+        pass
+
+    @abstractmethod
+    def invalidate(self, user_id: int) -> None:
+        """Invalidate all cached lists of a user once the current transaction commits."""
+        pass
+
+    @abstractmethod
+    async def ainvalidate(self, user_id: int) -> None:
+        """Async variant of invalidate; also deferred until the current transaction commits."""
+        pass
+
+    @abstractmethod
+    def invalidate_all(self) -> None:
+        """Invalidate cached lists of all users (e.g. after a category rename) once the current transaction commits."""
+        pass
@@ -1,8 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import AsyncIterator, Iterator, List, Optional, Tuple
 from datetime import datetime
 
 from apps.todo.domain.entities.task import Task
+from apps.todo.domain.value_objects.task_status import TaskStatus
 
 
 class ITaskRepository(ABC):
@@ -19,18 +20,68 @@ class ITaskRepository(ABC):
         pass
 
     @abstractmethod
-    def get_by_user_id(self, user_id: int) -> List[Task]:
-        """Get all tasks for a user."""
+    def get_many(self, task_ids: List[str]) -> List[Task]:
+        """Get tasks by a list of IDs in a single lookup."""
         pass
 
     @abstractmethod
-    def get_by_category(self, category_id: str) -> List[Task]:
-        """Get all tasks in a category."""
+    def get_by_user_id(self, user_id: int, with_description: bool = True) -> List[Task]:
+        """Get all tasks for a user; with_description=False leaves description empty."""
         pass
 
     @abstractmethod
-    def get_overdue_tasks(self) -> List[Task]:
-        """Get all overdue tasks."""
+    def iter_by_user_id(self, user_id: int) -> Iterator[Task]:
+        """Stream all tasks of a user in creation order without loading them at once."""
+        pass
+
+    @abstractmethod
+    def get_page_by_user_id(
+        self,
+        user_id: int,
+        after: Optional[str] = None,
+        limit: int = 20,
+        category_id: Optional[str] = None,
+        with_description: bool = True,
+        status: Optional[TaskStatus] = None,
+        due_before: Optional[datetime] = None,
+        due_after: Optional[datetime] = None
+    ) -> List[Task]:
+        """
+        Get a page of user's tasks, newest first, strictly after the given task ID.
+
+        due_before is exclusive and due_after inclusive; either one leaves
+        out tasks without a due date.
+        """
+        pass
+
+    @abstractmethod
+    def search(self, user_id: int, query: str, limit: int = 20) -> List[Task]:
+        """Full-text search over a user's tasks, best matches first."""
+        pass
+
+    @abstractmethod
+    def get_by_category(self, category_id: str, with_description: bool = True) -> List[Task]:
+        """Get all tasks in a category; with_description=False leaves description empty."""
+        pass
+
+    @abstractmethod
+    def get_overdue_tasks(self, with_description: bool = True) -> List[Task]:
+        """Get all overdue tasks; with_description=False leaves description empty."""
+        pass
+
+    @abstractmethod
+    def iter_overdue_tasks(
+        self,
+        before: Optional[datetime] = None,
+        after: Optional[Tuple[datetime, str]] = None,
+        pending_only: bool = False,
+        chunk_size: int = 2000,
+        with_description: bool = True
+    ) -> Iterator[Task]:
+        """
+        Stream open tasks due before `before` (default: now), oldest due date first,
+        in bounded chunks; after is the (due_date, id) to resume from.
+        """
         pass
 
     @abstractmethod
@@ -38,7 +89,79 @@ class ITaskRepository(ABC):
         """Update a task."""
         pass
 
+    @abstractmethod
+    def bulk_create(self, tasks: List[Task]) -> List[Task]:
+        """Create many tasks in batched INSERTs."""
+        pass
+
+    @abstractmethod
+    def bulk_import(self, tasks: List[Task], remind_after: Optional[datetime] = None) -> int:
+        """
+        Insert many new tasks as fast as the backend allows; returns the count.
+
+        Reminders are queued only for due dates after remind_after, when given;
+        earlier due dates are recorded as already notified.
+        """
+        pass
+
+    @abstractmethod
+    def bulk_update(self, tasks: List[Task]) -> List[Task]:
+        """Update many tasks in batched UPDATEs."""
+        pass
+
     @abstractmethod
     def delete(self, task_id: str) -> bool:
         """Delete a task."""
         pass
+
+    # Async variants for async views (Django async ORM)
+
+    @abstractmethod
+    async def acreate(self, task: Task) -> Task:
+        """Create a new task."""
+        pass
+
+    @abstractmethod
+    async def aget_by_id(self, task_id: str) -> Optional[Task]:
+        """Get task by ID."""
+        pass
+
+    @abstractmethod
+    def aiter_by_user_id(self, user_id: int) -> AsyncIterator[Task]:
+        """Async variant of iter_by_user_id."""
+        pass
+
+    @abstractmethod
+    async def aget_page_by_user_id(
+        self,
+        user_id: int,
+        after: Optional[str] = None,
+        limit: int = 20,
+        category_id: Optional[str] = None,
+        with_description: bool = True,
+        status: Optional[TaskStatus] = None,
+        due_before: Optional[datetime] = None,
+        due_after: Optional[datetime] = None
+    ) -> List[Task]:
+        """
+        Get a page of user's tasks, newest first, strictly after the given task ID.
+
+        due_before is exclusive and due_after inclusive; either one leaves
+        out tasks without a due date.
+        """
+        pass
+
+    @abstractmethod
+    async def asearch(self, user_id: int, query: str, limit: int = 20) -> List[Task]:
+        """Full-text search over a user's tasks, best matches first."""
+        pass
+
+    @abstractmethod
+    async def aupdate(self, task: Task) -> Task:
+        """Update a task."""
+        pass
+
+    @abstractmethod
+    async def adelete(self, task_id: str) -> bool:
+        """Delete a task."""
+        pass
@@ -0,0 +1,129 @@
+from datetime import datetime
+from typing import Dict, List, Optional, Set
+
+from apps.todo.domain.entities.task import Task
+from apps.todo.domain.value_objects.task_id import ULIDGenerator
+from apps.todo.application.interfaces.task_repository import ITaskRepository
+from apps.todo.application.interfaces.category_repository import ICategoryRepository
+from apps.todo.application.interfaces.task_list_cache import ITaskListCache
+from apps.todo.application.dto.task_dto import (
+    CreateTaskDTO,
+    UpdateTaskDTO,
+    TaskDTO,
+    BulkTaskResultDTO
+)
+from apps.todo.domain.exceptions.exceptions import (
+    TaskNotFoundException,
+    CategoryNotFoundException,
+    InvalidTaskDataException,
+    UnauthorizedAccessException
+)
+
+
+class BulkUpsertTasksUseCase:
+    """Use case for creating and updating many tasks at once."""
+
+    def __init__(
+        self,
+        task_repository: ITaskRepository,
+        category_repository: ICategoryRepository,
+        task_list_cache: Optional[ITaskListCache] = None
+    ):
+        self.task_repository = task_repository
+        self.category_repository = category_repository
+        self.task_list_cache = task_list_cache
+
+    def execute(
+        self,
+        creates: List[CreateTaskDTO],
+        updates: List[UpdateTaskDTO],
+        user_id: int
+    ) -> BulkTaskResultDTO:
+        """Execute the use case."""
+        update_ids = [dto.task_id for dto in updates]
+        if len(set(update_ids)) != len(update_ids):
+            raise InvalidTaskDataException("Duplicate task ids in bulk update")
+
+        existing: Dict[str, Task] = {
+            task.id: task for task in self.task_repository.get_many(update_ids)
+        }
+        for task_id in update_ids:
+            task = existing.get(task_id)
+            if not task:
+                raise TaskNotFoundException(task_id)
+            if task.user_id != user_id:
+                raise UnauthorizedAccessException("You can only update your own tasks")
+
+        category_names = self._resolve_categories(
+            {dto.category_id for dto in [*creates, *updates] if dto.category_id},
+            {task.category_id for task in existing.values() if task.category_id}
+        )
+
+        now = datetime.now()
+        new_tasks = [
+            Task(
+                id=ULIDGenerator.generate(),
+                title=dto.title,
+                description=dto.description,
+                user_id=user_id,
+                category_id=dto.category_id,
+                due_date=dto.due_date,
+                is_completed=False,
+                created_at=now,
+                updated_at=now
+            )
+            for dto in creates
+        ]
+
+        changed_tasks = []
+        for dto in updates:
+            task = existing[dto.task_id]
+            if dto.title is not None:
+                task.title = dto.title
+            if dto.description is not None:
+                task.description = dto.description
+            if dto.category_id is not None:
+                task.category_id = dto.category_id
+            if dto.due_date is not None:
+                task.due_date = dto.due_date
+            if dto.is_completed is not None:
+                task.is_completed = dto.is_completed
+            task.updated_at = now
+            changed_tasks.append(task)
+
+        created = self.task_repository.bulk_create(new_tasks) if new_tasks else []
+        updated = self.task_repository.bulk_update(changed_tasks) if changed_tasks else []
+
+        if self.task_list_cache and (created or updated):
+            self.task_list_cache.invalidate(user_id)
+
+        return BulkTaskResultDTO(
+            created=[self._to_dto(t, category_names) for t in created],
+            updated=[self._to_dto(t, category_names) for t in updated]
+        )
+
+    def _resolve_categories(self, referenced_ids: Set[str], current_ids: Set[str]) -> Dict[str, str]:
+        """Validate referenced categories and fetch names for all of them in one lookup."""
+        category_names = {
+            category.id: category.name
+            for category in self.category_repository.get_many(list(referenced_ids | current_ids))
+        }
+        for category_id in referenced_ids:
+            if category_id not in category_names:
+                raise CategoryNotFoundException(category_id)
+        return category_names
+
+    def _to_dto(self, task: Task, category_names: Dict[str, str]) -> TaskDTO:
+        return TaskDTO(
+            id=task.id,
+            title=task.title,
+            description=task.description,
+            user_id=task.user_id,
+            category_id=task.category_id,
+            category_name=category_names.get(task.category_id) if task.category_id else None,
+            due_date=task.due_date,
+            is_completed=task.is_completed,
+            created_at=task.created_at,
+            updated_at=task.updated_at,
+            reminder_version=task.reminder_version
+        )
@@ -1,9 +1,10 @@
 from datetime import datetime
-from typing import List
+from typing import List, Optional
 
 from apps.todo.domain.entities.category import Category
 from apps.todo.domain.value_objects.task_id import ULIDGenerator
 from apps.todo.application.interfaces.category_repository import ICategoryRepository
+from apps.todo.application.interfaces.task_list_cache import ITaskListCache
 from apps.todo.application.dto.category_dto import (
     CreateCategoryDTO,
     UpdateCategoryDTO,
@@ -50,8 +51,14 @@ class ListCategoriesUseCase:
 
     def execute(self) -> List[CategoryDTO]:
         """Execute the use case."""
-        categories = self.category_repository.get_all()
+        return self._to_dtos(self.category_repository.get_all())
 
+    async def aexecute(self) -> List[CategoryDTO]:
+        """Execute the use case with the async repository variants."""
+        return self._to_dtos(await self.category_repository.aget_all())
+
+    @staticmethod
+    def _to_dtos(categories: List[Category]) -> List[CategoryDTO]:
         return [
             CategoryDTO(
                 id=cat.id,
@@ -68,8 +75,13 @@ class ListCategoriesUseCase:
 class UpdateCategoryUseCase:
     """Use case for updating a category."""
 
-    def __init__(self, category_repository: ICategoryRepository):
+    def __init__(
+        self,
+        category_repository: ICategoryRepository,
+        task_list_cache: Optional[ITaskListCache] = None
+    ):
         self.category_repository = category_repository
+        self.task_list_cache = task_list_cache
 
     def execute(self, dto: UpdateCategoryDTO) -> CategoryDTO:
         """Execute the use case."""
@@ -87,6 +99,9 @@ class UpdateCategoryUseCase:
         category.updated_at = datetime.now()
 
         updated = self.category_repository.update(category)
+        if self.task_list_cache:
+            # Task lists embed category names
+            self.task_list_cache.invalidate_all()
 
         return CategoryDTO(
             id=updated.id,
@@ -101,8 +116,13 @@ class UpdateCategoryUseCase:
 class DeleteCategoryUseCase:
     """Use case for deleting a category."""
 
-    def __init__(self, category_repository: ICategoryRepository):
+    def __init__(
+        self,
+        category_repository: ICategoryRepository,
+        task_list_cache: Optional[ITaskListCache] = None
+    ):
         self.category_repository = category_repository
+        self.task_list_cache = task_list_cache
 
     def execute(self, category_id: str) -> bool:
         """Execute the use case."""
@@ -110,4 +130,8 @@ class DeleteCategoryUseCase:
         if not category:
             raise CategoryNotFoundException(category_id)
 
-        return self.category_repository.delete(category_id)
+        deleted = self.category_repository.delete(category_id)
+        if deleted and self.task_list_cache:
+            # Tasks of the deleted category lose their category_id
+            self.task_list_cache.invalidate_all()
+        return deleted
@@ -1,9 +1,11 @@
 from datetime import datetime
+from typing import Optional
 
 from apps.todo.domain.entities.task import Task
 from apps.todo.domain.value_objects.task_id import ULIDGenerator
 from apps.todo.application.interfaces.task_repository import ITaskRepository
 from apps.todo.application.interfaces.category_repository import ICategoryRepository
+from apps.todo.application.interfaces.task_list_cache import ITaskListCache
 from apps.todo.application.dto.task_dto import CreateTaskDTO, TaskDTO
 from apps.todo.domain.exceptions.exceptions import CategoryNotFoundException
 
@@ -14,10 +16,12 @@ class CreateTaskUseCase:
     def __init__(
         self,
         task_repository: ITaskRepository,
-        category_repository: ICategoryRepository
+        category_repository: ICategoryRepository,
+        task_list_cache: Optional[ITaskListCache] = None
     ):
         self.task_repository = task_repository
         self.category_repository = category_repository
+        self.task_list_cache = task_list_cache
 
     def execute(self, dto: CreateTaskDTO) -> TaskDTO:
         """Execute the use case."""
@@ -26,8 +30,35 @@ class CreateTaskUseCase:
             if not category:
                 raise CategoryNotFoundException(dto.category_id)
 
+        created_task = self.task_repository.create(self._new_task(dto))
+        if self.task_list_cache:
+            self.task_list_cache.invalidate(created_task.user_id)
+
+        category_name = None
+        if created_task.category_id:
+            category = self.category_repository.get_by_id(created_task.category_id)
+            category_name = category.name if category else None
+
+        return self._to_dto(created_task, category_name)
+
+    async def aexecute(self, dto: CreateTaskDTO) -> TaskDTO:
+        """Execute the use case with the async repository variants."""
+        category = None
+        if dto.category_id:
+            category = await self.category_repository.aget_by_id(dto.category_id)
+            if not category:
+                raise CategoryNotFoundException(dto.category_id)
+
+        created_task = await self.task_repository.acreate(self._new_task(dto))
+        if self.task_list_cache:
+            await self.task_list_cache.ainvalidate(created_task.user_id)
+
+        return self._to_dto(created_task, category.name if category else None)
+
+    @staticmethod
+    def _new_task(dto: CreateTaskDTO) -> Task:
         now = datetime.now()
-        task = Task(
+        return Task(
             id=ULIDGenerator.generate(),
             title=dto.title,
             description=dto.description,
@@ -39,13 +70,8 @@ class CreateTaskUseCase:
             updated_at=now
         )
 
-        created_task = self.task_repository.create(task)
-
-        category_name = None
-        if created_task.category_id:
-            category = self.category_repository.get_by_id(created_task.category_id)
-            category_name = category.name if category else None
-
+    @staticmethod
+    def _to_dto(created_task: Task, category_name: Optional[str]) -> TaskDTO:
         return TaskDTO(
             id=created_task.id,
             title=created_task.title,
@@ -56,5 +82,6 @@ class CreateTaskUseCase:
             due_date=created_task.due_date,
             is_completed=created_task.is_completed,
             created_at=created_task.created_at,
-            updated_at=created_task.updated_at
+            updated_at=created_task.updated_at,
+            reminder_version=created_task.reminder_version
         )
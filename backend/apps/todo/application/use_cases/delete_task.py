@@ -1,4 +1,7 @@
+from typing import Optional
+
 from apps.todo.application.interfaces.task_repository import ITaskRepository
+from apps.todo.application.interfaces.task_list_cache import ITaskListCache
 from apps.todo.domain.exceptions.exceptions import (
     TaskNotFoundException,
     UnauthorizedAccessException
@@ -8,8 +11,13 @@ from apps.todo.domain.exceptions.exceptions import (
 class DeleteTaskUseCase:
     """Use case for deleting a task."""
 
-    def __init__(self, task_repository: ITaskRepository):
+    def __init__(
+        self,
+        task_repository: ITaskRepository,
+        task_list_cache: Optional[ITaskListCache] = None
+    ):
         self.task_repository = task_repository
+        self.task_list_cache = task_list_cache
 
     def execute(self, task_id: str, user_id: int) -> bool:
         """Execute the use case."""
@@ -20,4 +28,21 @@ class DeleteTaskUseCase:
         if task.user_id != user_id:
             raise UnauthorizedAccessException("You can only delete your own tasks")
 
-        return self.task_repository.delete(task_id)
+        deleted = self.task_repository.delete(task_id)
+        if deleted and self.task_list_cache:
+            self.task_list_cache.invalidate(user_id)
+        return deleted
+
+    async def aexecute(self, task_id: str, user_id: int) -> bool:
+        """Execute the use case with the async repository variants."""
+        task = await self.task_repository.aget_by_id(task_id)
+        if not task:
+            raise TaskNotFoundException(task_id)
+
+        if task.user_id != user_id:
+            raise UnauthorizedAccessException("You can only delete your own tasks")
+
+        deleted = await self.task_repository.adelete(task_id)
+        if deleted and self.task_list_cache:
+            await self.task_list_cache.ainvalidate(user_id)
+        return deleted
@@ -0,0 +1,51 @@
+from typing import AsyncIterator, Dict, Iterator, List
+
+from apps.todo.application.interfaces.task_repository import ITaskRepository
+from apps.todo.application.interfaces.category_repository import ICategoryRepository
+from apps.todo.application.dto.task_dto import TaskDTO
+from apps.todo.domain.entities.category import Category
+from apps.todo.domain.entities.task import Task
+
+
+class ExportTasksUseCase:
+    """Use case for streaming all tasks of a user, oldest first."""
+
+    def __init__(
+        self,
+        task_repository: ITaskRepository,
+        category_repository: ICategoryRepository
+    ):
+        self.task_repository = task_repository
+        self.category_repository = category_repository
+
+    def execute(self, user_id: int) -> Iterator[TaskDTO]:
+        """Yield task DTOs one by one; nothing is collected in memory."""
+        category_names = self._category_names(self.category_repository.get_all())
+        for task in self.task_repository.iter_by_user_id(user_id):
+            yield self._to_dto(task, category_names)
+
+    async def aexecute(self, user_id: int) -> AsyncIterator[TaskDTO]:
+        """Execute the use case with the async repository variants."""
+        category_names = self._category_names(await self.category_repository.aget_all())
+        async for task in self.task_repository.aiter_by_user_id(user_id):
+            yield self._to_dto(task, category_names)
+
+    @staticmethod
+    def _category_names(categories: List[Category]) -> Dict[str, str]:
+        return {c.id: c.name for c in categories}
+
+    @staticmethod
+    def _to_dto(task: Task, category_names: Dict[str, str]) -> TaskDTO:
+        return TaskDTO(
+            id=task.id,
+            title=task.title,
+            description=task.description,
+            user_id=task.user_id,
+            category_id=task.category_id,
+            category_name=category_names.get(task.category_id) if task.category_id else None,
+            due_date=task.due_date,
+            is_completed=task.is_completed,
+            created_at=task.created_at,
+            updated_at=task.updated_at,
+            reminder_version=task.reminder_version
+        )
@@ -1,8 +1,12 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import Dict, List, Optional
 
 from apps.todo.application.interfaces.task_repository import ITaskRepository
 from apps.todo.application.interfaces.category_repository import ICategoryRepository
-from apps.todo.application.dto.task_dto import TaskDTO
+from apps.todo.application.interfaces.task_list_cache import ITaskListCache
+from apps.todo.application.dto.task_dto import TaskDTO, TaskPageDTO
+from apps.todo.domain.entities.task import Task
+from apps.todo.domain.value_objects.task_status import TaskStatus
 
 
 class ListTasksUseCase:
@@ -11,25 +15,141 @@ class ListTasksUseCase:
     def __init__(
         self,
         task_repository: ITaskRepository,
-        category_repository: ICategoryRepository
+        category_repository: ICategoryRepository,
+        task_list_cache: Optional[ITaskListCache] = None
     ):
         self.task_repository = task_repository
         self.category_repository = category_repository
+        self.task_list_cache = task_list_cache
 
-    def execute(self, user_id: int, category_id: Optional[str] = None) -> List[TaskDTO]:
+    def execute(
+        self,
+        user_id: int,
+        category_id: Optional[str] = None,
+        after: Optional[str] = None,
+        limit: int = 20,
+        status: Optional[TaskStatus] = None,
+        due_before: Optional[datetime] = None,
+        due_after: Optional[datetime] = None
+    ) -> TaskPageDTO:
         """Execute the use case."""
-        if category_id:
-            tasks = self.task_repository.get_by_category(category_id)
-            tasks = [t for t in tasks if t.user_id == user_id]
-        else:
-            tasks = self.task_repository.get_by_user_id(user_id)
+        filters = (category_id, status, due_before, due_after)
+        if not self._cacheable(status):
+            return self._load(user_id, after, limit, *filters)
+
+        return self.task_list_cache.get_or_load(
+            user_id,
+            self._cache_key(after, limit, *filters),
+            lambda: self._load(user_id, after, limit, *filters)
+        )
+
+    async def aexecute(
+        self,
+        user_id: int,
+        category_id: Optional[str] = None,
+        after: Optional[str] = None,
+        limit: int = 20,
+        status: Optional[TaskStatus] = None,
+        due_before: Optional[datetime] = None,
+        due_after: Optional[datetime] = None
+    ) -> TaskPageDTO:
+        """Execute the use case with the async repository variants."""
+        filters = (category_id, status, due_before, due_after)
+        if not self._cacheable(status):
+            return await self._aload(user_id, after, limit, *filters)
+
+        return await self.task_list_cache.aget_or_load(
+            user_id,
+            self._cache_key(after, limit, *filters),
+            lambda: self._aload(user_id, after, limit, *filters)
+        )
+
+    def _cacheable(self, status: Optional[TaskStatus]) -> bool:
+        """Overdue pages change with the clock, not with writes, so they are never cached."""
+        return self.task_list_cache is not None and status != TaskStatus.OVERDUE
+
+    @staticmethod
+    def _cache_key(
+        after: Optional[str],
+        limit: int,
+        category_id: Optional[str],
+        status: Optional[TaskStatus],
+        due_before: Optional[datetime],
+        due_after: Optional[datetime]
+    ) -> str:
+        return ":".join((
+            category_id or "",
+            status.value if status else "",
+            due_before.isoformat() if due_before else "",
+            due_after.isoformat() if due_after else "",
+            after or "",
+            str(limit)
+        ))
+
+    def _load(
+        self,
+        user_id: int,
+        after: Optional[str],
+        limit: int,
+        category_id: Optional[str],
+        status: Optional[TaskStatus],
+        due_before: Optional[datetime],
+        due_after: Optional[datetime]
+    ) -> TaskPageDTO:
+        """Load a page from the repositories."""
+        # Fetch one extra row to know whether there is a next page
+        tasks = self.task_repository.get_page_by_user_id(
+            user_id,
+            after=after,
+            limit=limit + 1,
+            category_id=category_id,
+            status=status,
+            due_before=due_before,
+            due_after=due_after
+        )
+
+        categories = self.category_repository.get_many(
+            [t.category_id for t in tasks[:limit] if t.category_id]
+        )
+        return self._to_page(tasks, limit, {c.id: c.name for c in categories})
+
+    async def _aload(
+        self,
+        user_id: int,
+        after: Optional[str],
+        limit: int,
+        category_id: Optional[str],
+        status: Optional[TaskStatus],
+        due_before: Optional[datetime],
+        due_after: Optional[datetime]
+    ) -> TaskPageDTO:
+        """Load a page from the repositories without blocking the event loop."""
+        tasks = await self.task_repository.aget_page_by_user_id(
+            user_id,
+            after=after,
+            limit=limit + 1,
+            category_id=category_id,
+            status=status,
+            due_before=due_before,
+            due_after=due_after
+        )
+
+        categories = await self.category_repository.aget_many(
+            [t.category_id for t in tasks[:limit] if t.category_id]
+        )
+        return self._to_page(tasks, limit, {c.id: c.name for c in categories})
+
+    @staticmethod
+    def _to_page(tasks: List[Task], limit: int, category_names: Dict[str, str]) -> TaskPageDTO:
+        """Build the page DTO; a row beyond limit means there is a next page."""
+        next_cursor = None
+        if len(tasks) > limit:
+            tasks = tasks[:limit]
+            next_cursor = tasks[-1].id
 
         result = []
         for task in tasks:
-            category_name = None
-            if task.category_id:
-                category = self.category_repository.get_by_id(task.category_id)
-                category_name = category.name if category else None
+            category_name = category_names.get(task.category_id) if task.category_id else None
 
             result.append(TaskDTO(
                 id=task.id,
@@ -41,7 +161,8 @@ class ListTasksUseCase:
                 due_date=task.due_date,
                 is_completed=task.is_completed,
                 created_at=task.created_at,
-                updated_at=task.updated_at
+                updated_at=task.updated_at,
+                reminder_version=task.reminder_version
             ))
 
-        return result
+        return TaskPageDTO(items=result, next_cursor=next_cursor)
@@ -0,0 +1,54 @@
+from typing import Dict, List
+
+from apps.todo.application.interfaces.task_repository import ITaskRepository
+from apps.todo.application.interfaces.category_repository import ICategoryRepository
+from apps.todo.application.dto.task_dto import TaskDTO
+from apps.todo.domain.entities.task import Task
+
+
+class SearchTasksUseCase:
+    """Use case for full-text search over a user's tasks."""
+
+    def __init__(
+        self,
+        task_repository: ITaskRepository,
+        category_repository: ICategoryRepository
+    ):
+        self.task_repository = task_repository
+        self.category_repository = category_repository
+
+    def execute(self, user_id: int, query: str, limit: int = 20) -> List[TaskDTO]:
+        """Execute the use case."""
+        tasks = self.task_repository.search(user_id, query, limit)
+        categories = self.category_repository.get_many(
+            [t.category_id for t in tasks if t.category_id]
+        )
+        return self._to_dtos(tasks, {c.id: c.name for c in categories})
+
+    async def aexecute(self, user_id: int, query: str, limit: int = 20) -> List[TaskDTO]:
+        """Execute the use case with the async repository variants."""
+        tasks = await self.task_repository.asearch(user_id, query, limit)
+        categories = await self.category_repository.aget_many(
+            [t.category_id for t in tasks if t.category_id]
+        )
+        return self._to_dtos(tasks, {c.id: c.name for c in categories})
+
+    @staticmethod
+    def _to_dtos(tasks: List[Task], category_names: Dict[str, str]) -> List[TaskDTO]:
+        """Build DTOs in ranking order."""
+        return [
+            TaskDTO(
+                id=task.id,
+                title=task.title,
+                description=task.description,
+                user_id=task.user_id,
+                category_id=task.category_id,
+                category_name=category_names.get(task.category_id) if task.category_id else None,
+                due_date=task.due_date,
+                is_completed=task.is_completed,
+                created_at=task.created_at,
+                updated_at=task.updated_at,
+                reminder_version=task.reminder_version
+            )
+            for task in tasks
+        ]
@@ -1,8 +1,11 @@
 from datetime import datetime
+from typing import Optional
 
 from apps.todo.application.interfaces.task_repository import ITaskRepository
 from apps.todo.application.interfaces.category_repository import ICategoryRepository
+from apps.todo.application.interfaces.task_list_cache import ITaskListCache
 from apps.todo.application.dto.task_dto import UpdateTaskDTO, TaskDTO
+from apps.todo.domain.entities.task import Task
 from apps.todo.domain.exceptions.exceptions import (
     TaskNotFoundException,
     CategoryNotFoundException,
@@ -16,10 +19,12 @@ class UpdateTaskUseCase:
     def __init__(
         self,
         task_repository: ITaskRepository,
-        category_repository: ICategoryRepository
+        category_repository: ICategoryRepository,
+        task_list_cache: Optional[ITaskListCache] = None
     ):
         self.task_repository = task_repository
         self.category_repository = category_repository
+        self.task_list_cache = task_list_cache
 
     def execute(self, dto: UpdateTaskDTO, user_id: int) -> TaskDTO:
         """Execute the use case."""
@@ -35,6 +40,44 @@ class UpdateTaskUseCase:
             if not category:
                 raise CategoryNotFoundException(dto.category_id)
 
+        updated_task = self.task_repository.update(self._apply(task, dto))
+        if self.task_list_cache:
+            self.task_list_cache.invalidate(updated_task.user_id)
+
+        category_name = None
+        if updated_task.category_id:
+            category = self.category_repository.get_by_id(updated_task.category_id)
+            category_name = category.name if category else None
+
+        return self._to_dto(updated_task, category_name)
+
+    async def aexecute(self, dto: UpdateTaskDTO, user_id: int) -> TaskDTO:
+        """Execute the use case with the async repository variants."""
+        task = await self.task_repository.aget_by_id(dto.task_id)
+        if not task:
+            raise TaskNotFoundException(dto.task_id)
+
+        if task.user_id != user_id:
+            raise UnauthorizedAccessException("You can only update your own tasks")
+
+        if dto.category_id:
+            category = await self.category_repository.aget_by_id(dto.category_id)
+            if not category:
+                raise CategoryNotFoundException(dto.category_id)
+
+        updated_task = await self.task_repository.aupdate(self._apply(task, dto))
+        if self.task_list_cache:
+            await self.task_list_cache.ainvalidate(updated_task.user_id)
+
+        category_name = None
+        if updated_task.category_id:
+            category = await self.category_repository.aget_by_id(updated_task.category_id)
+            category_name = category.name if category else None
+
+        return self._to_dto(updated_task, category_name)
+
+    @staticmethod
+    def _apply(task: Task, dto: UpdateTaskDTO) -> Task:
         if dto.title is not None:
             task.title = dto.title
         if dto.description is not None:
@@ -47,14 +90,10 @@ class UpdateTaskUseCase:
             task.is_completed = dto.is_completed
 
         task.updated_at = datetime.now()
+        return task
 
-        updated_task = self.task_repository.update(task)
-
-        category_name = None
-        if updated_task.category_id:
-            category = self.category_repository.get_by_id(updated_task.category_id)
-            category_name = category.name if category else None
-
+    @staticmethod
+    def _to_dto(updated_task: Task, category_name: Optional[str]) -> TaskDTO:
         return TaskDTO(
             id=updated_task.id,
             title=updated_task.title,
@@ -65,5 +104,6 @@ class UpdateTaskUseCase:
             due_date=updated_task.due_date,
             is_completed=updated_task.is_completed,
             created_at=updated_task.created_at,
-            updated_at=updated_task.updated_at
+            updated_at=updated_task.updated_at,
+            reminder_version=updated_task.reminder_version
         )
@@ -16,6 +16,7 @@ class Task:
     is_completed: bool
     created_at: datetime
     updated_at: datetime
+    reminder_version: int = 0
 
     def mark_as_completed(self) -> None:
         """Mark task as completed."""
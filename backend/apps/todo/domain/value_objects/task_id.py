@@ -1,3 +1,8 @@
+import secrets
+import time
+from datetime import datetime
+from typing import List
+
 from ulid import ULID
 
 
@@ -9,6 +14,22 @@ class ULIDGenerator:
         """Generate a new ULID string."""
         return str(ULID())
 
+    @staticmethod
+    def generate_many(count: int) -> List[str]:
+        """
+        Generate count ULIDs in one go: a shared timestamp and consecutive
+        randomness, so the ids are unique and sorted in generation order.
+        """
+        timestamp = int(time.time() * 1000)
+        # 79 random bits leave room to increment without overflowing 80 bits
+        base = (timestamp << 80) | secrets.randbits(79)
+        return [str(ULID.from_int(base + i)) for i in range(count)]
+
+    @staticmethod
+    def lower_bound(moment: datetime) -> str:
+        """Smallest ULID with the moment's timestamp: ids >= it were generated at or after it."""
+        return str(ULID.from_int(int(moment.timestamp() * 1000) << 80))
+
     @staticmethod
     def is_valid(ulid_str: str) -> bool:
         """Validate ULID string format."""
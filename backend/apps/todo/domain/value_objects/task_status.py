@@ -0,0 +1,10 @@
+from enum import Enum
+
+
+class TaskStatus(str, Enum):
+    """Status a task list can be filtered by."""
+
+    OPEN = "open"
+    COMPLETED = "completed"
+    # Open with the due date already passed; depends on the current time
+    OVERDUE = "overdue"
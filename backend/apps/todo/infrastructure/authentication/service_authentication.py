@@ -0,0 +1,131 @@
+import hashlib
+import hmac
+import re
+import threading
+import time
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from rest_framework import authentication, exceptions
+
+NONCE_RE = re.compile(r"^[A-Za-z0-9_-]{16,64}$")
+NONCE_CACHE_KEY = "service_auth:nonce:{nonce}"
+
+
+def sign_request(
+    secret: str,
+    method: str,
+    path: str,
+    timestamp: str,
+    nonce: str,
+    username: str,
+    telegram_user_id: str,
+    body: bytes
+) -> str:
+    """
+    Подпись запроса: HMAC-SHA256 от метода, пути с query string, времени,
+    одноразового nonce, пользователя, X-Telegram-User-Id и хеша тела.
+    """
+    message = "\n".join([
+        method.upper(),
+        path,
+        timestamp,
+        nonce,
+        username,
+        telegram_user_id or "",
+        hashlib.sha256(body or b"").hexdigest(),
+    ])
+    return hmac.new(secret.encode(), message.encode(), hashlib.sha256).hexdigest()
+
+
+class ServiceSignatureAuthentication(authentication.BaseAuthentication):
+    """
+    Сервисная аутентификация бота по HMAC-подписи запроса.
+
+    Заголовок: Authorization: Service <username>:<timestamp>:<nonce>:<signature>
+
+    X-Telegram-User-Id входит в подпись, так что перехваченный запрос
+    нельзя переслать с чужим telegram id. Каждый nonce принимается один раз:
+    он запоминается в кеше (Redis) на время, пока подпись не истекла,
+    повтор отклоняется. Без кеша подписанные запросы не принимаются.
+
+    В отличие от BasicAuthentication не считает PBKDF2 на каждый запрос:
+    проверка подписи стоит микросекунды, а найденный пользователь
+    кешируется в процессе на SERVICE_AUTH_USER_CACHE_TTL секунд.
+    """
+
+    keyword = "Service"
+
+    _user_cache = {}
+    _lock = threading.Lock()
+
+    def authenticate(self, request):
+        secret = getattr(settings, "SERVICE_AUTH_SECRET", "")
+        header = authentication.get_authorization_header(request).split()
+        if not secret or not header or header[0].lower() != self.keyword.lower().encode():
+            return None
+
+        if len(header) != 2:
+            raise exceptions.AuthenticationFailed("Invalid service auth header.")
+
+        try:
+            username, timestamp, nonce, signature = header[1].decode().rsplit(":", 3)
+            issued_at = int(timestamp)
+        except (UnicodeError, ValueError):
+            raise exceptions.AuthenticationFailed("Invalid service auth header.")
+        if not NONCE_RE.match(nonce):
+            raise exceptions.AuthenticationFailed("Invalid service auth header.")
+
+        max_skew = settings.SERVICE_AUTH_MAX_SKEW
+        now = time.time()
+        if abs(now - issued_at) > max_skew:
+            raise exceptions.AuthenticationFailed("Service signature expired.")
+
+        expected = sign_request(
+            secret,
+            request.method,
+            request._request.get_full_path(),
+            timestamp,
+            nonce,
+            username,
+            request._request.headers.get("X-Telegram-User-Id", ""),
+            request._request.body,
+        )
+        if not hmac.compare_digest(expected, signature):
+            raise exceptions.AuthenticationFailed("Invalid service signature.")
+
+        # Помним nonce, пока подпись ещё может пройти проверку времени
+        self._use_nonce(nonce, int(issued_at + max_skew - now) + 1)
+
+        return (self._get_user(username), None)
+
+    def authenticate_header(self, request):
+        return self.keyword
+
+    @staticmethod
+    def _use_nonce(nonce: str, ttl: int) -> None:
+        """Отметить nonce использованным; повтор или недоступный кеш — отказ."""
+        try:
+            added = cache.add(NONCE_CACHE_KEY.format(nonce=nonce), 1, ttl)
+        except Exception:
+            raise exceptions.AuthenticationFailed("Service auth replay cache unavailable.")
+        if not added:
+            raise exceptions.AuthenticationFailed("Service request already used.")
+
+    def _get_user(self, username: str) -> User:
+        """Пользователь из кеша процесса или из БД (один раз за TTL)."""
+        now = time.monotonic()
+        with self._lock:
+            cached = self._user_cache.get(username)
+        if cached and cached[1] > now:
+            return cached[0]
+
+        try:
+            user = User.objects.get(username=username, is_active=True)
+        except User.DoesNotExist:
+            raise exceptions.AuthenticationFailed("User inactive or deleted.")
+
+        with self._lock:
+            self._user_cache[username] = (user, now + settings.SERVICE_AUTH_USER_CACHE_TTL)
+        return user
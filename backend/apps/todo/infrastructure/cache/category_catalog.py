@@ -0,0 +1,182 @@
+import copy
+import os
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+import redis
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import transaction
+
+from apps.todo.application.interfaces.category_repository import ICategoryRepository
+from apps.todo.domain.entities.category import Category as CategoryEntity
+from apps.todo.infrastructure.persistence.repositories.category_repository_impl import CategoryRepository
+
+
+class CategoryCatalog:
+    """
+    In-process snapshot of all categories.
+
+    The snapshot lives for CATEGORY_CATALOG_TTL seconds. Writes publish to a
+    Redis channel and every gunicorn/Celery process drops its snapshot on the
+    message; the TTL bounds staleness if a message is missed.
+    """
+
+    CHANNEL = "categories:invalidate"
+
+    def __init__(self, loader: Callable[[], List[CategoryEntity]]):
+        self._loader = loader
+        self._by_id: Optional[Dict[str, CategoryEntity]] = None
+        self._expires_at = 0.0
+        self._lock = threading.Lock()
+        self._listener_pid = None
+        self._listener_retry_at = 0.0
+        self._redis = None
+
+    def all(self) -> List[CategoryEntity]:
+        """All categories, copied so callers may mutate them."""
+        return [copy.copy(c) for c in self._snapshot().values()]
+
+    def get(self, category_id: str) -> Optional[CategoryEntity]:
+        category = self._snapshot().get(category_id)
+        return copy.copy(category) if category else None
+
+    def get_many(self, category_ids: List[str]) -> List[CategoryEntity]:
+        snapshot = self._snapshot()
+        return [copy.copy(snapshot[i]) for i in set(category_ids) if i in snapshot]
+
+    async def aall(self) -> List[CategoryEntity]:
+        return [copy.copy(c) for c in (await self._asnapshot()).values()]
+
+    async def aget(self, category_id: str) -> Optional[CategoryEntity]:
+        category = (await self._asnapshot()).get(category_id)
+        return copy.copy(category) if category else None
+
+    async def aget_many(self, category_ids: List[str]) -> List[CategoryEntity]:
+        snapshot = await self._asnapshot()
+        return [copy.copy(snapshot[i]) for i in set(category_ids) if i in snapshot]
+
+    def invalidate(self) -> None:
+        """Drop the local snapshot and tell the other processes, once the write commits."""
+        self._clear()
+        transaction.on_commit(self._publish)
+
+    def _publish(self) -> None:
+        self._clear()
+        if not settings.CATEGORY_CATALOG_PUBSUB:
+            return
+        try:
+            self._get_redis().publish(self.CHANNEL, "1")
+        except Exception as e:
+            print(f"[categories] Ошибка публикации инвалидации: {e}")
+
+    def _snapshot(self) -> Dict[str, CategoryEntity]:
+        self._ensure_listener()
+        by_id = self._by_id
+        if by_id is not None and self._expires_at > time.monotonic():
+            return by_id
+
+        with self._lock:
+            if self._by_id is None or self._expires_at <= time.monotonic():
+                self._by_id = {c.id: c for c in self._loader()}
+                self._expires_at = time.monotonic() + settings.CATEGORY_CATALOG_TTL
+            return self._by_id
+
+    async def _asnapshot(self) -> Dict[str, CategoryEntity]:
+        """Fresh snapshot without leaving the event loop; reload and subscribe in a thread."""
+        by_id = self._by_id
+        if by_id is not None and self._expires_at > time.monotonic() and not self._needs_listener():
+            return by_id
+        return await sync_to_async(self._snapshot)()
+
+    def _clear(self) -> None:
+        with self._lock:
+            self._by_id = None
+            self._expires_at = 0.0
+
+    def _get_redis(self):
+        if self._redis is None:
+            self._redis = redis.Redis.from_url(
+                settings.CATEGORY_CATALOG_REDIS_URL,
+                socket_connect_timeout=1
+            )
+        return self._redis
+
+    def _needs_listener(self) -> bool:
+        return (
+            settings.CATEGORY_CATALOG_PUBSUB
+            and self._listener_pid != os.getpid()
+            and self._listener_retry_at <= time.monotonic()
+        )
+
+    def _ensure_listener(self) -> None:
+        """Subscribe once per process (after fork for gunicorn/Celery workers)."""
+        if not self._needs_listener():
+            return
+        with self._lock:
+            if self._listener_pid == os.getpid():
+                return
+            try:
+                self._redis = None
+                pubsub = self._get_redis().pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(**{self.CHANNEL: lambda message: self._clear()})
+                pubsub.run_in_thread(sleep_time=1.0, daemon=True)
+                self._listener_pid = os.getpid()
+            except Exception as e:
+                # Без подписки снимок всё равно устареет по TTL; попробуем снова позже
+                self._listener_retry_at = time.monotonic() + settings.CATEGORY_CATALOG_TTL
+                print(f"[categories] Ошибка подписки на инвалидацию: {e}")
+
+
+category_catalog = CategoryCatalog(CategoryRepository().get_all)
+
+
+class CachedCategoryRepository(ICategoryRepository):
+    """Category repository that reads from the in-process catalog."""
+
+    def __init__(self, repository: Optional[ICategoryRepository] = None, catalog: CategoryCatalog = category_catalog):
+        self.repository = repository or CategoryRepository()
+        self.catalog = catalog
+
+    def create(self, category: CategoryEntity) -> CategoryEntity:
+        """Create a new category."""
+        created = self.repository.create(category)
+        self.catalog.invalidate()
+        return created
+
+    def get_by_id(self, category_id: str) -> Optional[CategoryEntity]:
+        """Get category by ID."""
+        return self.catalog.get(category_id)
+
+    def get_many(self, category_ids: List[str]) -> List[CategoryEntity]:
+        """Get categories by a list of IDs in a single lookup."""
+        return self.catalog.get_many(category_ids)
+
+    def get_all(self) -> List[CategoryEntity]:
+        """Get all categories."""
+        return self.catalog.all()
+
+    async def aget_by_id(self, category_id: str) -> Optional[CategoryEntity]:
+        """Get category by ID."""
+        return await self.catalog.aget(category_id)
+
+    async def aget_many(self, category_ids: List[str]) -> List[CategoryEntity]:
+        """Get categories by a list of IDs in a single lookup."""
+        return await self.catalog.aget_many(category_ids)
+
+    async def aget_all(self) -> List[CategoryEntity]:
+        """Get all categories."""
+        return await self.catalog.aall()
+
+    def update(self, category: CategoryEntity) -> CategoryEntity:
+        """Update a category."""
+        updated = self.repository.update(category)
+        self.catalog.invalidate()
+        return updated
+
+    def delete(self, category_id: str) -> bool:
+        """Delete a category."""
+        deleted = self.repository.delete(category_id)
+        self.catalog.invalidate()
+        return deleted
@@ -0,0 +1,168 @@
+import asyncio
+import time
+from typing import Awaitable, Callable, Optional
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from apps.todo.application.dto.task_dto import TaskPageDTO
+from apps.todo.application.interfaces.task_list_cache import ITaskListCache
+
+
+class TaskListCache(ITaskListCache):
+    """
+    Read-through task list cache in Django CACHES (Redis).
+
+    Pages are keyed by a per-user version counter and a global one, so
+    invalidation is a single INCR and stale pages simply expire. Concurrent
+    misses for the same page are coalesced with a short-lived lock key.
+    """
+
+    USER_VERSION_KEY = "tasks:version:{user_id}"
+    GLOBAL_VERSION_KEY = "tasks:version:global"
+    PAGE_KEY = "tasks:list:{user_id}:{version}:{global_version}:{key}"
+
+    def _versions(self, user_id: int):
+        """Current (user, global) versions, initialised on first use."""
+        user_key = self.USER_VERSION_KEY.format(user_id=user_id)
+        versions = cache.get_many([user_key, self.GLOBAL_VERSION_KEY])
+        for key in (user_key, self.GLOBAL_VERSION_KEY):
+            if key not in versions:
+                # Start from a fresh value so an evicted counter never revives old pages
+                cache.add(key, time.time_ns(), None)
+                versions[key] = cache.get(key)
+        return versions[user_key], versions[self.GLOBAL_VERSION_KEY]
+
+    async def _aversions(self, user_id: int):
+        """Async variant of _versions."""
+        user_key = self.USER_VERSION_KEY.format(user_id=user_id)
+        versions = await cache.aget_many([user_key, self.GLOBAL_VERSION_KEY])
+        for key in (user_key, self.GLOBAL_VERSION_KEY):
+            if key not in versions:
+                await cache.aadd(key, time.time_ns(), None)
+                versions[key] = await cache.aget(key)
+        return versions[user_key], versions[self.GLOBAL_VERSION_KEY]
+
+    def get_version_tag(self, user_id: int) -> Optional[str]:
+        """Tag that changes with every invalidation of the user's lists; None if Redis is unavailable."""
+        try:
+            return "%s:%s" % self._versions(user_id)
+        except Exception:
+            return None
+
+    async def aget_version_tag(self, user_id: int) -> Optional[str]:
+        """Async variant of get_version_tag."""
+        try:
+            return "%s:%s" % await self._aversions(user_id)
+        except Exception:
+            return None
+
+    def get_or_load(self, user_id: int, key: str, loader: Callable[[], TaskPageDTO]) -> TaskPageDTO:
+        """Return a cached page or load it once, even under concurrent misses."""
+        try:
+            version, global_version = self._versions(user_id)
+            page_key = self.PAGE_KEY.format(
+                user_id=user_id,
+                version=version,
+                global_version=global_version,
+                key=key
+            )
+            page = cache.get(page_key)
+            if page is not None:
+                return page
+            lock_key = f"{page_key}:lock"
+            is_loader = cache.add(lock_key, 1, settings.TASK_LIST_CACHE_LOCK_TIMEOUT)
+        except Exception:
+            # Redis недоступен — отдаём данные напрямую из БД
+            return loader()
+
+        if is_loader:
+            try:
+                page = loader()
+                cache.set(page_key, page, settings.TASK_LIST_CACHE_TTL)
+                return page
+            finally:
+                cache.delete(lock_key)
+
+        deadline = time.monotonic() + settings.TASK_LIST_CACHE_LOCK_WAIT
+        while time.monotonic() < deadline:
+            time.sleep(0.05)
+            page = cache.get(page_key)
+            if page is not None:
+                return page
+
+        return loader()
+
+    async def aget_or_load(
+        self,
+        user_id: int,
+        key: str,
+        loader: Callable[[], Awaitable[TaskPageDTO]]
+    ) -> TaskPageDTO:
+        """Async variant of get_or_load: waiting for another loader does not block the event loop."""
+        try:
+            version, global_version = await self._aversions(user_id)
+            page_key = self.PAGE_KEY.format(
+                user_id=user_id,
+                version=version,
+                global_version=global_version,
+                key=key
+            )
+            page = await cache.aget(page_key)
+            if page is not None:
+                return page
+            lock_key = f"{page_key}:lock"
+            is_loader = await cache.aadd(lock_key, 1, settings.TASK_LIST_CACHE_LOCK_TIMEOUT)
+        except Exception:
+            # Redis недоступен — отдаём данные напрямую из БД
+            return await loader()
+
+        if is_loader:
+            try:
+                page = await loader()
+                await cache.aset(page_key, page, settings.TASK_LIST_CACHE_TTL)
+                return page
+            finally:
+                await cache.adelete(lock_key)
+
+        deadline = time.monotonic() + settings.TASK_LIST_CACHE_LOCK_WAIT
+        while time.monotonic() < deadline:
+            await asyncio.sleep(0.05)
+            page = await cache.aget(page_key)
+            if page is not None:
+                return page
+
+        return await loader()
+
+    def invalidate(self, user_id: int) -> None:
+        """Invalidate all cached lists of a user once the current transaction commits."""
+        self._bump(self.USER_VERSION_KEY.format(user_id=user_id))
+
+    async def ainvalidate(self, user_id: int) -> None:
+        """Async variant of invalidate: the bump is deferred to commit the same way."""
+        # on_commit привязан к соединению потока, где открыта транзакция ORM
+        await sync_to_async(self.invalidate)(user_id)
+
+    def invalidate_all(self) -> None:
+        """Invalidate cached lists of all users (e.g. after a category rename) once the current transaction commits."""
+        self._bump(self.GLOBAL_VERSION_KEY)
+
+    def _bump(self, key: str) -> None:
+        # Только после COMMIT: иначе параллельный GET между INCR и COMMIT прочитает
+        # старые строки и закеширует их под новой версией до истечения TTL.
+        # Вне транзакции on_commit выполняется сразу
+        transaction.on_commit(lambda: self._incr(key))
+
+    def _incr(self, key: str) -> None:
+        try:
+            try:
+                cache.incr(key)
+            except ValueError:
+                # Счётчик вытеснен: стартуем со свежего значения. Если его уже создал
+                # параллельный bump, add ничего не перезапишет — тогда просто INCR
+                if not cache.add(key, time.time_ns(), None):
+                    cache.incr(key)
+        except Exception as e:
+            print(f"[cache] Ошибка инвалидации {key}: {e}")
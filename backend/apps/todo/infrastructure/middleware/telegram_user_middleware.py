@@ -1,26 +1,104 @@
+import threading
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.core.cache import cache
+from django.utils.functional import LazyObject
+
+PROFILE_CACHE_KEY = "tg_profile:{user_id}"
+PROFILE_CACHE_TTL = 60 * 60 * 24
+LOCAL_CACHE_TTL = 60
+LOCAL_CACHE_MAX_SIZE = 10_000
 
 
 class TelegramUserMiddleware:
     """
     Читает заголовок X-Telegram-User-Id и сохраняет telegram_id
     в профиле текущего пользователя.
+
+    Известные пары (user_id, telegram_id) кешируются в процессе (коротко,
+    чтобы замечать смену связки в других воркерах) и в Redis, поэтому
+    в БД пишем только новую или изменившуюся связку.
+
+    Поддерживает sync и async: под ASGI известная связка проверяется
+    прямо в event loop, в поток уходим только за Redis/БД.
     """
 
+    sync_capable = True
+    async_capable = True
+
     def __init__(self, get_response):
         self.get_response = get_response
+        self._known = {}
+        self._lock = threading.Lock()
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
 
     def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
         response = self.get_response(request)
+        self._process(request)
+        return response
+
+    async def __acall__(self, request):
+        response = await self.get_response(request)
 
+        telegram_id = request.headers.get("X-Telegram-User-Id")
+        if telegram_id and self._needs_update(request, telegram_id):
+            await sync_to_async(self._process)(request)
+
+        return response
+
+    def _process(self, request) -> None:
         telegram_id = request.headers.get("X-Telegram-User-Id")
         if telegram_id and request.user.is_authenticated:
             try:
-                from apps.todo.infrastructure.persistence.models import UserProfile
+                self._remember(request.user, int(telegram_id))
+            except (ValueError, Exception):
+                pass
+
+    def _needs_update(self, request, telegram_id: str) -> bool:
+        """False, если связка уже есть в локальном кеше и в поток идти незачем."""
+        user = request.user
+        if isinstance(user, LazyObject):
+            # Пользователь ещё не загружен (не DRF-вью) — разберёмся в потоке
+            return True
+        if not user.is_authenticated:
+            return False
+        known = self._known.get(user.id)
+        return not (known and str(known[0]) == telegram_id and known[1] > time.monotonic())
+
+    def _remember(self, user, telegram_id: int) -> None:
+        """Записать telegram_id в профиль, только если связка новая или изменилась."""
+        now = time.monotonic()
+        known = self._known.get(user.id)
+        if known and known[0] == telegram_id and known[1] > now:
+            return
+
+        key = PROFILE_CACHE_KEY.format(user_id=user.id)
+        try:
+            cached = cache.get(key)
+        except Exception:
+            cached = None
+
+        if cached != telegram_id:
+            from apps.todo.infrastructure.persistence.models import UserProfile
+            stored = UserProfile.objects.filter(user=user).values_list(
+                "telegram_id", flat=True
+            ).first()
+            if stored != telegram_id:
                 UserProfile.objects.update_or_create(
-                    user=request.user,
-                    defaults={"telegram_id": int(telegram_id)},
+                    user=user,
+                    defaults={"telegram_id": telegram_id},
                 )
-            except (ValueError, Exception):
+            try:
+                cache.set(key, telegram_id, PROFILE_CACHE_TTL)
+            except Exception:
                 pass
 
-        return response
+        with self._lock:
+            if len(self._known) >= LOCAL_CACHE_MAX_SIZE:
+                self._known.clear()
+            self._known[user.id] = (telegram_id, now + LOCAL_CACHE_TTL)
@@ -1,8 +1,13 @@
 from django.db import models
 from django.contrib.auth.models import User
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 
 from apps.todo.domain.value_objects.task_id import ULIDGenerator
 
+# Конфигурация полнотекстового поиска: russian стеммит кириллицу, а латиницу — english_stem
+SEARCH_CONFIG = "russian"
+
 
 class Category(models.Model):
     """Category model."""
@@ -43,8 +48,18 @@ class Task(models.Model):
         related_name="tasks"
     )
     due_date = models.DateTimeField(null=True, blank=True)
-    celery_task_id = models.CharField(max_length=64, null=True, blank=True)
+    # Версия расписания напоминания: растёт при смене срока или статуса; напоминание
+    # в Redis несёт версию, с которой было поставлено, и устаревшее просто отбрасывается
+    reminder_version = models.PositiveIntegerField(default=0, editable=False)
+    # Версия, о которой уже уведомили: notify_task_due захватывает её один раз,
+    # поэтому поллер и sweep_missed_reminders не шлют одно напоминание дважды
+    notified_version = models.PositiveIntegerField(null=True, editable=False)
+    # Захват на время отправки; после отправки сбрасывается. Захват старше
+    # REMINDER_CLAIM_TIMEOUT — воркер упал посреди отправки, sweep поставит её заново
+    reminder_claimed_at = models.DateTimeField(null=True, editable=False)
     is_completed = models.BooleanField(default=False)
+    # Заполняется триггером БД из title (вес A) и description (вес B) — при любой записи, включая COPY
+    search_vector = SearchVectorField(null=True, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -53,9 +68,39 @@ class Task(models.Model):
         ordering = ["-created_at"]
         indexes = [
             models.Index(fields=["user", "-created_at"]),
+            # ULID is time-ordered: keyset pagination walks (user, -id)
+            models.Index(fields=["user", "-id"]),
+            models.Index(fields=["user", "category", "-id"]),
             models.Index(fields=["category"]),
+            # Зависшие захваты напоминаний: строк с отправкой «в процессе» единицы
+            models.Index(
+                fields=["reminder_claimed_at"],
+                name="tasks_reminder_claim_idx",
+                condition=models.Q(reminder_claimed_at__isnull=False),
+            ),
+            # Фильтр по сроку в админке идёт по всем задачам, включая выполненные
             models.Index(fields=["due_date"]),
-            models.Index(fields=["is_completed"]),
+            # Просроченные открытые задачи: keyset-обход sweep_missed_reminders по (due_date, id)
+            models.Index(
+                fields=["due_date", "id"],
+                name="tasks_open_due_id_idx",
+                condition=models.Q(is_completed=False),
+            ),
+            # Фильтры статуса: частичные индексы только по открытым задачам — обычно
+            # их малая доля. status=completed идёт по (user, -id) с фильтром: выполненных большинство
+            models.Index(
+                fields=["user", "-id"],
+                name="tasks_user_open_idx",
+                condition=models.Q(is_completed=False),
+            ),
+            # status=overdue и due_before/due_after по открытым — диапазон по сроку
+            models.Index(
+                fields=["user", "due_date"],
+                name="tasks_user_open_due_idx",
+                condition=models.Q(is_completed=False),
+            ),
+            # btree_gin: фильтр по пользователю и @@ — одним проходом по индексу
+            GinIndex(fields=["user", "search_vector"], name="tasks_user_search_gin"),
         ]
 
     def save(self, *args, **kwargs):
@@ -67,6 +112,27 @@ class Task(models.Model):
         return self.title
 
 
+class ReminderOutboxEntry(models.Model):
+    """
+    Outbox напоминаний: пишется в той же транзакции, что и задача, и переносится
+    в Redis ZSET задачей relay_reminder_outbox. Запрос к API не ходит в Redis,
+    а откаченная транзакция не оставляет напоминаний.
+    """
+
+    id = models.BigAutoField(primary_key=True)
+    # Без FK: задачу могут удалить до переноса — такое напоминание отбросится по версии
+    task_id = models.CharField(max_length=26)
+    version = models.PositiveIntegerField()
+    due_date = models.DateTimeField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = "reminder_outbox"
+
+    def __str__(self):
+        return f"{self.task_id}:{self.version}"
+
+
 class UserProfile(models.Model):
     """Профиль пользователя с Telegram ID для уведомлений."""
 
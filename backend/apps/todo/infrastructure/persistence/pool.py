@@ -0,0 +1,51 @@
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from django.conf import settings
+from django.db import connections
+
+_last_report = 0.0
+_report_lock = threading.Lock()
+
+
+def pool_stats(alias: str = "default") -> Optional[Dict[str, Any]]:
+    """
+    Статистика пула соединений текущего процесса; None, если пул выключен.
+
+    Счётчики psycopg_pool накопительные с момента старта процесса;
+    in_use/utilization — текущая занятость, avg_wait_ms — среднее ожидание
+    соединения на один запрос к пулу.
+    """
+    pool = getattr(connections[alias], "pool", None)
+    if pool is None:
+        return None
+
+    stats = pool.get_stats()
+    # Пул открывается при первом запросе к БД в процессе
+    in_use = 0 if pool.closed else stats.get("pool_size", 0) - stats.get("pool_available", 0)
+    requests = stats.get("requests_num", 0)
+    return {
+        "pid": os.getpid(),
+        **stats,
+        "in_use": in_use,
+        "utilization": round(in_use / stats["pool_max"], 3) if stats.get("pool_max") else 0.0,
+        "avg_wait_ms": round(stats.get("requests_wait_ms", 0) / requests, 3) if requests else 0.0,
+    }
+
+
+def report_pool_stats() -> None:
+    """Печатает статистику пула не чаще раза в DB_POOL_STATS_INTERVAL секунд."""
+    global _last_report
+    now = time.monotonic()
+    if now - _last_report < settings.DB_POOL_STATS_INTERVAL:
+        return
+    with _report_lock:
+        if now - _last_report < settings.DB_POOL_STATS_INTERVAL:
+            return
+        _last_report = now
+
+    stats = pool_stats()
+    if stats is not None:
+        print(f"[db-pool] {stats}")
@@ -45,6 +45,13 @@ class CategoryRepository(ICategoryRepository):
         except CategoryModel.DoesNotExist:
             return None
 
+    def get_many(self, category_ids: List[str]) -> List[CategoryEntity]:
+        """Get categories by a list of IDs in a single lookup."""
+        if not category_ids:
+            return []
+        models = CategoryModel.objects.filter(id__in=set(category_ids))
+        return [self._to_entity(m) for m in models]
+
     def get_all(self) -> List[CategoryEntity]:
         """Get all categories."""
         models = CategoryModel.objects.all()
@@ -64,3 +71,22 @@ class CategoryRepository(ICategoryRepository):
             return True
         except CategoryModel.DoesNotExist:
             return False
+
+    async def aget_by_id(self, category_id: str) -> Optional[CategoryEntity]:
+        """Get category by ID."""
+        try:
+            model = await CategoryModel.objects.aget(id=category_id)
+            return self._to_entity(model)
+        except CategoryModel.DoesNotExist:
+            return None
+
+    async def aget_many(self, category_ids: List[str]) -> List[CategoryEntity]:
+        """Get categories by a list of IDs in a single lookup."""
+        if not category_ids:
+            return []
+        models = CategoryModel.objects.filter(id__in=set(category_ids))
+        return [self._to_entity(m) async for m in models]
+
+    async def aget_all(self) -> List[CategoryEntity]:
+        """Get all categories."""
+        return [self._to_entity(m) async for m in CategoryModel.objects.all()]
@@ -1,11 +1,29 @@
-from typing import List, Optional
+from itertools import islice
+from typing import AsyncIterator, Iterator, List, Optional, Tuple
 from datetime import datetime
 
+from asgiref.sync import sync_to_async
+from django.db import connection, transaction
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db.models import F, Q
 from django.utils import timezone
 
 from apps.todo.application.interfaces.task_repository import ITaskRepository
 from apps.todo.domain.entities.task import Task as TaskEntity
-from apps.todo.infrastructure.persistence.models import Task as TaskModel
+from apps.todo.domain.value_objects.task_status import TaskStatus
+from apps.todo.infrastructure.persistence.models import SEARCH_CONFIG, Task as TaskModel
+from apps.todo.infrastructure.scheduling.reminder_outbox import reminder_outbox
+
+BULK_BATCH_SIZE = 500
+# Rows fetched per round trip when streaming large result sets
+ITERATOR_CHUNK_SIZE = 2000
+
+# Entity columns fetched by values_list; rows are mapped onto TaskEntity by name
+ENTITY_COLUMNS = (
+    "id", "title", "description", "user_id", "category_id",
+    "due_date", "is_completed", "created_at", "updated_at", "reminder_version",
+)
+SUMMARY_COLUMNS = tuple(c for c in ENTITY_COLUMNS if c != "description")
 
 
 class TaskRepository(ITaskRepository):
@@ -22,9 +40,36 @@ class TaskRepository(ITaskRepository):
             due_date=model.due_date,
             is_completed=model.is_completed,
             created_at=model.created_at,
-            updated_at=model.updated_at
+            updated_at=model.updated_at,
+            reminder_version=model.reminder_version
         )
 
+    @staticmethod
+    def _row_to_entity(row: tuple) -> TaskEntity:
+        """Build an entity from an ENTITY_COLUMNS row."""
+        return TaskEntity(**dict(zip(ENTITY_COLUMNS, row)))
+
+    @staticmethod
+    def _summary_row_to_entity(row: tuple) -> TaskEntity:
+        """Build an entity from a SUMMARY_COLUMNS row; description is left empty."""
+        return TaskEntity(description="", **dict(zip(SUMMARY_COLUMNS, row)))
+
+    def _project(self, queryset, with_description: bool = True) -> List[TaskEntity]:
+        """Fetch only the entity columns and build entities without model instances."""
+        if with_description:
+            rows, to_entity = queryset.values_list(*ENTITY_COLUMNS), self._row_to_entity
+        else:
+            rows, to_entity = queryset.values_list(*SUMMARY_COLUMNS), self._summary_row_to_entity
+        return [to_entity(row) for row in rows]
+
+    async def _aproject(self, queryset, with_description: bool = True) -> List[TaskEntity]:
+        """Async variant of _project."""
+        if with_description:
+            rows, to_entity = queryset.values_list(*ENTITY_COLUMNS), self._row_to_entity
+        else:
+            rows, to_entity = queryset.values_list(*SUMMARY_COLUMNS), self._summary_row_to_entity
+        return [to_entity(row) async for row in rows]
+
     def _to_model(self, entity: TaskEntity, model: Optional[TaskModel] = None) -> TaskModel:
         """Convert domain entity to Django model."""
         if model is None:
@@ -40,10 +85,21 @@ class TaskRepository(ITaskRepository):
 
         return model
 
+    @staticmethod
+    def _enqueue_reminders(tasks, remind_after: Optional[datetime] = None) -> None:
+        """Queue reminders for open tasks with a due date in the current transaction."""
+        reminder_outbox.add_many(
+            (t.id, t.reminder_version, t.due_date) for t in tasks
+            if t.due_date and not t.is_completed
+            and (remind_after is None or t.due_date > remind_after)
+        )
+
     def create(self, task: TaskEntity) -> TaskEntity:
-        """Create a new task."""
+        """Create a new task and queue its reminder."""
         model = self._to_model(task)
-        model.save()
+        with transaction.atomic():
+            model.save()
+            self._enqueue_reminders([model])
         return self._to_entity(model)
 
     def get_by_id(self, task_id: str) -> Optional[TaskEntity]:
@@ -54,32 +110,255 @@ class TaskRepository(ITaskRepository):
         except TaskModel.DoesNotExist:
             return None
 
-    def get_by_user_id(self, user_id: int) -> List[TaskEntity]:
+    def get_many(self, task_ids: List[str]) -> List[TaskEntity]:
+        """Get tasks by a list of IDs in a single lookup."""
+        if not task_ids:
+            return []
+        return self._project(TaskModel.objects.filter(id__in=set(task_ids)))
+
+    def get_by_user_id(self, user_id: int, with_description: bool = True) -> List[TaskEntity]:
         """Get all tasks for a user."""
+        return self._project(
+            TaskModel.objects.filter(user_id=user_id),
+            with_description
+        )
+
+    def iter_by_user_id(self, user_id: int) -> Iterator[TaskEntity]:
+        """Stream all tasks of a user in creation order (server-side cursor on PostgreSQL)."""
+        rows = self._export_queryset(user_id).iterator(chunk_size=ITERATOR_CHUNK_SIZE)
+        for row in rows:
+            yield self._row_to_entity(row)
+
+    def _export_queryset(self, user_id: int):
+        return TaskModel.objects.filter(user_id=user_id).order_by("id").values_list(*ENTITY_COLUMNS)
+
+    def get_page_by_user_id(
+        self,
+        user_id: int,
+        after: Optional[str] = None,
+        limit: int = 20,
+        category_id: Optional[str] = None,
+        with_description: bool = True,
+        status: Optional[TaskStatus] = None,
+        due_before: Optional[datetime] = None,
+        due_after: Optional[datetime] = None
+    ) -> List[TaskEntity]:
+        """Get a page of user's tasks, newest first, strictly after the given task ID."""
+        return self._project(self._page_queryset(
+            user_id, after, category_id, status, due_before, due_after
+        )[:limit], with_description)
+
+    def search(self, user_id: int, query: str, limit: int = 20) -> List[TaskEntity]:
+        """Full-text search over a user's tasks, best matches first."""
+        return self._project(self._search_queryset(user_id, query)[:limit])
+
+    def _search_queryset(self, user_id: int, query: str):
+        queryset = TaskModel.objects.filter(user_id=user_id)
+        if connection.vendor != "postgresql":
+            return queryset.filter(
+                Q(title__icontains=query) | Q(description__icontains=query)
+            ).order_by("-id")
+
+        # (user, search_vector) GIN index; title matches (weight A) outrank description ones
+        search_query = SearchQuery(query, config=SEARCH_CONFIG, search_type="websearch")
+        return (
+            queryset.filter(search_vector=search_query)
+            .annotate(rank=SearchRank(F("search_vector"), search_query))
+            .order_by("-rank", "-id")
+        )
+
+    def _page_queryset(
+        self,
+        user_id: int,
+        after: Optional[str],
+        category_id: Optional[str],
+        status: Optional[TaskStatus] = None,
+        due_before: Optional[datetime] = None,
+        due_after: Optional[datetime] = None
+    ):
         models = TaskModel.objects.filter(user_id=user_id)
-        return [self._to_entity(m) for m in models]
+        if category_id:
+            models = models.filter(category_id=category_id)
+        # open/overdue match the partial indexes on NOT is_completed
+        if status == TaskStatus.OPEN:
+            models = models.filter(is_completed=False)
+        elif status == TaskStatus.COMPLETED:
+            models = models.filter(is_completed=True)
+        elif status == TaskStatus.OVERDUE:
+            models = models.filter(is_completed=False, due_date__lt=timezone.now())
+        if due_before:
+            models = models.filter(due_date__lt=due_before)
+        if due_after:
+            models = models.filter(due_date__gte=due_after)
+        if after:
+            models = models.filter(id__lt=after)
+        return models.order_by("-id")
 
-    def get_by_category(self, category_id: str) -> List[TaskEntity]:
+    def get_by_category(self, category_id: str, with_description: bool = True) -> List[TaskEntity]:
         """Get all tasks in a category."""
-        models = TaskModel.objects.filter(category_id=category_id)
-        return [self._to_entity(m) for m in models]
+        return self._project(
+            TaskModel.objects.filter(category_id=category_id),
+            with_description
+        )
 
-    def get_overdue_tasks(self) -> List[TaskEntity]:
-        """Get all overdue tasks."""
+    def get_overdue_tasks(self, with_description: bool = True) -> List[TaskEntity]:
+        """Get all overdue tasks in one list; iter_overdue_tasks streams them in bounded chunks."""
         now = timezone.now()
-        models = TaskModel.objects.filter(
-            due_date__lt=now,
-            is_completed=False
+        return self._project(
+            TaskModel.objects.filter(due_date__lt=now, is_completed=False),
+            with_description
         )
-        return [self._to_entity(m) for m in models]
+
+    def iter_overdue_tasks(
+        self,
+        before: Optional[datetime] = None,
+        after: Optional[Tuple[datetime, str]] = None,
+        pending_only: bool = False,
+        chunk_size: int = ITERATOR_CHUNK_SIZE,
+        with_description: bool = True
+    ) -> Iterator[TaskEntity]:
+        """
+        Stream open tasks due before `before` (default: now) in (due_date, id) order.
+
+        Each chunk is a separate keyset query on the (due_date, id) partial
+        index, so memory is bounded by chunk_size and no cursor stays open
+        between chunks. after is the (due_date, id) of the last task already
+        seen; pending_only skips tasks already notified about their current
+        reminder_version.
+        """
+        queryset = TaskModel.objects.filter(is_completed=False, due_date__lt=before or timezone.now())
+        if pending_only:
+            queryset = queryset.exclude(notified_version=F("reminder_version"))
+
+        while True:
+            chunk = queryset
+            if after:
+                due_date, task_id = after
+                # due_date__gte bounds the index range; the OR breaks ties on id
+                chunk = chunk.filter(
+                    Q(due_date__gt=due_date) | Q(due_date=due_date, id__gt=task_id),
+                    due_date__gte=due_date
+                )
+            tasks = self._project(chunk.order_by("due_date", "id")[:chunk_size], with_description)
+            yield from tasks
+            if len(tasks) < chunk_size:
+                return
+            after = (tasks[-1].due_date, tasks[-1].id)
 
     def update(self, task: TaskEntity) -> TaskEntity:
-        """Update a task."""
-        model = TaskModel.objects.get(id=task.id)
-        model = self._to_model(task, model)
-        model.save()
+        """Update a task; a new due date or status bumps reminder_version."""
+        with transaction.atomic():
+            # Row lock: concurrent updates must not end up with the same version
+            model = TaskModel.objects.select_for_update().get(id=task.id)
+            reschedules = self._reschedules(model.due_date, model.is_completed, task)
+            if reschedules:
+                model.reminder_version += 1
+            model = self._to_model(task, model)
+            model.save()
+            if reschedules:
+                self._enqueue_reminders([model])
         return self._to_entity(model)
 
+    @staticmethod
+    def _reschedules(due_date: Optional[datetime], is_completed: bool, task: TaskEntity) -> bool:
+        """Whether the change invalidates an already scheduled reminder."""
+        return due_date != task.due_date or is_completed != task.is_completed
+
+    def bulk_create(self, tasks: List[TaskEntity]) -> List[TaskEntity]:
+        """Create many tasks in batched INSERTs and queue their reminders."""
+        with transaction.atomic():
+            models = TaskModel.objects.bulk_create(
+                [self._to_model(t) for t in tasks],
+                batch_size=BULK_BATCH_SIZE
+            )
+            self._enqueue_reminders(models)
+        return [self._to_entity(m) for m in models]
+
+    def bulk_import(self, tasks: List[TaskEntity], remind_after: Optional[datetime] = None) -> int:
+        """
+        Insert many new tasks: COPY on PostgreSQL, batched INSERTs elsewhere.
+
+        Nothing is read back, and created_at/updated_at are set to now
+        like auto_now_add/auto_now would. Reminders are queued only for
+        due dates after remind_after, when it is given; tasks due earlier
+        are stored as already notified, so sweep_missed_reminders skips them too.
+        """
+        with transaction.atomic():
+            self._insert_many(tasks, remind_after)
+            self._enqueue_reminders(tasks, remind_after)
+        return len(tasks)
+
+    @staticmethod
+    def _imported_notified_version(task: TaskEntity, remind_after: Optional[datetime]) -> Optional[int]:
+        """notified_version for an imported task: its own version if the due date is skipped."""
+        if remind_after is not None and task.due_date and task.due_date <= remind_after:
+            return task.reminder_version
+        return None
+
+    def _insert_many(self, tasks: List[TaskEntity], remind_after: Optional[datetime] = None) -> None:
+        if connection.vendor != "postgresql":
+            models = []
+            for t in tasks:
+                model = self._to_model(t)
+                model.notified_version = self._imported_notified_version(t, remind_after)
+                models.append(model)
+            TaskModel.objects.bulk_create(models, batch_size=BULK_BATCH_SIZE)
+            return
+
+        now = timezone.now()
+        opts = TaskModel._meta
+        columns = ", ".join(
+            connection.ops.quote_name(opts.get_field(name).column)
+            for name in ENTITY_COLUMNS + ("notified_version",)
+        )
+        with connection.cursor() as cursor:
+            # cursor.cursor is the psycopg 3 cursor under Django's wrapper
+            with cursor.cursor.copy(
+                f"COPY {connection.ops.quote_name(opts.db_table)} ({columns}) FROM STDIN"
+            ) as copy:
+                for t in tasks:
+                    copy.write_row((
+                        t.id, t.title, t.description, t.user_id, t.category_id,
+                        t.due_date, t.is_completed, now, now, t.reminder_version,
+                        self._imported_notified_version(t, remind_after)
+                    ))
+
+    def bulk_update(self, tasks: List[TaskEntity]) -> List[TaskEntity]:
+        """Update many tasks in batched UPDATEs; bumps reminder_version like update()."""
+        now = timezone.now()
+        with transaction.atomic():
+            current = {
+                task_id: rest
+                for task_id, *rest in TaskModel.objects.select_for_update()
+                .filter(id__in=[t.id for t in tasks])
+                .values_list("id", "due_date", "is_completed", "reminder_version")
+            }
+
+            models = []
+            rescheduled = []
+            for task in tasks:
+                model = self._to_model(task)
+                model.created_at = task.created_at
+                # bulk_update skips auto_now, so set updated_at explicitly
+                model.updated_at = now
+                due_date, is_completed, version = current[task.id]
+                if self._reschedules(due_date, is_completed, task):
+                    version += 1
+                    rescheduled.append(model)
+                model.reminder_version = version
+                models.append(model)
+
+            TaskModel.objects.bulk_update(
+                models,
+                fields=[
+                    "title", "description", "category_id", "due_date",
+                    "is_completed", "updated_at", "reminder_version"
+                ],
+                batch_size=BULK_BATCH_SIZE
+            )
+            self._enqueue_reminders(rescheduled)
+        return [self._to_entity(m) for m in models]
+
     def delete(self, task_id: str) -> bool:
         """Delete a task."""
         try:
@@ -87,3 +366,63 @@ class TaskRepository(ITaskRepository):
             return True
         except TaskModel.DoesNotExist:
             return False
+
+    async def acreate(self, task: TaskEntity) -> TaskEntity:
+        """Create a new task and queue its reminder."""
+        # The task and its outbox entry commit together; atomic is sync-only
+        return await sync_to_async(self.create)(task)
+
+    async def aget_by_id(self, task_id: str) -> Optional[TaskEntity]:
+        """Get task by ID."""
+        try:
+            model = await TaskModel.objects.aget(id=task_id)
+            return self._to_entity(model)
+        except TaskModel.DoesNotExist:
+            return None
+
+    async def aiter_by_user_id(self, user_id: int) -> AsyncIterator[TaskEntity]:
+        """Async variant of iter_by_user_id."""
+        # values_list().aiterator() starts the query on the event loop thread in Django 5.1,
+        # so pull chunks of the sync iterator through sync_to_async ourselves
+        rows = self._export_queryset(user_id).iterator(chunk_size=ITERATOR_CHUNK_SIZE)
+        next_chunk = sync_to_async(lambda: list(islice(rows, ITERATOR_CHUNK_SIZE)))
+        while True:
+            chunk = await next_chunk()
+            for row in chunk:
+                yield self._row_to_entity(row)
+            if len(chunk) < ITERATOR_CHUNK_SIZE:
+                break
+
+    async def aget_page_by_user_id(
+        self,
+        user_id: int,
+        after: Optional[str] = None,
+        limit: int = 20,
+        category_id: Optional[str] = None,
+        with_description: bool = True,
+        status: Optional[TaskStatus] = None,
+        due_before: Optional[datetime] = None,
+        due_after: Optional[datetime] = None
+    ) -> List[TaskEntity]:
+        """Get a page of user's tasks, newest first, strictly after the given task ID."""
+        return await self._aproject(self._page_queryset(
+            user_id, after, category_id, status, due_before, due_after
+        )[:limit], with_description)
+
+    async def asearch(self, user_id: int, query: str, limit: int = 20) -> List[TaskEntity]:
+        """Full-text search over a user's tasks, best matches first."""
+        return await self._aproject(self._search_queryset(user_id, query)[:limit])
+
+    async def aupdate(self, task: TaskEntity) -> TaskEntity:
+        """Update a task; a new due date or status bumps reminder_version."""
+        # The row lock needs transaction.atomic, which is sync-only
+        return await sync_to_async(self.update)(task)
+
+    async def adelete(self, task_id: str) -> bool:
+        """Delete a task."""
+        try:
+            model = await TaskModel.objects.aget(id=task_id)
+            await model.adelete()
+            return True
+        except TaskModel.DoesNotExist:
+            return False
@@ -0,0 +1,58 @@
+from datetime import datetime
+from typing import Iterable, Optional, Tuple
+
+from django.db import transaction
+
+from apps.todo.infrastructure.persistence.models import ReminderOutboxEntry
+from apps.todo.infrastructure.scheduling.reminder_scheduler import ReminderScheduler, reminder_scheduler
+
+OUTBOX_INSERT_BATCH_SIZE = 1000
+
+
+class ReminderOutbox:
+    """
+    Transactional outbox напоминаний.
+
+    add_many() вызывается внутри транзакции, меняющей задачу: напоминание
+    появляется ровно тогда, когда изменение закоммичено. relay() забирает
+    пачку строк (SELECT ... FOR UPDATE SKIP LOCKED — несколько relay не
+    мешают друг другу), публикует её одним ZADD и удаляет; если Redis
+    недоступен, транзакция откатывается и строки ждут следующего прогона.
+    Повторная публикация безопасна: тот же member в ZSET просто перезаписывается.
+    """
+
+    def __init__(self, scheduler: Optional[ReminderScheduler] = None):
+        self._scheduler = scheduler
+
+    @property
+    def scheduler(self) -> ReminderScheduler:
+        return self._scheduler or reminder_scheduler
+
+    def add_many(self, reminders: Iterable[Tuple[str, int, datetime]]) -> int:
+        """Записать напоминания (task_id, version, due_date) в outbox текущей транзакции."""
+        entries = [
+            ReminderOutboxEntry(task_id=task_id, version=version, due_date=due_date)
+            for task_id, version, due_date in reminders
+        ]
+        if entries:
+            ReminderOutboxEntry.objects.bulk_create(entries, batch_size=OUTBOX_INSERT_BATCH_SIZE)
+        return len(entries)
+
+    def relay(self, limit: int) -> int:
+        """Опубликовать до limit напоминаний из outbox в Redis; возвращает их число."""
+        with transaction.atomic():
+            entries = list(
+                ReminderOutboxEntry.objects.select_for_update(skip_locked=True)
+                .order_by("id")
+                .values_list("id", "task_id", "version", "due_date")[:limit]
+            )
+            if not entries:
+                return 0
+            self.scheduler.schedule_many(
+                (task_id, version, due_date) for _, task_id, version, due_date in entries
+            )
+            ReminderOutboxEntry.objects.filter(id__in=[entry[0] for entry in entries]).delete()
+        return len(entries)
+
+
+reminder_outbox = ReminderOutbox()
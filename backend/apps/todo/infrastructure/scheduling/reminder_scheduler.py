@@ -0,0 +1,76 @@
+import time
+from datetime import datetime
+from typing import Iterable, List, Optional, Tuple
+
+import redis
+from django.conf import settings
+
+
+class ReminderScheduler:
+    """
+    Напоминания о сроке задач в Redis ZSET.
+
+    member = "task_id:reminder_version", score = unix-время срока. Планирование —
+    один ZADD; отдельной отмены нет: смена срока или статуса увеличивает
+    Task.reminder_version в той же записи в БД, и напоминание со старой версией
+    отбрасывается при срабатывании. Поллер (dispatch_due_reminders) атомарно
+    забирает наступившие напоминания пачками и отдаёт их воркерам.
+    """
+
+    KEY = "reminders:due"
+
+    # Забрать и удалить из ZSET до ARGV[2] напоминаний со сроком <= ARGV[1]
+    _CLAIM_SCRIPT = """
+    local items = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, ARGV[2])
+    if #items > 0 then
+        redis.call('ZREM', KEYS[1], unpack(items))
+    end
+    return items
+    """
+
+    def __init__(self, client: Optional[redis.Redis] = None):
+        self._client = client
+        self._claim = None
+
+    @property
+    def client(self) -> redis.Redis:
+        if self._client is None:
+            self._client = redis.Redis.from_url(
+                settings.REMINDER_REDIS_URL,
+                decode_responses=True,
+                socket_connect_timeout=2
+            )
+        return self._client
+
+    @staticmethod
+    def _member(task_id: str, version: int) -> str:
+        return f"{task_id}:{version}"
+
+    @staticmethod
+    def _parse_member(member: str) -> Tuple[str, Optional[int]]:
+        # Элементы без версии остались от старого формата — их проверяет только is_completed
+        task_id, _, version = member.partition(":")
+        return task_id, int(version) if version else None
+
+    def schedule(self, task_id: str, version: int, due_date: datetime) -> None:
+        """Запланировать напоминание для версии расписания задачи."""
+        self.client.zadd(self.KEY, {self._member(task_id, version): due_date.timestamp()})
+
+    def schedule_many(self, reminders: Iterable[Tuple[str, int, datetime]]) -> None:
+        """Запланировать пачку напоминаний одним ZADD."""
+        mapping = {
+            self._member(task_id, version): due_date.timestamp()
+            for task_id, version, due_date in reminders
+        }
+        if mapping:
+            self.client.zadd(self.KEY, mapping)
+
+    def claim_due(self, limit: int, now: Optional[float] = None) -> List[Tuple[str, Optional[int]]]:
+        """Атомарно забрать наступившие напоминания (не больше limit): [(task_id, version)]."""
+        if self._claim is None:
+            self._claim = self.client.register_script(self._CLAIM_SCRIPT)
+        members = self._claim(keys=[self.KEY], args=[now or time.time(), limit])
+        return [self._parse_member(member) for member in members]
+
+
+reminder_scheduler = ReminderScheduler()
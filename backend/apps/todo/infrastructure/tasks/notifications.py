@@ -1,30 +1,36 @@
-import httpx
 from celery import shared_task
 from django.conf import settings
+from django.core.cache import cache
+from django.db.models import F, Q
+from django.utils import timezone
 from datetime import timedelta, timezone as dt_timezone
+from typing import Optional
 
 ADAK_TZ = dt_timezone(timedelta(hours=-10))
 
 from apps.todo.infrastructure.persistence.models import Task
+from apps.todo.infrastructure.persistence.repositories.task_repository_impl import TaskRepository
+from apps.todo.infrastructure.scheduling.reminder_outbox import reminder_outbox
+from apps.todo.infrastructure.scheduling.reminder_scheduler import reminder_scheduler
+from apps.todo.infrastructure.telegram.client import TelegramSendError, telegram_client
 
 
-def _send_telegram_message(telegram_id: int, text: str) -> None:
-    """Синхронная отправка сообщения в Telegram."""
-    token = getattr(settings, "TELEGRAM_BOT_TOKEN", None)
-    if not token or not telegram_id:
-        return
-    try:
-        url = f"https://api.telegram.org/bot{token}/sendMessage"
-        httpx.post(url, json={"chat_id": telegram_id, "text": text}, timeout=10)
-    except Exception as e:
-        print(f"Ошибка отправки Telegram уведомления: {e}")
+def _send_telegram_message(telegram_id: int, text: str) -> bool:
+    """Синхронная отправка сообщения в Telegram с учётом общих лимитов."""
+    return telegram_client.send_message(telegram_id, text)
 
 
-@shared_task(name="notify_task_due")
-def notify_task_due(task_id: str):
+@shared_task(bind=True, name="notify_task_due", max_retries=settings.TELEGRAM_SEND_MAX_RETRIES)
+def notify_task_due(self, task_id: str, version: Optional[int] = None):
     """
     Отправляет уведомление о наступившем сроке для конкретной задачи.
-    Запускается через apply_async(eta=due_date) в момент создания/обновления задачи.
+    Ставится в очередь поллером dispatch_due_reminders, когда наступает срок.
+    Если с момента планирования срок или статус менялись (reminder_version
+    другой), напоминание устарело и тихо отбрасывается. Версия захватывается
+    одним UPDATE (notified_version + reminder_claimed_at): повторная постановка
+    той же версии поллером или sweep_missed_reminders ничего не отправит.
+    Захват снимается после отправки; если воркер умер посреди неё, захват
+    истекает через REMINDER_CLAIM_TIMEOUT и sweep ставит напоминание заново.
     """
     try:
         task = Task.objects.select_related(
@@ -33,6 +39,30 @@ def notify_task_due(task_id: str):
     except Task.DoesNotExist:
         return f"Задача {task_id} не найдена или уже выполнена"
 
+    if version is not None and task.reminder_version != version:
+        return f"Напоминание для задачи {task_id} устарело (версия {version})"
+    version = task.reminder_version
+
+    now = timezone.now()
+    claim_expired_before = now - timedelta(seconds=settings.REMINDER_CLAIM_TIMEOUT)
+    claimed = (
+        Task.objects.filter(id=task_id, reminder_version=version)
+        .filter(~Q(notified_version=version) | Q(reminder_claimed_at__lt=claim_expired_before))
+        .update(notified_version=version, reminder_claimed_at=now)
+    )
+    if not claimed:
+        return f"Напоминание для задачи {task_id} уже отправлено или устарело"
+
+    result = _send_task_reminder(self, task)
+    # Отправлено (или отправлять некуда) — захват больше не нужен
+    Task.objects.filter(id=task_id, notified_version=version).update(reminder_claimed_at=None)
+    return result
+
+
+def _send_task_reminder(notify_task, task: Task) -> str:
+    """Отправляет текст напоминания; при ошибке Telegram снимает захват и ставит повтор."""
+    task_id = task.id
+
     due_msk = task.due_date.astimezone(ADAK_TZ)
     due_str = due_msk.strftime("%d.%m.%Y %H:%M")
 
@@ -50,7 +80,119 @@ def notify_task_due(task_id: str):
         telegram_id = None
 
     if telegram_id:
-        _send_telegram_message(telegram_id, text)
+        try:
+            sent = _send_telegram_message(telegram_id, text)
+        except TelegramSendError as e:
+            # Снимаем захват, чтобы повтор (или sweep) смог отправить эту версию
+            Task.objects.filter(id=task_id, notified_version=task.reminder_version).update(
+                notified_version=None, reminder_claimed_at=None
+            )
+            # Не теряем сообщение: повторяем после retry_after или с экспоненциальной паузой
+            countdown = e.retry_after or min(2 ** notify_task.request.retries, 60)
+            raise notify_task.retry(exc=e, countdown=countdown)
+        if not sent:
+            return f"Telegram отклонил уведомление для задачи {task_id}"
         return f"Уведомление отправлено для задачи {task_id}"
 
     return f"Нет telegram_id для задачи {task_id}"
+
+
+@shared_task(name="dispatch_due_reminders")
+def dispatch_due_reminders():
+    """
+    Поллер напоминаний: атомарно забирает наступившие сроки из Redis ZSET
+    пачками и ставит notify_task_due в очередь. Устаревшие напоминания
+    (задача удалена, выполнена или перенесена) отсеиваются одним запросом
+    на пачку и в очередь не попадают. Запускается celery beat.
+    """
+    batch_size = settings.REMINDER_DISPATCH_BATCH_SIZE
+    dispatched = stale = 0
+    for _ in range(settings.REMINDER_DISPATCH_MAX_BATCHES):
+        reminders = reminder_scheduler.claim_due(batch_size)
+        current = dict(
+            Task.objects.filter(id__in={task_id for task_id, _ in reminders}, is_completed=False)
+            .values_list("id", "reminder_version")
+        )
+        for task_id, version in reminders:
+            if task_id not in current or version not in (None, current[task_id]):
+                stale += 1
+                continue
+            notify_task_due.delay(task_id, version)
+            dispatched += 1
+        if len(reminders) < batch_size:
+            break
+    return f"Отправлено в очередь напоминаний: {dispatched}, отброшено устаревших: {stale}"
+
+
+@shared_task(name="relay_reminder_outbox")
+def relay_reminder_outbox():
+    """
+    Переносит напоминания из outbox в Redis ZSET пачками. Строки удаляются
+    только после успешного ZADD; при недоступном Redis остаются в outbox
+    до следующего запуска. Запускается celery beat.
+    """
+    batch_size = settings.REMINDER_OUTBOX_BATCH_SIZE
+    relayed = 0
+    for _ in range(settings.REMINDER_OUTBOX_MAX_BATCHES):
+        count = reminder_outbox.relay(batch_size)
+        relayed += count
+        if count < batch_size:
+            break
+    return f"Перенесено напоминаний из outbox: {relayed}"
+
+
+SWEEP_CHECKPOINT_KEY = "reminders:sweep:checkpoint"
+
+
+@shared_task(name="sweep_missed_reminders")
+def sweep_missed_reminders():
+    """
+    Страховка для напоминаний, потерянных по дороге (Redis перезапущен без
+    персистентности, воркер упал между claim_due и отправкой): проходит
+    просроченные открытые задачи, о текущей версии которых не уведомляли,
+    и ставит notify_task_due. Задачи читаются keyset-пачками по индексу
+    (due_date, id), так что память ограничена пачкой. Позиция (due_date, id)
+    сохраняется в кеше после каждой пачки: прерванный или упёршийся
+    в REMINDER_SWEEP_MAX_TASKS проход продолжается со следующего запуска.
+    Сначала заново ставятся напоминания с истёкшим захватом (воркер умер
+    посреди отправки) — они уже позади позиции прохода. Запускается celery beat.
+    """
+    now = timezone.now()
+    expired_claims = list(
+        Task.objects.filter(
+            reminder_claimed_at__lt=now - timedelta(seconds=settings.REMINDER_CLAIM_TIMEOUT),
+            notified_version=F("reminder_version"),
+            is_completed=False,
+        ).values_list("id", "reminder_version")[:settings.REMINDER_SWEEP_MAX_TASKS]
+    )
+    for task_id, version in expired_claims:
+        notify_task_due.delay(task_id, version)
+
+    # Свежие сроки ещё обрабатывает поллер; дальше окна не смотрим, даже без позиции в кеше
+    before = now - timedelta(seconds=settings.REMINDER_SWEEP_GRACE)
+    window_start = (now - timedelta(seconds=settings.REMINDER_SWEEP_LOOKBACK), "")
+    checkpoint = cache.get(SWEEP_CHECKPOINT_KEY)
+    after = max(checkpoint, window_start) if checkpoint else window_start
+
+    chunk_size = settings.REMINDER_SWEEP_CHUNK_SIZE
+    tasks = TaskRepository().iter_overdue_tasks(
+        before=before,
+        after=after,
+        pending_only=True,
+        chunk_size=chunk_size,
+        with_description=False
+    )
+    swept = 0
+    for task in tasks:
+        notify_task_due.delay(task.id, task.reminder_version)
+        swept += 1
+        if swept % chunk_size == 0:
+            cache.set(SWEEP_CHECKPOINT_KEY, (task.due_date, task.id), None)
+        if swept >= settings.REMINDER_SWEEP_MAX_TASKS:
+            tasks.close()
+            cache.set(SWEEP_CHECKPOINT_KEY, (task.due_date, task.id), None)
+            return f"Найдено пропущенных напоминаний: {swept}, зависших отправок: {len(expired_claims)}, проход продолжится со следующего запуска"
+
+    # Окно пройдено целиком: следующий запуск начинает с before
+    cache.set(SWEEP_CHECKPOINT_KEY, (before, ""), None)
+    return f"Найдено пропущенных напоминаний: {swept}, зависших отправок: {len(expired_claims)}"
@@ -0,0 +1,110 @@
+import os
+import threading
+from typing import Optional
+
+import httpx
+from django.conf import settings
+
+from apps.todo.infrastructure.telegram.rate_limiter import TelegramRateLimiter, telegram_rate_limiter
+
+
+class TelegramSendError(Exception):
+    """Временная ошибка отправки — сообщение стоит повторить."""
+
+    def __init__(self, message: str, retry_after: float = 0):
+        self.retry_after = retry_after
+        super().__init__(message)
+
+
+class TelegramClient:
+    """
+    Отправка сообщений в Telegram через общий rate limiter.
+
+    httpx.Client с keep-alive создаётся один раз на процесс воркера
+    (заново после fork), поэтому соединение с api.telegram.org переиспользуется.
+    """
+
+    def __init__(self, rate_limiter: TelegramRateLimiter = telegram_rate_limiter):
+        self.rate_limiter = rate_limiter
+        self._http: Optional[httpx.Client] = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    @property
+    def http(self) -> httpx.Client:
+        if self._pid != os.getpid():
+            with self._lock:
+                if self._pid != os.getpid():
+                    self._http = httpx.Client(
+                        base_url="https://api.telegram.org",
+                        timeout=10,
+                        limits=httpx.Limits(
+                            max_connections=settings.TELEGRAM_POOL_MAX_CONNECTIONS,
+                            max_keepalive_connections=settings.TELEGRAM_POOL_MAX_CONNECTIONS,
+                        ),
+                    )
+                    self._pid = os.getpid()
+        return self._http
+
+    def send_message(self, chat_id: int, text: str) -> bool:
+        """
+        Отправить сообщение. True — доставлено, False — Telegram отказал
+        окончательно (бот заблокирован, чат не найден). Временные ошибки
+        и 429 поднимают TelegramSendError.
+        """
+        token = settings.TELEGRAM_BOT_TOKEN
+        if not token or not chat_id:
+            return False
+
+        try:
+            acquired = self.rate_limiter.acquire(chat_id, timeout=settings.TELEGRAM_ACQUIRE_TIMEOUT)
+        except Exception as e:
+            # Redis лимитера недоступен — это временная ошибка, сообщение повторим
+            raise TelegramSendError(f"Rate limiter недоступен: {e}", retry_after=1)
+        if not acquired:
+            raise TelegramSendError("Превышен лимит отправки", retry_after=1)
+
+        try:
+            response = self.http.post(
+                f"/bot{token}/sendMessage",
+                json={"chat_id": chat_id, "text": text}
+            )
+        except httpx.HTTPError as e:
+            raise TelegramSendError(f"Ошибка соединения с Telegram: {e}")
+
+        if response.status_code == 429:
+            retry_after = self._retry_after(response)
+            try:
+                self.rate_limiter.pause(retry_after)
+            except Exception as e:
+                print(f"Не удалось приостановить rate limiter: {e}")
+            raise TelegramSendError("Telegram вернул 429", retry_after=retry_after)
+        if response.status_code >= 500:
+            raise TelegramSendError(f"Telegram вернул {response.status_code}")
+        if response.status_code != 200:
+            print(f"Telegram отклонил сообщение для {chat_id}: {response.text}")
+            return False
+        return True
+
+    @staticmethod
+    def _retry_after(response: httpx.Response) -> float:
+        """
+        Пауза из ответа 429: parameters.retry_after из JSON Telegram, иначе
+        заголовок Retry-After (прокси и шлюзы отвечают HTML), иначе 1 с.
+        """
+        try:
+            retry_after = response.json()["parameters"]["retry_after"]
+            if retry_after > 0:
+                return retry_after
+        except (ValueError, KeyError, TypeError):
+            pass
+        try:
+            retry_after = float(response.headers.get("Retry-After", ""))
+            if retry_after > 0:
+                return retry_after
+        except ValueError:
+            pass
+        return 1
+
+
+telegram_client = TelegramClient()
@@ -0,0 +1,106 @@
+import time
+from typing import Optional
+
+import redis
+from django.conf import settings
+
+
+class TelegramRateLimiter:
+    """
+    Общий для всех воркеров token bucket в Redis.
+
+    Два ведра — глобальное (лимит бота) и на чат; отправка разрешена, только
+    если в обоих есть токен. retry_after из ответа 429 ставит глобальную паузу.
+    Время берётся из Redis (TIME), так что расхождение часов воркеров не важно.
+    """
+
+    GLOBAL_KEY = "telegram:bucket:global"
+    CHAT_KEY = "telegram:bucket:chat:{chat_id}"
+    PAUSE_KEY = "telegram:pause"
+
+    # Возвращает 0, если токены списаны, иначе сколько секунд подождать
+    _ACQUIRE_SCRIPT = """
+    local pause = redis.call('PTTL', KEYS[3])
+    if pause > 0 then
+        return tostring(pause / 1000)
+    end
+
+    local t = redis.call('TIME')
+    local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+
+    local function level(key, rate, burst)
+        local bucket = redis.call('HMGET', key, 'tokens', 'ts')
+        local tokens = tonumber(bucket[1]) or burst
+        local ts = tonumber(bucket[2]) or now
+        return math.min(burst, tokens + math.max(0, now - ts) * rate)
+    end
+
+    local global_rate, global_burst = tonumber(ARGV[1]), tonumber(ARGV[2])
+    local chat_rate, chat_burst = tonumber(ARGV[3]), tonumber(ARGV[4])
+    local global_tokens = level(KEYS[1], global_rate, global_burst)
+    local chat_tokens = level(KEYS[2], chat_rate, chat_burst)
+
+    local wait = 0
+    if global_tokens < 1 then
+        wait = math.max(wait, (1 - global_tokens) / global_rate)
+    end
+    if chat_tokens < 1 then
+        wait = math.max(wait, (1 - chat_tokens) / chat_rate)
+    end
+    if wait > 0 then
+        return tostring(wait)
+    end
+
+    redis.call('HSET', KEYS[1], 'tokens', tostring(global_tokens - 1), 'ts', tostring(now))
+    redis.call('EXPIRE', KEYS[1], 60)
+    redis.call('HSET', KEYS[2], 'tokens', tostring(chat_tokens - 1), 'ts', tostring(now))
+    redis.call('EXPIRE', KEYS[2], 60)
+    return '0'
+    """
+
+    def __init__(self, client: Optional[redis.Redis] = None):
+        self._client = client
+        self._acquire = None
+
+    @property
+    def client(self) -> redis.Redis:
+        if self._client is None:
+            self._client = redis.Redis.from_url(
+                settings.TELEGRAM_RATE_LIMIT_REDIS_URL,
+                decode_responses=True,
+                socket_connect_timeout=2
+            )
+        return self._client
+
+    def try_acquire(self, chat_id: int) -> float:
+        """Списать токен; вернуть 0 при успехе или время ожидания в секундах."""
+        if self._acquire is None:
+            self._acquire = self.client.register_script(self._ACQUIRE_SCRIPT)
+        wait = self._acquire(
+            keys=[self.GLOBAL_KEY, self.CHAT_KEY.format(chat_id=chat_id), self.PAUSE_KEY],
+            args=[
+                settings.TELEGRAM_GLOBAL_RATE,
+                settings.TELEGRAM_GLOBAL_BURST,
+                settings.TELEGRAM_CHAT_RATE,
+                settings.TELEGRAM_CHAT_BURST,
+            ],
+        )
+        return float(wait)
+
+    def acquire(self, chat_id: int, timeout: float) -> bool:
+        """Дождаться токена не дольше timeout секунд."""
+        deadline = time.monotonic() + timeout
+        while True:
+            wait = self.try_acquire(chat_id)
+            if wait <= 0:
+                return True
+            if time.monotonic() + wait > deadline:
+                return False
+            time.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """Глобальная пауза по retry_after из ответа 429."""
+        self.client.set(self.PAUSE_KEY, 1, px=max(int(seconds * 1000), 1))
+
+
+telegram_rate_limiter = TelegramRateLimiter()
@@ -0,0 +1,74 @@
+import random
+import time
+from dataclasses import asdict
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.renderers import JSONRenderer
+
+from apps.todo.application.dto.task_dto import TaskDTO, TaskPageDTO
+from apps.todo.domain.value_objects.task_id import ULIDGenerator
+from apps.todo.presentation.api.v1.serializers.fast_json import render_task_page
+from apps.todo.presentation.api.v1.serializers.task_serializers import TaskSerializer
+
+
+class Command(BaseCommand):
+    help = (
+        "Микробенчмарк сериализации списка задач: DRF (asdict + TaskSerializer + "
+        "JSONRenderer) против fast_json (orjson). Проверяет побайтовое совпадение."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=100)
+        parser.add_argument("--repeat", type=int, default=200)
+
+    def handle(self, *args, **options):
+        page = self._page(options["rows"])
+        renderer = JSONRenderer()
+
+        def drf():
+            serializer = TaskSerializer([asdict(t) for t in page.items], many=True)
+            return renderer.render({"next": page.next_cursor, "results": serializer.data})
+
+        def fast():
+            return render_task_page(page)
+
+        if drf() != fast():
+            raise CommandError("Вывод fast_json отличается от DRF")
+
+        drf_ms = self._measure(drf, options["repeat"])
+        fast_ms = self._measure(fast, options["repeat"])
+        self.stdout.write(
+            f"{options['rows']} задач: DRF {drf_ms:.3f} ms, fast_json {fast_ms:.3f} ms, "
+            f"x{drf_ms / fast_ms:.1f}; вывод совпадает побайтово"
+        )
+
+    @staticmethod
+    def _measure(func, repeat: int) -> float:
+        """Лучшее время одного вызова (мс) из repeat."""
+        best = float("inf")
+        for _ in range(repeat):
+            started = time.perf_counter()
+            func()
+            best = min(best, time.perf_counter() - started)
+        return best * 1000
+
+    @staticmethod
+    def _page(rows: int) -> TaskPageDTO:
+        now = datetime.now(dt_timezone.utc)
+        items = []
+        for i in range(rows):
+            has_category = i % 2 == 0
+            items.append(TaskDTO(
+                id=ULIDGenerator.generate(),
+                title=f"Задача №{i}   \"quoted\"",
+                description="Описание\nс переводом строки и emoji \U0001F600",
+                user_id=1,
+                category_id=ULIDGenerator.generate() if has_category else None,
+                category_name="Работа" if has_category else None,
+                due_date=now + timedelta(hours=random.randint(1, 100)) if i % 3 else None,
+                is_completed=bool(i % 4 == 0),
+                created_at=now - timedelta(microseconds=random.randint(0, 10**9)),
+                updated_at=now
+            ))
+        return TaskPageDTO(items=items, next_cursor=items[-1].id if items else None)
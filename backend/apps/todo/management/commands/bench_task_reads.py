@@ -0,0 +1,71 @@
+import time
+import tracemalloc
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from apps.todo.domain.value_objects.task_id import ULIDGenerator
+from apps.todo.infrastructure.persistence.models import Task as TaskModel
+from apps.todo.infrastructure.persistence.repositories.task_repository_impl import TaskRepository
+
+
+class Command(BaseCommand):
+    help = (
+        "Бенчмарк чтения задач: модель Django + _to_entity против values_list-проекции "
+        "(с description и без). Данные создаются в транзакции и откатываются."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=10_000)
+        parser.add_argument("--description-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            user = self._seed(options["rows"], options["description_size"])
+            repo = TaskRepository()
+
+            variants = [
+                ("model + _to_entity", lambda: [
+                    repo._to_entity(m) for m in TaskModel.objects.filter(user_id=user.id)
+                ]),
+                ("values_list", lambda: repo.get_by_user_id(user.id)),
+                ("values_list без description", lambda: repo.get_by_user_id(user.id, with_description=False)),
+            ]
+            for name, read in variants:
+                read()  # прогрев
+                elapsed, peak = self._measure(read)
+                self.stdout.write(f"{name:<30} {elapsed * 1000:8.1f} ms  пик памяти {peak / 2**20:6.1f} MiB")
+
+            transaction.set_rollback(True)
+
+    @staticmethod
+    def _measure(read):
+        tracemalloc.start()
+        started = time.perf_counter()
+        tasks = read()
+        elapsed = time.perf_counter() - started
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del tasks
+        return elapsed, peak
+
+    @staticmethod
+    def _seed(rows: int, description_size: int) -> User:
+        user = User.objects.create(username=f"bench_{ULIDGenerator.generate()}")
+        now = timezone.now()
+        TaskModel.objects.bulk_create(
+            [
+                TaskModel(
+                    id=ULIDGenerator.generate(),
+                    title=f"Task {i}",
+                    description="x" * description_size,
+                    user=user,
+                    due_date=now if i % 2 else None,
+                )
+                for i in range(rows)
+            ],
+            batch_size=1000
+        )
+        return user
@@ -0,0 +1,279 @@
+import json
+import random
+import statistics
+import time
+import tracemalloc
+from datetime import timedelta
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, reset_queries, transaction
+from django.db.models import Count
+from django.test.utils import (
+    CaptureQueriesContext,
+    override_settings,
+    setup_test_environment,
+    teardown_test_environment,
+)
+from django.utils import timezone
+from rest_framework.test import APIClient
+from ulid import ULID
+
+from apps.todo.application.dto.task_dto import CreateTaskDTO, UpdateTaskDTO
+from apps.todo.application.use_cases.create_task import CreateTaskUseCase
+from apps.todo.application.use_cases.list_tasks import ListTasksUseCase
+from apps.todo.application.use_cases.update_task import UpdateTaskUseCase
+from apps.todo.domain.value_objects.task_status import TaskStatus
+from apps.todo.infrastructure.cache.category_catalog import CachedCategoryRepository, category_catalog
+from apps.todo.infrastructure.cache.task_list_cache import TaskListCache
+from apps.todo.infrastructure.persistence.models import Category as CategoryModel, Task as TaskModel
+from apps.todo.infrastructure.persistence.repositories.category_repository_impl import CategoryRepository
+from apps.todo.infrastructure.persistence.repositories.task_repository_impl import TaskRepository
+
+# tasks, users, categories
+DATASETS = {
+    "1k": (1_000, 10, 10),
+    "100k": (100_000, 1_000, 50),
+    "1m": (1_000_000, 10_000, 100),
+}
+SEED = 42
+SEED_BATCH_SIZE = 5000
+BENCH_USERNAME_PREFIX = "bench_user_"
+
+# Below this difference a slower time is treated as noise
+TIME_NOISE_MS = 0.2
+
+BENCH_CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+class Command(BaseCommand):
+    help = (
+        "Бенчмарки репозиториев, use case'ов и API на детерминированных данных "
+        "(1k/100k/1m задач) в тестовой БД: время, число запросов, пик памяти. "
+        "Сравнивает с сохранённым baseline и падает при регрессии. Нужна только "
+        "БД (Postgres или SQLite, см. config.settings_benchmark); кеш — в памяти."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--size", choices=DATASETS, default="1k")
+        parser.add_argument("--repeat", type=int, default=20)
+        parser.add_argument(
+            "--baseline",
+            default=str(Path(settings.BASE_DIR) / "benchmarks" / "baselines.json")
+        )
+        parser.add_argument("--save-baseline", action="store_true", help="Записать результаты как baseline")
+        parser.add_argument("--threshold", type=float, default=0.25, help="Допустимое ухудшение времени и памяти (доля)")
+        parser.add_argument("--keepdb", action="store_true", help="Не удалять тестовую БД (и засеянные данные) после прогона")
+
+    def handle(self, *args, **options):
+        # DEBUG=False: иначе queries_log (deque на 9000) заполняется и счётчик запросов врёт
+        setup_test_environment(debug=False)
+        old_name = connection.settings_dict["NAME"]
+        connection.creation.create_test_db(verbosity=0, autoclobber=True, keepdb=options["keepdb"], serialize=False)
+        try:
+            with override_settings(CACHES=BENCH_CACHES, CATEGORY_CATALOG_PUBSUB=False):
+                self._seed(options["size"])
+                category_catalog.invalidate()
+                results = self._run(options["repeat"])
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0, keepdb=options["keepdb"])
+            teardown_test_environment()
+
+        key = f"{connection.vendor}:{options['size']}"
+        baseline_path = Path(options["baseline"])
+        baselines = json.loads(baseline_path.read_text()) if baseline_path.exists() else {}
+        baseline = baselines.get(key, {})
+
+        regressions = self._report(results, baseline, options["threshold"])
+
+        if options["save_baseline"]:
+            baselines[key] = results
+            baseline_path.parent.mkdir(parents=True, exist_ok=True)
+            baseline_path.write_text(json.dumps(baselines, indent=2, sort_keys=True) + "\n")
+            self.stdout.write(f"Baseline {key} записан в {baseline_path}")
+        elif regressions:
+            raise CommandError("Регрессии производительности:\n" + "\n".join(regressions))
+
+    # Data
+
+    def _seed(self, size: str) -> None:
+        """Deterministic dataset; with --keepdb an already seeded DB is reused."""
+        tasks, users, categories = DATASETS[size]
+        if (
+            TaskModel.objects.count() == tasks
+            and User.objects.filter(username__startswith=BENCH_USERNAME_PREFIX).count() == users
+        ):
+            return
+
+        TaskModel.objects.all().delete()
+        User.objects.filter(username__startswith=BENCH_USERNAME_PREFIX).delete()
+        CategoryModel.objects.all().delete()
+
+        rng = random.Random(SEED)
+        started = time.perf_counter()
+
+        def ulid(timestamp_ms: int) -> str:
+            return str(ULID.from_bytes(timestamp_ms.to_bytes(6, "big") + rng.randbytes(10)))
+
+        base_ms = 1_700_000_000_000
+        category_ids = [ulid(base_ms + i) for i in range(categories)]
+        CategoryModel.objects.bulk_create([
+            CategoryModel(id=category_id, name=f"Category {i}", description="", color="#3B82F6")
+            for i, category_id in enumerate(category_ids)
+        ])
+        User.objects.bulk_create([
+            User(username=f"{BENCH_USERNAME_PREFIX}{i}", password="!")
+            for i in range(users)
+        ])
+        user_ids = list(
+            User.objects.filter(username__startswith=BENCH_USERNAME_PREFIX)
+            .order_by("id").values_list("id", flat=True)
+        )
+
+        due_base = timezone.now().replace(microsecond=0)
+        batch = []
+        for i in range(tasks):
+            batch.append(TaskModel(
+                id=ulid(base_ms + i * 1000),
+                title=f"Task {i}",
+                description="x" * rng.randint(0, 500),
+                user_id=user_ids[rng.randrange(users)],
+                category_id=category_ids[rng.randrange(categories)] if rng.random() < 0.7 else None,
+                due_date=due_base + timedelta(hours=rng.randint(-500, 500)) if rng.random() < 0.5 else None,
+                is_completed=rng.random() < 0.3,
+            ))
+            if len(batch) >= SEED_BATCH_SIZE:
+                TaskModel.objects.bulk_create(batch)
+                batch = []
+        TaskModel.objects.bulk_create(batch)
+
+        self.stdout.write(f"Засеяно {tasks} задач за {time.perf_counter() - started:.1f} с")
+
+    # Cases
+
+    def _cases(self):
+        """(name, callable, writes) — writes run in a rolled-back transaction."""
+        rng = random.Random(SEED)
+        task_repo = TaskRepository()
+        category_repo = CategoryRepository()
+        cached_category_repo = CachedCategoryRepository()
+
+        # The busiest user, a category and a sample of tasks to read and update
+        user_id = (
+            TaskModel.objects.values("user_id")
+            .annotate(tasks=Count("id"))
+            .order_by("-tasks", "user_id")
+            .values_list("user_id", flat=True)
+            .first()
+        )
+        user = User.objects.get(id=user_id)
+        task_ids = list(TaskModel.objects.filter(user_id=user_id).order_by("-id").values_list("id", flat=True)[:50])
+        category_id = CategoryModel.objects.order_by("id").values_list("id", flat=True).first()
+        middle_cursor = task_ids[len(task_ids) // 2]
+
+        list_use_case = ListTasksUseCase(task_repo, cached_category_repo)
+        cached_list_use_case = ListTasksUseCase(task_repo, cached_category_repo, TaskListCache())
+        create_use_case = CreateTaskUseCase(task_repo, cached_category_repo, TaskListCache())
+        update_use_case = UpdateTaskUseCase(task_repo, cached_category_repo, TaskListCache())
+
+        client = APIClient()
+        client.force_authenticate(user)
+
+        def get(path):
+            response = client.get(path)
+            if response.status_code != 200:
+                raise CommandError(f"GET {path}: {response.status_code}")
+
+        return [
+            ("repo.get_by_id", lambda: task_repo.get_by_id(rng.choice(task_ids)), False),
+            ("repo.get_many[50]", lambda: task_repo.get_many(task_ids), False),
+            ("repo.get_page_by_user_id", lambda: task_repo.get_page_by_user_id(user_id, limit=21), False),
+            ("repo.get_page_by_user_id.after", lambda: task_repo.get_page_by_user_id(user_id, after=middle_cursor, limit=21), False),
+            ("repo.get_page_by_user_id.category", lambda: task_repo.get_page_by_user_id(user_id, limit=21, category_id=category_id), False),
+            ("repo.get_page_by_user_id.open", lambda: task_repo.get_page_by_user_id(user_id, limit=21, status=TaskStatus.OPEN), False),
+            ("repo.get_page_by_user_id.overdue", lambda: task_repo.get_page_by_user_id(user_id, limit=21, status=TaskStatus.OVERDUE), False),
+            ("repo.get_by_user_id", lambda: task_repo.get_by_user_id(user_id), False),
+            ("repo.get_by_user_id.summary", lambda: task_repo.get_by_user_id(user_id, with_description=False), False),
+            ("category_repo.get_all", category_repo.get_all, False),
+            ("category_repo.get_many", lambda: category_repo.get_many([category_id]), False),
+            ("use_case.list_tasks", lambda: list_use_case.execute(user_id, limit=20), False),
+            ("use_case.list_tasks.cached", lambda: cached_list_use_case.execute(user_id, limit=20), False),
+            ("use_case.create_task", lambda: create_use_case.execute(CreateTaskDTO(
+                title="Benchmark", description="x" * 100, user_id=user_id, category_id=category_id
+            )), True),
+            ("use_case.update_task", lambda: update_use_case.execute(
+                UpdateTaskDTO(task_id=rng.choice(task_ids), title="Updated"), user_id
+            ), True),
+            ("api.tasks.list", lambda: get("/api/v1/tasks/?limit=20"), False),
+            ("api.tasks.list.open", lambda: get("/api/v1/tasks/?limit=20&status=open"), False),
+            ("api.tasks.detail", lambda: get(f"/api/v1/tasks/{rng.choice(task_ids)}/"), False),
+            ("api.categories.list", lambda: get("/api/v1/categories/"), False),
+        ]
+
+    def _run(self, repeat: int) -> dict:
+        results = {}
+        for name, func, writes in self._cases():
+            results[name] = self._measure(func, repeat, writes)
+        return results
+
+    @staticmethod
+    def _measure(func, repeat: int, writes: bool) -> dict:
+        def run():
+            if not writes:
+                return func()
+            with transaction.atomic():
+                func()
+                transaction.set_rollback(True)
+
+        run()  # прогрев: кеши, каталог категорий, соединение
+
+        reset_queries()
+        with CaptureQueriesContext(connection) as ctx:
+            run()
+        # Считаем сразу: каждый запрос к API вызывает reset_queries() и чистит лог
+        queries = len(ctx.captured_queries)
+
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            run()
+            timings.append(time.perf_counter() - started)
+
+        # Аллокации меряем отдельным прогоном: tracemalloc сильно замедляет код
+        tracemalloc.start()
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        return {
+            "time_ms": round(statistics.median(timings) * 1000, 3),
+            "queries": queries,
+            "peak_kib": round(peak / 1024, 1),
+        }
+
+    # Report
+
+    def _report(self, results: dict, baseline: dict, threshold: float) -> list:
+        regressions = []
+        self.stdout.write(f"{'case':<36} {'time ms':>10} {'queries':>8} {'peak KiB':>10}  vs baseline")
+        for name, m in results.items():
+            b = baseline.get(name)
+            note = ""
+            if b:
+                note = f"time {self._delta(m['time_ms'], b['time_ms'])}, peak {self._delta(m['peak_kib'], b['peak_kib'])}"
+                if m["queries"] > b["queries"]:
+                    regressions.append(f"{name}: запросов {b['queries']} -> {m['queries']}")
+                if m["time_ms"] > b["time_ms"] * (1 + threshold) and m["time_ms"] - b["time_ms"] > TIME_NOISE_MS:
+                    regressions.append(f"{name}: время {b['time_ms']} -> {m['time_ms']} ms")
+                if m["peak_kib"] > b["peak_kib"] * (1 + threshold):
+                    regressions.append(f"{name}: память {b['peak_kib']} -> {m['peak_kib']} KiB")
+            self.stdout.write(f"{name:<36} {m['time_ms']:>10.3f} {m['queries']:>8} {m['peak_kib']:>10.1f}  {note}")
+        return regressions
+
+    @staticmethod
+    def _delta(current: float, base: float) -> str:
+        if not base:
+            return "n/a"
+        return f"{(current - base) / base:+.0%}"
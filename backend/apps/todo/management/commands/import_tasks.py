@@ -0,0 +1,238 @@
+import csv
+import json
+import sys
+import time
+from itertools import islice
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from apps.todo.domain.entities.task import Task
+from apps.todo.domain.value_objects.task_id import ULIDGenerator
+from apps.todo.infrastructure.cache.task_list_cache import TaskListCache
+from apps.todo.infrastructure.persistence.repositories.category_repository_impl import CategoryRepository
+from apps.todo.infrastructure.persistence.repositories.task_repository_impl import TaskRepository
+
+TITLE_MAX_LENGTH = 200
+TRUE_VALUES = {"1", "true", "yes", "y", "t"}
+FALSE_VALUES = {"", "0", "false", "no", "n", "f"}
+
+
+class RowError(ValueError):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        "Импорт задач из CSV или JSONL (файл или '-' для stdin). Поля: title, description, "
+        "user (username), category (id или название), due_date (ISO 8601), is_completed. "
+        "Файл читается потоково пачками по --chunk-size строк: ULID генерируются пачкой, "
+        "строки пишутся через COPY (Postgres) или bulk_create, напоминания — в outbox "
+        "той же транзакцией. Ошибочные строки пропускаются и выводятся в stderr."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Путь к .csv/.jsonl или '-' для stdin")
+        parser.add_argument("--format", choices=["csv", "jsonl"], help="По умолчанию — по расширению файла")
+        parser.add_argument("--user", help="Username для строк без поля user")
+        parser.add_argument("--chunk-size", type=int, default=5000)
+        parser.add_argument("--max-errors", type=int, default=1000, help="Прервать импорт после стольких ошибочных строк")
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        fmt = options["format"] or Path(path).suffix.lstrip(".").lower()
+        if fmt not in ("csv", "jsonl"):
+            raise CommandError("Не удалось определить формат, укажите --format csv|jsonl")
+        if options["chunk_size"] < 1:
+            raise CommandError("--chunk-size должен быть положительным")
+
+        self.task_repo = TaskRepository()
+        self.task_list_cache = TaskListCache()
+        self.user_ids: Dict[str, int] = {}
+        self.category_ids = self._category_map()
+        self.default_user = options["user"]
+        if self.default_user and not self._resolve_users({self.default_user}):
+            raise CommandError(f"Пользователь {self.default_user} не найден")
+
+        imported = errors = 0
+        started = time.perf_counter()
+
+        stream = sys.stdin if path == "-" else open(path, encoding="utf-8", newline="")
+        try:
+            rows = self._read_csv(stream) if fmt == "csv" else self._read_jsonl(stream)
+            while True:
+                chunk = list(islice(rows, options["chunk_size"]))
+                if not chunk:
+                    break
+
+                tasks, chunk_errors = self._build_tasks(chunk)
+                errors += chunk_errors
+                if errors > options["max_errors"]:
+                    raise CommandError(
+                        f"Слишком много ошибочных строк ({errors}); импортировано {imported} задач"
+                    )
+                if not tasks:
+                    continue
+
+                # Сроки в прошлом не планируем и помечаем уведомлёнными (иначе их подберёт sweep):
+                # импорт истории не должен разослать тысячи уведомлений разом
+                with transaction.atomic():
+                    imported += self.task_repo.bulk_import(tasks, remind_after=timezone.now())
+                self._after_import(tasks)
+
+                self.stdout.write(f"Импортировано {imported} задач...")
+        finally:
+            if stream is not sys.stdin:
+                stream.close()
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Импортировано {imported} задач за {time.perf_counter() - started:.1f} с, "
+            f"ошибочных строк: {errors}"
+        ))
+
+    # Input
+
+    @staticmethod
+    def _read_csv(stream) -> Iterator[Tuple[int, dict]]:
+        reader = csv.DictReader(stream)
+        for row in reader:
+            yield reader.line_num, row
+
+    @staticmethod
+    def _read_jsonl(stream) -> Iterator[Tuple[int, dict]]:
+        for line_num, line in enumerate(stream, start=1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError as e:
+                row = e
+            yield line_num, row
+
+    # Rows -> tasks
+
+    def _build_tasks(self, chunk: List[Tuple[int, dict]]) -> Tuple[List[Task], int]:
+        """Validate a chunk and turn it into entities; invalid rows are reported and skipped."""
+        self._resolve_users({
+            username for username in (self._username(row) for _, row in chunk) if username
+        })
+
+        now = timezone.now()
+        ids = iter(ULIDGenerator.generate_many(len(chunk)))
+        tasks = []
+        errors = 0
+        for line_num, row in chunk:
+            try:
+                tasks.append(self._to_task(row, next(ids), now))
+            except RowError as e:
+                errors += 1
+                self.stderr.write(f"Строка {line_num}: {e}")
+        return tasks, errors
+
+    def _to_task(self, row, task_id: str, now) -> Task:
+        if not isinstance(row, dict):
+            raise RowError(f"некорректный JSON ({row})" if isinstance(row, Exception) else "ожидается объект")
+
+        title = str(row.get("title") or "").strip()
+        if not title:
+            raise RowError("пустой title")
+        if len(title) > TITLE_MAX_LENGTH:
+            raise RowError(f"title длиннее {TITLE_MAX_LENGTH} символов")
+
+        username = self._username(row)
+        if username is None and row.get("user") not in (None, ""):
+            raise RowError(f"некорректный user {row.get('user')!r}")
+        username = username or self.default_user
+        if not username:
+            raise RowError("не указан user (и нет --user)")
+        user_id = self.user_ids.get(username)
+        if user_id is None:
+            raise RowError(f"пользователь {username} не найден")
+
+        category_id = None
+        category = row.get("category")
+        if category:
+            category_id = self.category_ids.get(str(category))
+            if category_id is None:
+                raise RowError(f"категория {category} не найдена или название неоднозначно")
+
+        return Task(
+            id=task_id,
+            title=title,
+            description=str(row.get("description") or ""),
+            user_id=user_id,
+            category_id=category_id,
+            due_date=self._parse_due_date(row.get("due_date")),
+            is_completed=self._parse_bool(row.get("is_completed")),
+            created_at=now,
+            updated_at=now
+        )
+
+    @staticmethod
+    def _username(row) -> Optional[str]:
+        """Username from a row; only strings and numbers count, anything else is a row error."""
+        if not isinstance(row, dict):
+            return None
+        value = row.get("user")
+        if isinstance(value, bool) or not isinstance(value, (str, int)):
+            return None
+        return str(value) or None
+
+    @staticmethod
+    def _parse_due_date(value) -> Optional[object]:
+        if value in (None, ""):
+            return None
+        try:
+            due_date = parse_datetime(str(value))
+        except ValueError:
+            due_date = None
+        if due_date is None:
+            raise RowError(f"некорректный due_date {value!r}")
+        # Как DRF DateTimeField: наивное время — в текущем часовом поясе
+        if timezone.is_naive(due_date):
+            due_date = timezone.make_aware(due_date)
+        return due_date
+
+    @staticmethod
+    def _parse_bool(value) -> bool:
+        if isinstance(value, bool):
+            return value
+        text = str(value if value is not None else "").strip().lower()
+        if text in TRUE_VALUES:
+            return True
+        if text in FALSE_VALUES:
+            return False
+        raise RowError(f"некорректный is_completed {value!r}")
+
+    # Lookups
+
+    def _resolve_users(self, usernames) -> bool:
+        """Add unknown usernames to the in-memory map with one query."""
+        missing = [u for u in usernames if u not in self.user_ids]
+        if missing:
+            self.user_ids.update(
+                User.objects.filter(username__in=missing).values_list("username", "id")
+            )
+        return all(u in self.user_ids for u in usernames)
+
+    @staticmethod
+    def _category_map() -> Dict[str, Optional[str]]:
+        """id -> id and name -> id; a name shared by several categories maps to None."""
+        categories = CategoryRepository().get_all()
+        mapping: Dict[str, Optional[str]] = {}
+        for category in categories:
+            mapping[category.name] = None if category.name in mapping else category.id
+        mapping.update({category.id: category.id for category in categories})
+        return mapping
+
+    # Side effects
+
+    def _after_import(self, tasks: List[Task]) -> None:
+        """Invalidate cached lists for one committed chunk."""
+        for user_id in {t.user_id for t in tasks}:
+            self.task_list_cache.invalidate(user_id)
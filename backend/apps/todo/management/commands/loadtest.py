@@ -0,0 +1,120 @@
+import asyncio
+import random
+import secrets
+import time
+from typing import List
+
+import httpx
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.todo.infrastructure.authentication.service_authentication import sign_request
+
+
+class _ServiceAuth(httpx.Auth):
+    """Подпись запросов так же, как это делает бот."""
+
+    requires_request_body = True
+
+    def __init__(self, username: str, secret: str):
+        self.username = username
+        self.secret = secret
+
+    def auth_flow(self, request):
+        timestamp = str(int(time.time()))
+        nonce = secrets.token_urlsafe(18)
+        signature = sign_request(
+            self.secret,
+            request.method,
+            request.url.raw_path.decode("ascii"),
+            timestamp,
+            nonce,
+            self.username,
+            request.headers.get("X-Telegram-User-Id", ""),
+            request.content,
+        )
+        request.headers["Authorization"] = f"Service {self.username}:{timestamp}:{nonce}:{signature}"
+        yield request
+
+
+class Command(BaseCommand):
+    help = (
+        "Нагрузочный тест запущенного API: N параллельных «ботов» читают задачи "
+        "и категории. Запустите против WSGI и ASGI сервера и сравните RPS и p99."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--url", default="http://localhost:8000")
+        parser.add_argument("--username", default="test_user")
+        parser.add_argument("--telegram-id", type=int, default=100000)
+        parser.add_argument("--concurrency", type=int, default=50)
+        parser.add_argument("--duration", type=float, default=30.0)
+        parser.add_argument("--label", default="", help="Подпись строки результата, например wsgi/asgi")
+
+    def handle(self, *args, **options):
+        if not settings.SERVICE_AUTH_SECRET:
+            raise CommandError("SERVICE_AUTH_SECRET не задан")
+
+        latencies, errors, elapsed = asyncio.run(self._run(options))
+        if not latencies:
+            raise CommandError(f"Нет успешных запросов (ошибок: {errors})")
+
+        latencies.sort()
+
+        def percentile(q: float) -> float:
+            return latencies[min(len(latencies) - 1, int(len(latencies) * q))] * 1000
+
+        self.stdout.write(
+            f"{options['label'] or options['url']}: "
+            f"{len(latencies)} запросов, {errors} ошибок, "
+            f"{len(latencies) / elapsed:.1f} req/s, "
+            f"p50 {percentile(0.50):.1f} ms, p95 {percentile(0.95):.1f} ms, p99 {percentile(0.99):.1f} ms"
+        )
+
+    async def _run(self, options):
+        latencies: List[float] = []
+        errors = 0
+        concurrency = options["concurrency"]
+        deadline = time.monotonic() + options["duration"]
+
+        async with httpx.AsyncClient(
+            base_url=options["url"],
+            auth=_ServiceAuth(options["username"], settings.SERVICE_AUTH_SECRET),
+            timeout=30,
+            limits=httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency),
+        ) as client:
+
+            headers = {"X-Telegram-User-Id": str(options["telegram_id"])}
+
+            async def bot_user():
+                nonlocal errors
+                task_ids: List[str] = []
+                while time.monotonic() < deadline:
+                    # Смесь запросов бота: /list, выбор категории, карточка задачи
+                    roll = random.random()
+                    if roll < 0.6 or not task_ids:
+                        path = "/api/v1/tasks/?limit=20"
+                    elif roll < 0.8:
+                        path = "/api/v1/categories/"
+                    else:
+                        path = f"/api/v1/tasks/{random.choice(task_ids)}/"
+
+                    started = time.monotonic()
+                    try:
+                        response = await client.get(path, headers=headers)
+                    except httpx.HTTPError:
+                        errors += 1
+                        continue
+                    if response.status_code != 200:
+                        errors += 1
+                        continue
+                    latencies.append(time.monotonic() - started)
+
+                    if path.startswith("/api/v1/tasks/?"):
+                        task_ids = [t["id"] for t in response.json()["results"]]
+
+            started = time.monotonic()
+            await asyncio.gather(*(bot_user() for _ in range(concurrency)))
+            elapsed = time.monotonic() - started
+
+        return latencies, errors, elapsed
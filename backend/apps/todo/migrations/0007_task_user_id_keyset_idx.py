@@ -0,0 +1,19 @@
+# Generated by Django 5.0.1 on 2026-10-18 14:39
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('todo', '0006_create_test_category'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['user', '-id'], name='tasks_user_id_685f2d_idx'),
+        ),
+    ]
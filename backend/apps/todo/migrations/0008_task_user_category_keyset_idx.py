@@ -0,0 +1,19 @@
+# Generated by Django 5.0.1 on 2026-10-18 14:40
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('todo', '0007_task_user_id_keyset_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['user', 'category', '-id'], name='tasks_user_id_006851_idx'),
+        ),
+    ]
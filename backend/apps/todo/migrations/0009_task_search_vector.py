@@ -0,0 +1,81 @@
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.conf import settings
+from django.contrib.postgres.operations import BtreeGinExtension
+from django.db import migrations
+
+SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('russian', coalesce({row}title, '')), 'A') || "
+    "setweight(to_tsvector('russian', coalesce({row}description, '')), 'B')"
+)
+
+CREATE_TRIGGER_SQL = f"""
+CREATE FUNCTION tasks_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector := {SEARCH_VECTOR_SQL.format(row="NEW.")};
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER tasks_search_vector_trigger
+BEFORE INSERT OR UPDATE OF title, description ON tasks
+FOR EACH ROW EXECUTE FUNCTION tasks_search_vector_update();
+
+UPDATE tasks SET search_vector = {SEARCH_VECTOR_SQL.format(row="")};
+"""
+
+DROP_TRIGGER_SQL = """
+DROP TRIGGER IF EXISTS tasks_search_vector_trigger ON tasks;
+DROP FUNCTION IF EXISTS tasks_search_vector_update();
+"""
+
+SEARCH_INDEX = django.contrib.postgres.indexes.GinIndex(
+    fields=['user', 'search_vector'], name='tasks_user_search_gin'
+)
+
+
+# tsvector, триггер и GIN есть только в PostgreSQL; на других БД поиск идёт через icontains
+def create_search_trigger(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(CREATE_TRIGGER_SQL)
+
+
+def drop_search_trigger(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(DROP_TRIGGER_SQL)
+
+
+def add_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.add_index(apps.get_model('todo', 'Task'), SEARCH_INDEX)
+
+
+def remove_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.remove_index(apps.get_model('todo', 'Task'), SEARCH_INDEX)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('todo', '0008_task_user_category_keyset_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        BtreeGinExtension(),
+        migrations.AddField(
+            model_name='task',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunPython(create_search_trigger, drop_search_trigger),
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddIndex(model_name='task', index=SEARCH_INDEX),
+            ],
+            database_operations=[
+                migrations.RunPython(add_search_index, remove_search_index),
+            ],
+        ),
+    ]
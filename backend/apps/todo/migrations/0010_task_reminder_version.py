@@ -0,0 +1,22 @@
+# Generated by Django 5.1.4 on 2026-10-18 15:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('todo', '0009_task_search_vector'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='task',
+            name='celery_task_id',
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='reminder_version',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.1.4 on 2026-10-18 15:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('todo', '0010_task_reminder_version'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReminderOutboxEntry',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('task_id', models.CharField(max_length=26)),
+                ('version', models.PositiveIntegerField()),
+                ('due_date', models.DateTimeField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'db_table': 'reminder_outbox',
+            },
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.1.4 on 2026-10-18 15:19
+
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import F
+from django.utils import timezone
+
+
+# Напоминания, срок которых уже прошёл, разосланы прежним поллером: помечаем их, чтобы
+# первый запуск sweep_missed_reminders не повторил их. Дальше окна sweep не смотрит
+def mark_past_reminders_notified(apps, schema_editor):
+    Task = apps.get_model('todo', 'Task')
+    now = timezone.now()
+    Task.objects.filter(
+        is_completed=False,
+        due_date__lt=now,
+        due_date__gte=now - timedelta(seconds=settings.REMINDER_SWEEP_LOOKBACK),
+    ).update(notified_version=F('reminder_version'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('todo', '0012_task_status_partial_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='notified_version',
+            field=models.PositiveIntegerField(editable=False, null=True),
+        ),
+        migrations.RunPython(mark_past_reminders_notified, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(condition=models.Q(('is_completed', False)), fields=['due_date', 'id'], name='tasks_open_due_id_idx'),
+        ),
+    ]
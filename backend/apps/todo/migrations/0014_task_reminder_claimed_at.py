@@ -0,0 +1,24 @@
+# Generated by Django 5.1.4 on 2026-10-18 15:31
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('todo', '0013_task_notified_version'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='reminder_claimed_at',
+            field=models.DateTimeField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(condition=models.Q(('reminder_claimed_at__isnull', False)), fields=['reminder_claimed_at'], name='tasks_reminder_claim_idx'),
+        ),
+    ]
@@ -1,8 +1,19 @@
 from django import forms
 from django.contrib import admin
+from django.contrib.auth.models import User
+from django.contrib.postgres.search import SearchQuery
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models import Q
 
 from apps.todo.domain.value_objects.task_id import ULIDGenerator
-from apps.todo.infrastructure.persistence.models import Task, Category, UserProfile
+from apps.todo.infrastructure.persistence.models import SEARCH_CONFIG, Task, Category, UserProfile
+from apps.todo.infrastructure.middleware.telegram_user_middleware import PROFILE_CACHE_KEY
+from apps.todo.infrastructure.cache.task_list_cache import TaskListCache
+from apps.todo.infrastructure.cache.category_catalog import category_catalog
+from apps.todo.infrastructure.scheduling.reminder_outbox import reminder_outbox
+from apps.todo.presentation.admin.filters import CategoryFilter, CreatedAtFilter
+from apps.todo.presentation.admin.paginator import EstimatedCountPaginator
 
 
 class CategoryAdminForm(forms.ModelForm):
@@ -54,6 +65,24 @@ class CategoryAdmin(admin.ModelAdmin):
             ("Основная информация", {"fields": ("name", "description", "color")}),
         )
 
+    # Сбрасываем каталог категорий во всех процессах; списки задач содержат
+    # названия категорий — сбрасываем и их кеш
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        category_catalog.invalidate()
+        if change:
+            TaskListCache().invalidate_all()
+
+    def delete_model(self, request, obj):
+        super().delete_model(request, obj)
+        category_catalog.invalidate()
+        TaskListCache().invalidate_all()
+
+    def delete_queryset(self, request, queryset):
+        super().delete_queryset(request, queryset)
+        category_catalog.invalidate()
+        TaskListCache().invalidate_all()
+
 
 @admin.register(Task)
 class TaskAdmin(admin.ModelAdmin):
@@ -61,8 +90,28 @@ class TaskAdmin(admin.ModelAdmin):
 
     list_display = ["id", "title", "user", "category", "due_date", "is_completed", "created_at"]
     search_fields = ["title", "description", "user__username"]
-    list_filter = ["is_completed", "category", "due_date", "created_at"]
-    date_hierarchy = "due_date"
+    list_filter = ["is_completed", CategoryFilter, "due_date", ("created_at", CreatedAtFilter)]
+
+    # Таблица на миллионы строк: связанные объекты одним JOIN, выбор пользователя
+    # и категории через autocomplete, сортировка по индексу PK, без точных COUNT(*)
+    # и без date_hierarchy (он строит список дат по всей таблице)
+    list_select_related = ["user", "category"]
+    autocomplete_fields = ["user", "category"]
+    ordering = ["-id"]
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    show_facets = admin.ShowFacets.NEVER
+
+    # На PostgreSQL ищем по search_vector (GIN-индекс) вместо icontains по всей таблице;
+    # user__username — только точное совпадение: id пользователя находим по уникальному
+    # индексу username, и Postgres объединяет GIN и индекс user_id через BitmapOr
+    def get_search_results(self, request, queryset, search_term):
+        search_term = search_term.strip()
+        if search_term and connection.vendor == "postgresql":
+            query = SearchQuery(search_term, config=SEARCH_CONFIG, search_type="websearch")
+            user_ids = list(User.objects.filter(username=search_term).values_list("id", flat=True))
+            return queryset.filter(Q(search_vector=query) | Q(user_id__in=user_ids)), False
+        return super().get_search_results(request, queryset, search_term)
 
     def get_readonly_fields(self, request, obj=None):
         if obj:
@@ -80,9 +129,50 @@ class TaskAdmin(admin.ModelAdmin):
             base.append(("Даты", {"fields": ("created_at", "updated_at")}))
         return base
 
+    # Смена срока или статуса — новая версия расписания: прежнее напоминание
+    # отбросится само, новое пишем в outbox в транзакции сохранения. Сбрасываем кеш списков задач затронутых пользователей
+    def save_model(self, request, obj, form, change):
+        reschedule = not change or {"due_date", "is_completed"} & set(form.changed_data)
+        with transaction.atomic():
+            if change and reschedule:
+                # Версию берём под той же блокировкой строки, что и TaskRepository.update:
+                # версия из формы могла устареть, и параллельный PATCH потерял бы свой инкремент
+                current = (
+                    Task.objects.select_for_update()
+                    .values_list("reminder_version", flat=True)
+                    .get(id=obj.id)
+                )
+                obj.reminder_version = current + 1
+            super().save_model(request, obj, form, change)
+            if reschedule and obj.due_date and not obj.is_completed:
+                reminder_outbox.add_many([(obj.id, obj.reminder_version, obj.due_date)])
+
+        list_cache = TaskListCache()
+        list_cache.invalidate(obj.user_id)
+        previous_user_id = form.initial.get("user")
+        if previous_user_id and previous_user_id != obj.user_id:
+            list_cache.invalidate(previous_user_id)
+
+    def delete_model(self, request, obj):
+        super().delete_model(request, obj)
+        TaskListCache().invalidate(obj.user_id)
+
+    def delete_queryset(self, request, queryset):
+        user_ids = set(queryset.values_list("user_id", flat=True))
+        super().delete_queryset(request, queryset)
+        list_cache = TaskListCache()
+        for user_id in user_ids:
+            list_cache.invalidate(user_id)
+
 
 @admin.register(UserProfile)
 class UserProfileAdmin(admin.ModelAdmin):
     list_display = ["user", "telegram_id"]
+    list_select_related = ["user"]
     search_fields = ["user__username"]
     readonly_fields = ["user"]
+
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        # Сбрасываем кеш связки, чтобы TelegramUserMiddleware перечитал профиль
+        cache.delete(PROFILE_CACHE_KEY.format(user_id=obj.user_id))
@@ -0,0 +1,43 @@
+import json
+
+from django.conf import settings
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Пагинатор для больших таблиц PostgreSQL.
+
+    Точный COUNT(*) по миллионам строк — это полный проход по таблице на каждую
+    страницу списка. Если оценка планировщика (pg_class.reltuples без фильтров,
+    EXPLAIN с фильтрами) не меньше ADMIN_ESTIMATED_COUNT_THRESHOLD, отдаём её;
+    на небольших выборках и других БД считаем точно. Число страниц при этом
+    приблизительное.
+    """
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        connection = connections[queryset.db]
+        if connection.vendor == "postgresql":
+            estimate = self._estimate(queryset, connection)
+            if estimate >= settings.ADMIN_ESTIMATED_COUNT_THRESHOLD:
+                return estimate
+        return super().count
+
+    @staticmethod
+    def _estimate(queryset, connection) -> int:
+        if not queryset.query.where:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT reltuples FROM pg_class WHERE oid = %s::regclass",
+                    [queryset.model._meta.db_table]
+                )
+                row = cursor.fetchone()
+            # -1: таблицу ещё не анализировали — тогда спросим EXPLAIN
+            if row and row[0] >= 0:
+                return int(row[0])
+        plan = json.loads(queryset.explain(format="json"))
+        return int(plan[0]["Plan"]["Plan Rows"])
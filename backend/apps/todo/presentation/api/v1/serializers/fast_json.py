@@ -0,0 +1,109 @@
+"""
+Fast JSON rendering for read endpoints.
+
+Builds response bytes straight from DTO/entity attributes with orjson,
+skipping asdict() and per-field DRF serialization. The output is
+byte-identical to TaskSerializer/CategorySerializer rendered by DRF's
+JSONRenderer, so it is only used when that renderer was negotiated.
+"""
+from datetime import datetime, timezone as dt_timezone
+from typing import Iterable, Optional
+
+import orjson
+from django.conf import settings
+from django.http import HttpResponse
+from django.utils import timezone
+from django.utils.http import parse_header_parameters
+from rest_framework.renderers import JSONRenderer
+from rest_framework.settings import api_settings
+
+
+def accepts_fast_json(request) -> bool:
+    """True if DRF would render this response with plain, compact JSONRenderer."""
+    if type(request.accepted_renderer) is not JSONRenderer:
+        return False
+    if not (api_settings.UNICODE_JSON and api_settings.COMPACT_JSON):
+        return False
+    _, params = parse_header_parameters(request.accepted_media_type or "")
+    return "indent" not in params
+
+
+def fast_json_response(content: bytes, status: int = 200, headers: Optional[dict] = None) -> HttpResponse:
+    """Wrap pre-rendered JSON the way DRF's Response would."""
+    return HttpResponse(content, status=status, content_type=JSONRenderer.media_type, headers=headers)
+
+
+def render_task(task, category_name: Optional[str]) -> bytes:
+    """Render one task (TaskDTO or Task entity) like TaskSerializer(...).data."""
+    return _dumps(_task(task, category_name, current_timezone()))
+
+
+def render_task_page(page) -> bytes:
+    """Render a TaskPageDTO as {"next": ..., "results": [...]}."""
+    tz = current_timezone()
+    return _dumps({
+        "next": page.next_cursor,
+        "results": [_task(t, t.category_name, tz) for t in page.items],
+    })
+
+
+def render_task_results(tasks) -> bytes:
+    """Render a list of TaskDTOs as {"results": [...]}."""
+    tz = current_timezone()
+    return _dumps({"results": [_task(t, t.category_name, tz) for t in tasks]})
+
+
+def render_categories(categories: Iterable) -> bytes:
+    """Render categories like CategorySerializer(many=True).data."""
+    tz = current_timezone()
+    return _dumps([
+        {
+            "id": c.id,
+            "name": c.name,
+            "description": c.description,
+            "color": c.color,
+            "created_at": format_datetime(c.created_at, tz),
+            "updated_at": format_datetime(c.updated_at, tz),
+        }
+        for c in categories
+    ])
+
+
+def _task(task, category_name: Optional[str], tz) -> dict:
+    # Same keys, order and None handling as TaskSerializer
+    return {
+        "id": task.id,
+        "title": task.title,
+        "description": task.description,
+        "user_id": task.user_id,
+        "category_id": task.category_id,
+        "category_name": category_name,
+        "due_date": format_datetime(task.due_date, tz),
+        "is_completed": task.is_completed,
+        "created_at": format_datetime(task.created_at, tz),
+        "updated_at": format_datetime(task.updated_at, tz),
+    }
+
+
+def current_timezone():
+    """Timezone DRF renders datetimes in (None when USE_TZ is off)."""
+    return timezone.get_current_timezone() if settings.USE_TZ else None
+
+
+def format_datetime(value: Optional[datetime], tz) -> Optional[str]:
+    """DateTimeField.to_representation with the default ISO 8601 format."""
+    if not value:
+        return None
+    if tz is not None:
+        value = value.astimezone(tz) if timezone.is_aware(value) else timezone.make_aware(value, tz)
+    elif timezone.is_aware(value):
+        value = timezone.make_naive(value, dt_timezone.utc)
+    value = value.isoformat()
+    if value.endswith("+00:00"):
+        value = value[:-6] + "Z"
+    return value
+
+
+def _dumps(data) -> bytes:
+    # JSONRenderer escapes U+2028/U+2029 for JavaScript; orjson leaves them raw
+    return orjson.dumps(data).replace(b"\xe2\x80\xa8", b"\\u2028").replace(b"\xe2\x80\xa9", b"\\u2029")
@@ -1,6 +1,10 @@
 from rest_framework import serializers
+from django.conf import settings
 from django.contrib.auth.models import User
 
+from apps.todo.domain.value_objects.task_id import ULIDGenerator
+from apps.todo.domain.value_objects.task_status import TaskStatus
+
 
 class TaskSerializer(serializers.Serializer):
     """Task serializer."""
@@ -17,6 +21,24 @@ class TaskSerializer(serializers.Serializer):
     updated_at = serializers.DateTimeField(read_only=True)
 
 
+class TaskListFilterSerializer(serializers.Serializer):
+    """Task list filters from the query string."""
+
+    status = serializers.ChoiceField(choices=[s.value for s in TaskStatus], required=False)
+    due_before = serializers.DateTimeField(required=False)
+    due_after = serializers.DateTimeField(required=False)
+    # Existence is checked by the view against the category catalog
+    category_id = serializers.CharField(required=False)
+
+    def validate_status(self, value):
+        return TaskStatus(value)
+
+    def validate_category_id(self, value):
+        if not ULIDGenerator.is_valid(value):
+            raise serializers.ValidationError("Invalid category id")
+        return value.upper()
+
+
 class CreateTaskSerializer(serializers.Serializer):
     """Create task serializer."""
 
@@ -34,3 +56,26 @@ class UpdateTaskSerializer(serializers.Serializer):
     category_id = serializers.CharField(required=False, allow_null=True)
     due_date = serializers.DateTimeField(required=False, allow_null=True)
     is_completed = serializers.BooleanField(required=False)
+
+
+class BulkUpdateTaskItemSerializer(UpdateTaskSerializer):
+    """Single update item of a bulk request."""
+
+    id = serializers.CharField()
+
+
+class BulkTaskSerializer(serializers.Serializer):
+    """Bulk create/update tasks serializer."""
+
+    create = CreateTaskSerializer(many=True, required=False, default=list)
+    update = BulkUpdateTaskItemSerializer(many=True, required=False, default=list)
+
+    def validate(self, attrs):
+        total = len(attrs["create"]) + len(attrs["update"])
+        if not total:
+            raise serializers.ValidationError("Nothing to create or update")
+        if total > settings.TASKS_BULK_MAX_ITEMS:
+            raise serializers.ValidationError(
+                f"At most {settings.TASKS_BULK_MAX_ITEMS} items per request"
+            )
+        return attrs
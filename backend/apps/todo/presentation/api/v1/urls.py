@@ -3,19 +3,29 @@ from django.urls import path
 
 from apps.todo.presentation.api.v1.views.task_views import (
     TaskListCreateView,
+    TaskBulkView,
+    TaskExportView,
+    TaskSearchView,
     TaskDetailView
 )
 from apps.todo.presentation.api.v1.views.category_views import (
     CategoryListCreateView,
     CategoryDetailView
 )
+from apps.todo.presentation.api.v1.views.metrics_views import DbPoolStatsView
 
 urlpatterns = [
     # Tasks
     path('tasks/', TaskListCreateView.as_view(), name='task-list-create'),
+    path('tasks/bulk/', TaskBulkView.as_view(), name='task-bulk'),
+    path('tasks/export/', TaskExportView.as_view(), name='task-export'),
+    path('tasks/search/', TaskSearchView.as_view(), name='task-search'),
     path('tasks/<str:task_id>/', TaskDetailView.as_view(), name='task-detail'),
 
     # Categories
     path('categories/', CategoryListCreateView.as_view(), name='category-list-create'),
     path('categories/<str:category_id>/', CategoryDetailView.as_view(), name='category-detail'),
+
+    # Metrics
+    path('metrics/db-pool/', DbPoolStatsView.as_view(), name='metrics-db-pool'),
 ]
@@ -1,5 +1,6 @@
 """Category API views."""
-from rest_framework.views import APIView
+from adrf.views import APIView
+from asgiref.sync import sync_to_async
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
@@ -12,7 +13,14 @@ from apps.todo.application.use_cases.category_use_cases import (
     DeleteCategoryUseCase
 )
 from apps.todo.application.dto.category_dto import CreateCategoryDTO, UpdateCategoryDTO
-from apps.todo.infrastructure.persistence.repositories.category_repository_impl import CategoryRepository
+from apps.todo.infrastructure.cache.category_catalog import CachedCategoryRepository
+from apps.todo.infrastructure.cache.task_list_cache import TaskListCache
+from apps.todo.presentation.api.v1.views.etag import make_etag, is_not_modified
+from apps.todo.presentation.api.v1.serializers.fast_json import (
+    accepts_fast_json,
+    fast_json_response,
+    render_categories
+)
 from apps.todo.presentation.api.v1.serializers.category_serializers import (
     CategorySerializer,
     CreateCategorySerializer,
@@ -22,20 +30,33 @@ from apps.todo.domain.exceptions.exceptions import CategoryNotFoundException
 
 
 class CategoryListCreateView(APIView):
-    """List and create categories."""
+    """List and create categories (async)."""
 
     permission_classes = [IsAuthenticated]
 
-    def get(self, request):
+    async def get(self, request):
         """List all categories."""
         try:
-            category_repo = CategoryRepository()
+            category_repo = CachedCategoryRepository()
             use_case = ListCategoriesUseCase(category_repo)
 
-            categories = use_case.execute()
+            categories = await use_case.aexecute()
+
+            # Категории читаются из каталога в памяти — ETag не стоит запроса в БД
+            etag = make_etag(
+                "categories",
+                len(categories),
+                max((c.updated_at for c in categories), default=None)
+            )
+            if is_not_modified(request, etag):
+                return Response(status=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+            if accepts_fast_json(request):
+                return fast_json_response(render_categories(categories), headers={"ETag": etag})
+
             serializer = CategorySerializer([asdict(c) for c in categories], many=True)
 
-            return Response(serializer.data)
+            return Response(serializer.data, headers={"ETag": etag})
 
         except Exception as e:
             return Response(
@@ -43,17 +64,18 @@ class CategoryListCreateView(APIView):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
-    def post(self, request):
+    async def post(self, request):
         """Create a new category."""
         try:
             serializer = CreateCategorySerializer(data=request.data)
             serializer.is_valid(raise_exception=True)
 
-            category_repo = CategoryRepository()
+            category_repo = CachedCategoryRepository()
             use_case = CreateCategoryUseCase(category_repo)
 
             dto = CreateCategoryDTO(**serializer.validated_data)
-            category = use_case.execute(dto)
+            # Запись категории инвалидирует каталог через on_commit — выполняем синхронно в потоке
+            category = await sync_to_async(use_case.execute)(dto)
 
             response_serializer = CategorySerializer(asdict(category))
             return Response(
@@ -69,15 +91,15 @@ class CategoryListCreateView(APIView):
 
 
 class CategoryDetailView(APIView):
-    """Retrieve, update, and delete a category."""
+    """Retrieve, update, and delete a category (async)."""
 
     permission_classes = [IsAuthenticated]
 
-    def get(self, request, category_id):
+    async def get(self, request, category_id):
         """Get category by ID."""
         try:
-            category_repo = CategoryRepository()
-            category = category_repo.get_by_id(category_id)
+            category_repo = CachedCategoryRepository()
+            category = await category_repo.aget_by_id(category_id)
 
             if not category:
                 return Response(
@@ -94,21 +116,21 @@ class CategoryDetailView(APIView):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
-    def patch(self, request, category_id):
+    async def patch(self, request, category_id):
         """Update category."""
         try:
             serializer = UpdateCategorySerializer(data=request.data)
             serializer.is_valid(raise_exception=True)
 
-            category_repo = CategoryRepository()
-            use_case = UpdateCategoryUseCase(category_repo)
+            category_repo = CachedCategoryRepository()
+            use_case = UpdateCategoryUseCase(category_repo, TaskListCache())
 
             dto = UpdateCategoryDTO(
                 category_id=category_id,
                 **serializer.validated_data
             )
 
-            category = use_case.execute(dto)
+            category = await sync_to_async(use_case.execute)(dto)
             response_serializer = CategorySerializer(asdict(category))
 
             return Response(response_serializer.data)
@@ -124,13 +146,13 @@ class CategoryDetailView(APIView):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
-    def delete(self, request, category_id):
+    async def delete(self, request, category_id):
         """Delete category."""
         try:
-            category_repo = CategoryRepository()
-            use_case = DeleteCategoryUseCase(category_repo)
+            category_repo = CachedCategoryRepository()
+            use_case = DeleteCategoryUseCase(category_repo, TaskListCache())
 
-            success = use_case.execute(category_id)
+            success = await sync_to_async(use_case.execute)(category_id)
 
             if success:
                 return Response(status=status.HTTP_204_NO_CONTENT)
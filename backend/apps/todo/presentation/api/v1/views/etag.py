@@ -0,0 +1,18 @@
+"""Conditional GET helpers (ETag / If-None-Match)."""
+import hashlib
+
+
+def make_etag(*parts) -> str:
+    """Strong ETag from cheap fingerprint parts."""
+    digest = hashlib.sha1("|".join(str(p) for p in parts).encode()).hexdigest()
+    return f'"{digest}"'
+
+
+def is_not_modified(request, etag: str) -> bool:
+    """True if the client's If-None-Match already has this ETag."""
+    header = request.headers.get("If-None-Match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    return etag in (tag.strip() for tag in header.split(","))
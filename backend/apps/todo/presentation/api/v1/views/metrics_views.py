@@ -0,0 +1,19 @@
+"""Operational metrics views."""
+from adrf.views import APIView
+from rest_framework.response import Response
+from rest_framework.permissions import IsAdminUser
+
+from apps.todo.infrastructure.persistence.pool import pool_stats
+
+
+class DbPoolStatsView(APIView):
+    """Connection pool stats of the process that served the request."""
+
+    permission_classes = [IsAdminUser]
+
+    async def get(self, request):
+        """Get pool size, utilization and wait time."""
+        stats = pool_stats()
+        if stats is None:
+            return Response({"enabled": False})
+        return Response({"enabled": True, **stats})
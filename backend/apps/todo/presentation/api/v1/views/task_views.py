@@ -1,90 +1,150 @@
 """Task API views."""
-from rest_framework.views import APIView
+from adrf.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.settings import api_settings
+from rest_framework.exceptions import ValidationError
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.db import transaction
+from django.http import StreamingHttpResponse
 from dataclasses import asdict
 
 from apps.todo.application.use_cases.create_task import CreateTaskUseCase
 from apps.todo.application.use_cases.list_tasks import ListTasksUseCase
 from apps.todo.application.use_cases.update_task import UpdateTaskUseCase
 from apps.todo.application.use_cases.delete_task import DeleteTaskUseCase
+from apps.todo.application.use_cases.bulk_tasks import BulkUpsertTasksUseCase
+from apps.todo.application.use_cases.export_tasks import ExportTasksUseCase
+from apps.todo.application.use_cases.search_tasks import SearchTasksUseCase
 from apps.todo.application.dto.task_dto import CreateTaskDTO, UpdateTaskDTO
+from apps.todo.domain.value_objects.task_id import ULIDGenerator
+from apps.todo.domain.value_objects.task_status import TaskStatus
 from apps.todo.infrastructure.persistence.repositories.task_repository_impl import TaskRepository
-from apps.todo.infrastructure.persistence.repositories.category_repository_impl import CategoryRepository
-from apps.todo.infrastructure.persistence.models import Task as TaskModel
+from apps.todo.infrastructure.cache.category_catalog import CachedCategoryRepository
+from apps.todo.infrastructure.cache.task_list_cache import TaskListCache
+from apps.todo.presentation.api.v1.views.etag import make_etag, is_not_modified
+from apps.todo.presentation.api.v1.serializers.fast_json import (
+    accepts_fast_json,
+    fast_json_response,
+    render_task,
+    render_task_page,
+    render_task_results
+)
+from apps.todo.presentation.api.v1.serializers.task_export import (
+    EXPORT_ENCODERS,
+    astream_export,
+    stream_export
+)
 from apps.todo.presentation.api.v1.serializers.task_serializers import (
     TaskSerializer,
     CreateTaskSerializer,
-    UpdateTaskSerializer
+    UpdateTaskSerializer,
+    BulkTaskSerializer,
+    TaskListFilterSerializer
 )
 from apps.todo.domain.exceptions.exceptions import (
     TaskNotFoundException,
     CategoryNotFoundException,
+    InvalidTaskDataException,
     UnauthorizedAccessException
 )
 
 
-def _schedule_notification(task_id: str, due_date_str) -> str | None:
-    """Планирует Celery-таск на точное время срока задачи. Возвращает celery_task_id."""
-    if not due_date_str:
-        return None
-    try:
-        from datetime import datetime
-        from apps.todo.infrastructure.tasks.notifications import notify_task_due
-
-        due_dt = datetime.fromisoformat(str(due_date_str))
-        result = notify_task_due.apply_async(args=[task_id], eta=due_dt)
-        return result.id
-    except Exception as e:
-        print(f"[schedule] Ошибка планирования уведомления для задачи {task_id}: {e}")
-        return None
-
-
-def _revoke_notification(celery_task_id: str) -> None:
-    """Отменяет запланированный Celery-таск."""
-    if not celery_task_id:
-        return
-    try:
-        from config.celery import app as celery_app
-        celery_app.control.revoke(celery_task_id, terminate=True)
-    except Exception as e:
-        print(f"[revoke] Ошибка отмены Celery-таска {celery_task_id}: {e}")
-
-
 class TaskListCreateView(APIView):
-    """List and create tasks."""
+    """List and create tasks (async)."""
 
     permission_classes = [IsAuthenticated]
 
-    def get(self, request):
-        """List tasks for current user."""
+    async def get(self, request):
+        """List tasks for current user, one keyset page at a time."""
         try:
+            after = request.query_params.get('after')
+            if after:
+                if not ULIDGenerator.is_valid(after):
+                    return Response(
+                        {"error": "Invalid cursor"},
+                        status=status.HTTP_400_BAD_REQUEST
+                    )
+                after = after.upper()
+
+            try:
+                limit = int(request.query_params.get('limit', api_settings.PAGE_SIZE))
+            except ValueError:
+                return Response(
+                    {"error": "Invalid limit"},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            limit = max(1, min(limit, settings.TASKS_MAX_PAGE_SIZE))
+
+            filter_serializer = TaskListFilterSerializer(data=request.query_params)
+            filter_serializer.is_valid(raise_exception=True)
+            filters = dict(filter_serializer.validated_data)
+
             task_repo = TaskRepository()
-            category_repo = CategoryRepository()
-            use_case = ListTasksUseCase(task_repo, category_repo)
+            category_repo = CachedCategoryRepository()
+            category_id = filters.pop('category_id', None)
+            # Каталог категорий в памяти: несуществующая категория — 400, а не пустой
+            # список, который ещё и закешировался бы под отдельным ключом
+            if category_id and not await category_repo.aget_by_id(category_id):
+                return Response(
+                    {"error": {"category_id": ["Category not found"]}},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
 
-            category_id = request.query_params.get('category_id')
-            tasks = use_case.execute(request.user.id, category_id)
+            list_cache = TaskListCache()
+
+            # ETag — версии кеша списков пользователя и параметры страницы: любая запись
+            # задач пользователя (или категорий) меняет версию, запроса к БД нет.
+            # overdue зависит от текущего времени, а не от записей: без ETag и кеша списков
+            headers = {}
+            version_tag = None
+            if filters.get('status') != TaskStatus.OVERDUE:
+                version_tag = await list_cache.aget_version_tag(request.user.id)
+            if version_tag:
+                etag = make_etag(
+                    "tasks", request.user.id, version_tag, category_id, after, limit,
+                    *[filters.get(name) for name in ('status', 'due_before', 'due_after')]
+                )
+                if is_not_modified(request, etag):
+                    return Response(status=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+                headers["ETag"] = etag
 
-            serializer = TaskSerializer([asdict(t) for t in tasks], many=True)
-            return Response(serializer.data)
+            use_case = ListTasksUseCase(task_repo, category_repo, list_cache)
+            page = await use_case.aexecute(
+                request.user.id, category_id, after=after, limit=limit, **filters
+            )
 
+            if accepts_fast_json(request):
+                return fast_json_response(render_task_page(page), headers=headers)
+
+            serializer = TaskSerializer([asdict(t) for t in page.items], many=True)
+            return Response({
+                "next": page.next_cursor,
+                "results": serializer.data,
+            }, headers=headers)
+
+        except ValidationError as e:
+            return Response(
+                {"error": e.detail},
+                status=status.HTTP_400_BAD_REQUEST
+            )
         except Exception as e:
             return Response(
                 {"error": str(e)},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
-    def post(self, request):
+    async def post(self, request):
         """Create a new task."""
         try:
             serializer = CreateTaskSerializer(data=request.data)
             serializer.is_valid(raise_exception=True)
 
             task_repo = TaskRepository()
-            category_repo = CategoryRepository()
-            use_case = CreateTaskUseCase(task_repo, category_repo)
+            category_repo = CachedCategoryRepository()
+            use_case = CreateTaskUseCase(task_repo, category_repo, TaskListCache())
 
             dto = CreateTaskDTO(
                 title=serializer.validated_data['title'],
@@ -94,13 +154,8 @@ class TaskListCreateView(APIView):
                 due_date=serializer.validated_data.get('due_date')
             )
 
-            task = use_case.execute(dto)
-
-            # Планируем точное уведомление на срок задачи
-            if task.due_date:
-                celery_task_id = _schedule_notification(task.id, task.due_date)
-                if celery_task_id:
-                    TaskModel.objects.filter(id=task.id).update(celery_task_id=celery_task_id)
+            # Напоминание записано в outbox той же транзакцией, что и задача
+            task = await use_case.aexecute(dto)
 
             response_serializer = TaskSerializer(asdict(task))
             return Response(
@@ -120,16 +175,154 @@ class TaskListCreateView(APIView):
             )
 
 
+class TaskBulkView(APIView):
+    """Create and update many tasks in one request."""
+
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        """Bulk create/update tasks in one transaction."""
+        try:
+            serializer = BulkTaskSerializer(data=request.data)
+            serializer.is_valid(raise_exception=True)
+
+            creates = [
+                CreateTaskDTO(user_id=request.user.id, **item)
+                for item in serializer.validated_data['create']
+            ]
+            updates = [
+                UpdateTaskDTO(task_id=item.pop('id'), **item)
+                for item in serializer.validated_data['update']
+            ]
+
+            task_repo = TaskRepository()
+            category_repo = CachedCategoryRepository()
+            use_case = BulkUpsertTasksUseCase(task_repo, category_repo, TaskListCache())
+
+            with transaction.atomic():
+                # Напоминания попадают в outbox в этой же транзакции
+                result = use_case.execute(creates, updates, request.user.id)
+
+            return Response({
+                "created": TaskSerializer([asdict(t) for t in result.created], many=True).data,
+                "updated": TaskSerializer([asdict(t) for t in result.updated], many=True).data,
+            })
+
+        except (ValidationError, InvalidTaskDataException) as e:
+            return Response(
+                {"error": e.detail if isinstance(e, ValidationError) else str(e)},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        except (TaskNotFoundException, CategoryNotFoundException) as e:
+            return Response(
+                {"error": str(e)},
+                status=status.HTTP_404_NOT_FOUND
+            )
+        except UnauthorizedAccessException as e:
+            return Response(
+                {"error": str(e)},
+                status=status.HTTP_403_FORBIDDEN
+            )
+        except Exception as e:
+            return Response(
+                {"error": str(e)},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+
+class TaskSearchView(APIView):
+    """Full-text search over the current user's tasks (async)."""
+
+    permission_classes = [IsAuthenticated]
+
+    async def get(self, request):
+        """Search tasks by title and description, best matches first."""
+        try:
+            query = request.query_params.get('q', '').strip()
+            if not query:
+                return Response(
+                    {"error": "Query parameter 'q' is required"},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            if len(query) > settings.TASKS_SEARCH_MAX_QUERY_LENGTH:
+                return Response(
+                    {"error": f"Query is longer than {settings.TASKS_SEARCH_MAX_QUERY_LENGTH} characters"},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+
+            try:
+                limit = int(request.query_params.get('limit', api_settings.PAGE_SIZE))
+            except ValueError:
+                return Response(
+                    {"error": "Invalid limit"},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            limit = max(1, min(limit, settings.TASKS_MAX_PAGE_SIZE))
+
+            use_case = SearchTasksUseCase(TaskRepository(), CachedCategoryRepository())
+            tasks = await use_case.aexecute(request.user.id, query, limit)
+
+            if accepts_fast_json(request):
+                return fast_json_response(render_task_results(tasks))
+
+            serializer = TaskSerializer([asdict(t) for t in tasks], many=True)
+            return Response({"results": serializer.data})
+
+        except Exception as e:
+            return Response(
+                {"error": str(e)},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+
+class TaskExportView(APIView):
+    """Stream all tasks of the current user as NDJSON or CSV."""
+
+    permission_classes = [IsAuthenticated]
+
+    async def get(self, request):
+        """Export tasks, oldest first; ?type=ndjson (default) or ?type=csv."""
+        try:
+            # Не ?format=: его DRF забирает под выбор рендерера
+            export_type = request.query_params.get('type', 'ndjson')
+            encoder_class = EXPORT_ENCODERS.get(export_type)
+            if encoder_class is None:
+                return Response(
+                    {"error": f"Unknown export type, use one of: {', '.join(EXPORT_ENCODERS)}"},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+
+            encoder = encoder_class()
+            use_case = ExportTasksUseCase(TaskRepository(), CachedCategoryRepository())
+
+            # Под ASGI Django читает только async-итератор, под WSGI — только синхронный;
+            # итератор «не того» вида он буферизует целиком в памяти
+            if isinstance(request._request, ASGIRequest):
+                content = astream_export(encoder, use_case.aexecute(request.user.id))
+            else:
+                content = stream_export(encoder, use_case.execute(request.user.id))
+
+            response = StreamingHttpResponse(content, content_type=encoder.content_type)
+            response["Content-Disposition"] = f'attachment; filename="tasks.{encoder.extension}"'
+            return response
+
+        except Exception as e:
+            return Response(
+                {"error": str(e)},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+
 class TaskDetailView(APIView):
-    """Retrieve, update, and delete a task."""
+    """Retrieve, update, and delete a task (async)."""
 
     permission_classes = [IsAuthenticated]
 
-    def get(self, request, task_id):
+    async def get(self, request, task_id):
         """Get task by ID."""
         try:
             task_repo = TaskRepository()
-            task = task_repo.get_by_id(task_id)
+            task = await task_repo.aget_by_id(task_id)
 
             if not task:
                 return Response(
@@ -143,17 +336,30 @@ class TaskDetailView(APIView):
                     status=status.HTTP_403_FORBIDDEN
                 )
 
-            category_name = None
+            category = None
             if task.category_id:
-                category_repo = CategoryRepository()
-                category = category_repo.get_by_id(task.category_id)
-                category_name = category.name if category else None
+                category_repo = CachedCategoryRepository()
+                category = await category_repo.aget_by_id(task.category_id)
+            category_name = category.name if category else None
+
+            # ETag из уже загруженной задачи и категории из каталога: без лишних запросов,
+            # 304 отдаём до сериализации
+            etag = make_etag(
+                "task", task.id, task.updated_at, task.category_id,
+                category.updated_at if category else None
+            )
+            if is_not_modified(request, etag):
+                return Response(status=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+            headers = {"ETag": etag}
+            if accepts_fast_json(request):
+                return fast_json_response(render_task(task, category_name), headers=headers)
 
             task_dict = asdict(task)
             task_dict['category_name'] = category_name
 
             serializer = TaskSerializer(task_dict)
-            return Response(serializer.data)
+            return Response(serializer.data, headers=headers)
 
         except Exception as e:
             return Response(
@@ -161,34 +367,24 @@ class TaskDetailView(APIView):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
-    def patch(self, request, task_id):
+    async def patch(self, request, task_id):
         """Update task."""
         try:
             serializer = UpdateTaskSerializer(data=request.data)
             serializer.is_valid(raise_exception=True)
 
-            # Отменяем старое уведомление перед обновлением
-            existing = TaskModel.objects.filter(id=task_id).values_list(
-                'celery_task_id', flat=True
-            ).first()
-            _revoke_notification(existing)
-
             task_repo = TaskRepository()
-            category_repo = CategoryRepository()
-            use_case = UpdateTaskUseCase(task_repo, category_repo)
+            category_repo = CachedCategoryRepository()
+            use_case = UpdateTaskUseCase(task_repo, category_repo, TaskListCache())
 
             dto = UpdateTaskDTO(
                 task_id=task_id,
                 **serializer.validated_data
             )
 
-            task = use_case.execute(dto, request.user.id)
-
-            # Планируем новое уведомление если есть срок и задача не выполнена
-            new_celery_id = None
-            if task.due_date and not task.is_completed:
-                new_celery_id = _schedule_notification(task.id, task.due_date)
-            TaskModel.objects.filter(id=task.id).update(celery_task_id=new_celery_id)
+            # Новый срок или статус — новая версия расписания: прежнее напоминание
+            # отбросится при срабатывании, новое записано в outbox той же транзакцией
+            task = await use_case.aexecute(dto, request.user.id)
 
             response_serializer = TaskSerializer(asdict(task))
             return Response(response_serializer.data)
@@ -209,20 +405,15 @@ class TaskDetailView(APIView):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
-    def delete(self, request, task_id):
+    async def delete(self, request, task_id):
         """Delete task."""
         try:
-            # Отменяем уведомление перед удалением
-            existing = TaskModel.objects.filter(id=task_id).values_list(
-                'celery_task_id', flat=True
-            ).first()
-            _revoke_notification(existing)
-
             task_repo = TaskRepository()
-            use_case = DeleteTaskUseCase(task_repo)
+            use_case = DeleteTaskUseCase(task_repo, TaskListCache())
 
-            success = use_case.execute(task_id, request.user.id)
+            success = await use_case.aexecute(task_id, request.user.id)
 
+            # Напоминание удалённой задачи отбросится само: строки больше нет
             if success:
                 return Response(status=status.HTTP_204_NO_CONTENT)
             else:
@@ -0,0 +1,109 @@
+from dataclasses import asdict
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.test import SimpleTestCase, override_settings
+from rest_framework.renderers import JSONRenderer
+
+from apps.todo.application.dto.task_dto import TaskDTO, TaskPageDTO
+from apps.todo.domain.entities.category import Category
+from apps.todo.domain.entities.task import Task
+from apps.todo.presentation.api.v1.serializers.category_serializers import CategorySerializer
+from apps.todo.presentation.api.v1.serializers.fast_json import (
+    render_categories,
+    render_task,
+    render_task_page,
+)
+from apps.todo.presentation.api.v1.serializers.task_serializers import TaskSerializer
+
+TRICKY_TEXT = [
+    "plain",
+    "",
+    "line \u2028 separator \u2029 paragraph",
+    "control \x00\x01\x08\t\n\x0c\r\x1f\x7f chars",
+    "quotes \" and \\ backslash / slash",
+    "non-BMP \U0001F600 \U00010348 emoji",
+    "кириллица и <html> & 'апостроф'",
+    "BOM \ufeff replacement \ufffd zero-width \u200b",
+]
+
+DATETIMES = [
+    None,
+    datetime(2026, 3, 1, 12, 0, 0, tzinfo=dt_timezone.utc),
+    datetime(2026, 3, 1, 12, 0, 0, 123456, tzinfo=dt_timezone.utc),
+    datetime(2026, 3, 1, 12, 0, 0, 500, tzinfo=dt_timezone(timedelta(hours=-10))),
+    datetime(2026, 3, 1, 12, 0, 0),
+    datetime(2026, 3, 1, 12, 0, 0, 10),
+]
+
+
+def make_task(text, due_date, category_id="01ARZ3NDEKTSV4RRFFQ69G5FAV"):
+    created = datetime(2026, 1, 2, 3, 4, 5, 60000, tzinfo=dt_timezone.utc)
+    return Task(
+        id="01ARZ3NDEKTSV4RRFFQ69G5FAW",
+        title=text,
+        description=text,
+        user_id=7,
+        category_id=category_id,
+        due_date=due_date,
+        is_completed=bool(text),
+        created_at=created,
+        updated_at=created + timedelta(microseconds=1),
+    )
+
+
+class FastJSONParityMixin:
+    """render_* must produce exactly the bytes of the DRF serializer + JSONRenderer path."""
+
+    def drf_task(self, task, category_name):
+        data = asdict(task)
+        data["category_name"] = category_name
+        return JSONRenderer().render(TaskSerializer(data).data)
+
+    def test_tasks(self):
+        for text in TRICKY_TEXT:
+            for due_date in DATETIMES:
+                for category_id, category_name in (("01ARZ3NDEKTSV4RRFFQ69G5FAV", text), (None, None)):
+                    task = make_task(text, due_date, category_id)
+                    with self.subTest(text=text, due_date=due_date, category_id=category_id):
+                        self.assertEqual(render_task(task, category_name), self.drf_task(task, category_name))
+
+    def test_task_page(self):
+        items = [
+            TaskDTO(**asdict(make_task(text, DATETIMES[2])), category_name=text or None)
+            for text in TRICKY_TEXT
+        ]
+        for next_cursor in ("01ARZ3NDEKTSV4RRFFQ69G5FAW", None):
+            page = TaskPageDTO(items=items, next_cursor=next_cursor)
+            results = TaskSerializer([asdict(t) for t in items], many=True).data
+            expected = JSONRenderer().render({"next": next_cursor, "results": results})
+            self.assertEqual(render_task_page(page), expected)
+
+    def test_categories(self):
+        categories = [
+            Category(
+                id=f"01ARZ3NDEKTSV4RRFFQ69G5FA{i}",
+                name=text,
+                description=text,
+                color="#3B82F6",
+                created_at=created,
+                updated_at=created,
+            )
+            for i, (text, created) in enumerate(zip(TRICKY_TEXT, DATETIMES[1:] * 2))
+        ]
+        expected = JSONRenderer().render(CategorySerializer(categories, many=True).data)
+        self.assertEqual(render_categories(categories), expected)
+
+
+@override_settings(USE_TZ=True, TIME_ZONE="UTC")
+class FastJSONUTCTest(FastJSONParityMixin, SimpleTestCase):
+    pass
+
+
+@override_settings(USE_TZ=True, TIME_ZONE="Pacific/Honolulu")
+class FastJSONLocalTimeTest(FastJSONParityMixin, SimpleTestCase):
+    pass
+
+
+@override_settings(USE_TZ=False)
+class FastJSONNoTZTest(FastJSONParityMixin, SimpleTestCase):
+    pass
@@ -0,0 +1,91 @@
+import io
+import json
+import os
+import tempfile
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from apps.todo.infrastructure.persistence.models import Category, ReminderOutboxEntry, Task
+
+LOCMEM_CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+@override_settings(CACHES=LOCMEM_CACHES, CATEGORY_CATALOG_PUBSUB=False)
+class ImportTasksCommandTest(TestCase):
+    """import_tasks: CSV and JSONL input, per-row errors and the error threshold (bulk_create path off Postgres)."""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user("importer")
+        self.category = Category.objects.create(name="Work", description="")
+
+    def _import(self, content: str, suffix: str, *args):
+        fd, path = tempfile.mkstemp(suffix=suffix)
+        self.addCleanup(os.remove, path)
+        with os.fdopen(fd, "w", encoding="utf-8", newline="") as f:
+            f.write(content)
+        stderr = io.StringIO()
+        call_command("import_tasks", path, *args, stdout=io.StringIO(), stderr=stderr)
+        return stderr.getvalue()
+
+    def test_csv(self):
+        due_date = (timezone.now() + timedelta(days=1)).replace(microsecond=0)
+        content = (
+            "title,description,user,category,due_date,is_completed\r\n"
+            f'Buy milk,"2%, cold\nand fresh",importer,Work,{due_date.isoformat()},no\r\n'
+            "Done task,,importer,,,yes\r\n"
+        )
+        self.assertEqual(self._import(content, ".csv"), "")
+
+        milk = Task.objects.get(title="Buy milk")
+        self.assertEqual(milk.description, "2%, cold\nand fresh")
+        self.assertEqual(milk.user, self.user)
+        self.assertEqual(milk.category, self.category)
+        self.assertEqual(milk.due_date, due_date)
+        self.assertFalse(milk.is_completed)
+        self.assertTrue(Task.objects.get(title="Done task").is_completed)
+
+    def test_jsonl_invalid_rows_are_counted_not_fatal(self):
+        rows = [
+            json.dumps({"title": "Good", "user": "importer", "category": self.category.id}),
+            json.dumps({"title": "List user", "user": ["importer"]}),
+            json.dumps({"title": "Object user", "user": {"name": "importer"}}),
+            json.dumps({"title": "Unknown user", "user": "nobody"}),
+            "{not json",
+            json.dumps({"title": "Default user"}),
+        ]
+        stderr = self._import("\n".join(rows), ".jsonl", "--user", "importer")
+
+        self.assertEqual(
+            sorted(Task.objects.values_list("title", flat=True)), ["Default user", "Good"]
+        )
+        self.assertEqual(stderr.count("Строка"), 4)
+        self.assertIn("некорректный user ['importer']", stderr)
+
+    def test_rows_are_inserted_with_ids_and_reminders(self):
+        due_date = timezone.now() + timedelta(hours=2)
+        rows = [
+            json.dumps({"title": f"Task {i}", "user": "importer", "due_date": due_date.isoformat()})
+            for i in range(5)
+        ]
+        self._import("\n".join(rows), ".jsonl", "--chunk-size", "2")
+
+        tasks = list(Task.objects.filter(user=self.user))
+        self.assertEqual(len(tasks), 5)
+        self.assertEqual(len({t.id for t in tasks}), 5)
+        self.assertTrue(all(t.created_at and t.updated_at for t in tasks))
+        outbox_ids = set(ReminderOutboxEntry.objects.values_list("task_id", flat=True))
+        self.assertEqual(outbox_ids, {t.id for t in tasks})
+
+    def test_error_threshold_stops_import(self):
+        rows = [json.dumps({"title": "First", "user": "importer"})] + ["{bad"] * 3
+        with self.assertRaisesMessage(CommandError, "Слишком много ошибочных строк (3)"):
+            self._import("\n".join(rows), ".jsonl", "--chunk-size", "1", "--max-errors", "2")
+        # Chunks committed before the threshold stay imported
+        self.assertEqual(list(Task.objects.values_list("title", flat=True)), ["First"])
@@ -0,0 +1,65 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from apps.todo.infrastructure.persistence.models import Task, UserProfile
+from apps.todo.infrastructure.tasks import notifications
+from apps.todo.infrastructure.telegram.client import TelegramSendError
+
+LOCMEM_CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+@override_settings(CACHES=LOCMEM_CACHES, REMINDER_CLAIM_TIMEOUT=600)
+class ReminderClaimTest(TestCase):
+    """notify_task_due sends each reminder version once and never loses it to a dead worker."""
+
+    def setUp(self):
+        user = User.objects.create_user("claims_user")
+        UserProfile.objects.create(user=user, telegram_id=42)
+        self.task = Task(title="Task", description="", user=user, due_date=timezone.now() - timedelta(hours=1))
+        self.task.save()
+
+    def _notify(self, send_result=True):
+        with mock.patch.object(notifications, "_send_telegram_message", return_value=send_result) as send:
+            notifications.notify_task_due.run(self.task.id, 0)
+        return send.call_count
+
+    def test_sends_once_and_releases_claim(self):
+        self.assertEqual(self._notify(), 1)
+        self.task.refresh_from_db()
+        self.assertEqual(self.task.notified_version, 0)
+        self.assertIsNone(self.task.reminder_claimed_at)
+
+        self.assertEqual(self._notify(), 0)
+
+    def test_in_flight_claim_is_not_sent_twice(self):
+        Task.objects.filter(id=self.task.id).update(notified_version=0, reminder_claimed_at=timezone.now())
+        self.assertEqual(self._notify(), 0)
+
+    def test_expired_claim_is_swept_and_sent(self):
+        # The worker died after claiming and before sending
+        claimed_at = timezone.now() - timedelta(minutes=11)
+        Task.objects.filter(id=self.task.id).update(notified_version=0, reminder_claimed_at=claimed_at)
+
+        with mock.patch.object(notifications.notify_task_due, "delay") as delay:
+            notifications.sweep_missed_reminders()
+        delay.assert_any_call(self.task.id, 0)
+
+        self.assertEqual(self._notify(), 1)
+        self.task.refresh_from_db()
+        self.assertIsNone(self.task.reminder_claimed_at)
+
+    def test_telegram_error_releases_claim_for_retry(self):
+        error = TelegramSendError("flood", retry_after=1)
+        with mock.patch.object(notifications, "_send_telegram_message", side_effect=error), \
+                mock.patch.object(notifications.notify_task_due, "retry", side_effect=RuntimeError("retry")):
+            with self.assertRaisesMessage(RuntimeError, "retry"):
+                notifications.notify_task_due.run(self.task.id, 0)
+
+        self.task.refresh_from_db()
+        self.assertIsNone(self.task.notified_version)
+        self.assertIsNone(self.task.reminder_claimed_at)
+        self.assertEqual(self._notify(), 1)
@@ -0,0 +1,95 @@
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from apps.todo.domain.entities.task import Task as TaskEntity
+from apps.todo.domain.value_objects.task_id import ULIDGenerator
+from apps.todo.infrastructure.persistence.models import ReminderOutboxEntry, Task
+from apps.todo.infrastructure.persistence.repositories.task_repository_impl import TaskRepository
+from apps.todo.infrastructure.scheduling.reminder_outbox import ReminderOutbox
+
+LOCMEM_CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+class FakeScheduler:
+    def __init__(self, error=None):
+        self.error = error
+        self.scheduled = []
+
+    def schedule_many(self, reminders):
+        reminders = list(reminders)
+        if self.error:
+            raise self.error
+        self.scheduled.extend(reminders)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class ReminderOutboxTest(TestCase):
+    """Reminders enter the outbox in the task's transaction and leave it only once relayed."""
+
+    def setUp(self):
+        self.user = User.objects.create_user("outbox_user")
+        self.repo = TaskRepository()
+        self.due_date = timezone.now() + timedelta(hours=1)
+
+    def _entity(self, **kwargs):
+        now = timezone.now()
+        fields = dict(
+            id=ULIDGenerator.generate(), title="Task", description="d", user_id=self.user.id,
+            category_id=None, due_date=self.due_date, is_completed=False, created_at=now, updated_at=now,
+        )
+        fields.update(kwargs)
+        return TaskEntity(**fields)
+
+    def test_entry_is_written_with_the_task(self):
+        task = self.repo.create(self._entity())
+        self.assertEqual(
+            list(ReminderOutboxEntry.objects.values_list("task_id", "version", "due_date")),
+            [(task.id, 0, self.due_date)],
+        )
+
+    def test_rolled_back_save_leaves_no_entry(self):
+        with self.assertRaises(RuntimeError):
+            with transaction.atomic():
+                self.repo.create(self._entity())
+                raise RuntimeError("rollback")
+        self.assertFalse(Task.objects.exists())
+        self.assertFalse(ReminderOutboxEntry.objects.exists())
+
+    def test_no_entry_without_due_date_or_when_completed(self):
+        self.repo.create(self._entity(due_date=None))
+        self.repo.create(self._entity(is_completed=True))
+        self.assertFalse(ReminderOutboxEntry.objects.exists())
+
+    def test_reschedule_writes_new_version(self):
+        task = self.repo.create(self._entity())
+        task.due_date = self.due_date + timedelta(hours=1)
+        self.repo.update(task)
+        self.assertEqual(
+            sorted(ReminderOutboxEntry.objects.values_list("version", flat=True)), [0, 1]
+        )
+
+    def test_relay_publishes_and_deletes(self):
+        tasks = [self.repo.create(self._entity()) for _ in range(3)]
+        scheduler = FakeScheduler()
+        outbox = ReminderOutbox(scheduler)
+
+        self.assertEqual(outbox.relay(2), 2)
+        self.assertEqual(outbox.relay(2), 1)
+        self.assertEqual(outbox.relay(2), 0)
+
+        self.assertEqual(
+            sorted(task_id for task_id, _, _ in scheduler.scheduled), sorted(t.id for t in tasks)
+        )
+        self.assertFalse(ReminderOutboxEntry.objects.exists())
+
+    def test_failed_publish_keeps_entries(self):
+        self.repo.create(self._entity())
+        outbox = ReminderOutbox(FakeScheduler(error=ConnectionError("redis down")))
+
+        with self.assertRaises(ConnectionError):
+            outbox.relay(10)
+        self.assertEqual(ReminderOutboxEntry.objects.count(), 1)
@@ -0,0 +1,97 @@
+import json
+import tempfile
+from datetime import timedelta
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from apps.todo.infrastructure.persistence.models import Task
+from apps.todo.infrastructure.tasks import notifications
+
+LOCMEM_CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+@override_settings(CACHES=LOCMEM_CACHES, CATEGORY_CATALOG_PUBSUB=False)
+class ImportThenSweepTest(TestCase):
+    """Due dates skipped by import_tasks are not picked up later by sweep_missed_reminders."""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user("import_user")
+
+    def _sweep(self):
+        with mock.patch.object(notifications.notify_task_due, "delay") as delay:
+            notifications.sweep_missed_reminders()
+        return [call.args for call in delay.call_args_list]
+
+    def test_imported_past_due_task_is_not_swept(self):
+        now = timezone.now()
+        rows = [
+            {"title": "Past", "user": "import_user", "due_date": (now - timedelta(hours=1)).isoformat()},
+            {"title": "Future", "user": "import_user", "due_date": (now + timedelta(hours=1)).isoformat()},
+        ]
+        with tempfile.NamedTemporaryFile("w", suffix=".jsonl", encoding="utf-8") as f:
+            f.write("\n".join(json.dumps(row) for row in rows))
+            f.flush()
+            call_command("import_tasks", f.name, stdout=mock.Mock(), stderr=mock.Mock())
+
+        past = Task.objects.get(title="Past")
+        self.assertEqual(past.notified_version, past.reminder_version)
+        self.assertIsNone(Task.objects.get(title="Future").notified_version)
+        self.assertEqual(self._sweep(), [])
+
+    def test_missed_api_task_is_still_swept(self):
+        task = Task(title="Missed", description="", user=self.user, due_date=timezone.now() - timedelta(hours=1))
+        task.save()
+        self.assertEqual(self._sweep(), [(task.id, 0)])
+
+
+@override_settings(
+    CACHES=LOCMEM_CACHES,
+    REMINDER_SWEEP_CHUNK_SIZE=2,
+    REMINDER_SWEEP_MAX_TASKS=3,
+    REMINDER_CLAIM_TIMEOUT=600,
+)
+class SweepCheckpointTest(TestCase):
+    """An interrupted sweep resumes from its (due_date, id) checkpoint without gaps or repeats."""
+
+    def setUp(self):
+        cache.clear()
+        user = User.objects.create_user("sweep_user")
+        now = timezone.now()
+        # Several tasks share a due date, so the checkpoint has to break ties on id
+        due_dates = [now - timedelta(hours=h) for h in (5, 4, 4, 4, 3, 2, 2)]
+        for i, due_date in enumerate(due_dates):
+            Task(title=f"Task {i}", description="", user=user, due_date=due_date).save()
+
+    def _sweep(self):
+        with mock.patch.object(notifications.notify_task_due, "delay") as delay:
+            notifications.sweep_missed_reminders()
+        return [call.args[0] for call in delay.call_args_list]
+
+    def test_resumes_after_max_tasks(self):
+        first = self._sweep()
+        self.assertEqual(len(first), 3)
+        expected_order = list(Task.objects.order_by("due_date", "id").values_list("id", flat=True))
+        self.assertEqual(first, expected_order[:3])
+
+        second = self._sweep()
+        third = self._sweep()
+        self.assertEqual(first + second + third, expected_order)
+        # The window is done: nothing is enqueued again
+        self.assertEqual(self._sweep(), [])
+
+    def test_expired_claims_are_reenqueued_behind_checkpoint(self):
+        for _ in range(3):
+            self._sweep()
+        self.assertEqual(self._sweep(), [])
+
+        task = Task.objects.order_by("due_date", "id").first()
+        Task.objects.filter(id=task.id).update(
+            notified_version=0, reminder_claimed_at=timezone.now() - timedelta(minutes=11)
+        )
+        self.assertEqual(self._sweep(), [task.id])
@@ -0,0 +1,103 @@
+import time
+from urllib.parse import quote
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from apps.todo.infrastructure.authentication.service_authentication import (
+    ServiceSignatureAuthentication,
+    sign_request,
+)
+
+LOCMEM_CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+SECRET = "test-service-secret"
+
+
+@override_settings(
+    CACHES=LOCMEM_CACHES,
+    CATEGORY_CATALOG_PUBSUB=False,
+    SERVICE_AUTH_SECRET=SECRET,
+    SERVICE_AUTH_MAX_SKEW=300,
+)
+class ServiceSignatureAuthenticationTest(TestCase):
+    """HMAC-signed bot requests: signature, body, clock skew, nonce replay and signed Telegram id."""
+
+    def setUp(self):
+        cache.clear()
+        ServiceSignatureAuthentication._user_cache.clear()
+        User.objects.create_user("service_user")
+        self.client = APIClient()
+        self._nonce = 0
+
+    def _authorization(self, method, path, body=b"", telegram_id="", timestamp=None, nonce=None):
+        timestamp = str(int(timestamp if timestamp is not None else time.time()))
+        if nonce is None:
+            self._nonce += 1
+            nonce = f"nonce-{self._nonce:016d}"
+        signature = sign_request(SECRET, method, path, timestamp, nonce, "service_user", telegram_id, body)
+        return f"Service service_user:{timestamp}:{nonce}:{signature}"
+
+    def assertRejected(self, response, detail):
+        # SessionAuthentication comes first, so DRF answers 403 rather than 401
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(response.json()["detail"], detail)
+
+    def test_valid_signature(self):
+        auth = self._authorization("GET", "/api/v1/tasks/")
+        self.assertEqual(self.client.get("/api/v1/tasks/", HTTP_AUTHORIZATION=auth).status_code, 200)
+
+    def test_signed_post(self):
+        body = b'{"title": "Signed", "description": "d"}'
+        auth = self._authorization("POST", "/api/v1/tasks/", body)
+        response = self.client.post(
+            "/api/v1/tasks/", body, content_type="application/json", HTTP_AUTHORIZATION=auth
+        )
+        self.assertEqual(response.status_code, 201)
+
+    def test_tampered_body_is_rejected(self):
+        auth = self._authorization("POST", "/api/v1/tasks/", b'{"title": "A", "description": "d"}')
+        response = self.client.post(
+            "/api/v1/tasks/", b'{"title": "B", "description": "d"}',
+            content_type="application/json", HTTP_AUTHORIZATION=auth
+        )
+        self.assertRejected(response, "Invalid service signature.")
+
+    def test_expired_timestamp_is_rejected(self):
+        auth = self._authorization("GET", "/api/v1/tasks/", timestamp=time.time() - 301)
+        self.assertRejected(
+            self.client.get("/api/v1/tasks/", HTTP_AUTHORIZATION=auth), "Service signature expired."
+        )
+
+    def test_replayed_nonce_is_rejected(self):
+        auth = self._authorization("GET", "/api/v1/tasks/")
+        self.assertEqual(self.client.get("/api/v1/tasks/", HTTP_AUTHORIZATION=auth).status_code, 200)
+        self.assertRejected(
+            self.client.get("/api/v1/tasks/", HTTP_AUTHORIZATION=auth), "Service request already used."
+        )
+
+    def test_telegram_user_id_is_signed(self):
+        auth = self._authorization("GET", "/api/v1/tasks/", telegram_id="42")
+        response = self.client.get(
+            "/api/v1/tasks/", HTTP_AUTHORIZATION=auth, HTTP_X_TELEGRAM_USER_ID="43"
+        )
+        self.assertRejected(response, "Invalid service signature.")
+
+        auth = self._authorization("GET", "/api/v1/tasks/", telegram_id="42")
+        response = self.client.get(
+            "/api/v1/tasks/", HTTP_AUTHORIZATION=auth, HTTP_X_TELEGRAM_USER_ID="42"
+        )
+        self.assertEqual(response.status_code, 200)
+
+    def test_non_ascii_query_string(self):
+        # The bot (httpx) signs the percent-encoded path it actually sends
+        path = "/api/v1/tasks/search/?q=" + quote("купить молоко")
+        auth = self._authorization("GET", path)
+        self.assertEqual(self.client.get(path, HTTP_AUTHORIZATION=auth).status_code, 200)
+
+    def test_invalid_nonce_is_rejected(self):
+        auth = self._authorization("GET", "/api/v1/tasks/", nonce="short")
+        self.assertRejected(
+            self.client.get("/api/v1/tasks/", HTTP_AUTHORIZATION=auth), "Invalid service auth header."
+        )
@@ -0,0 +1,69 @@
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.todo.infrastructure.persistence.models import ReminderOutboxEntry, Task
+
+LOCMEM_CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+BULK_URL = "/api/v1/tasks/bulk/"
+
+
+@override_settings(CACHES=LOCMEM_CACHES, CATEGORY_CATALOG_PUBSUB=False)
+class TaskBulkTest(TestCase):
+    """POST /tasks/bulk/ applies all creates and updates in one transaction, or none of them."""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user("bulk_user")
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.task = Task.objects.create(title="Existing", description="d", user=self.user)
+        self.due_date = (timezone.now() + timedelta(days=1)).isoformat()
+
+    def _payload(self, update_id):
+        return {
+            "create": [
+                {"title": "New 1", "description": "d", "due_date": self.due_date},
+                {"title": "New 2", "description": "d"},
+            ],
+            "update": [
+                {"id": self.task.id, "title": "Renamed", "due_date": self.due_date},
+                {"id": update_id, "is_completed": True},
+            ],
+        }
+
+    def test_creates_and_updates(self):
+        other = Task.objects.create(title="Other", description="d", user=self.user)
+        response = self.client.post(BULK_URL, self._payload(other.id), format="json")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([t["title"] for t in response.json()["created"]], ["New 1", "New 2"])
+        self.assertEqual(Task.objects.filter(user=self.user).count(), 4)
+        self.task.refresh_from_db()
+        self.assertEqual(self.task.title, "Renamed")
+        self.assertTrue(Task.objects.get(id=other.id).is_completed)
+        # New 1 and the rescheduled Existing
+        self.assertEqual(ReminderOutboxEntry.objects.count(), 2)
+
+    def test_missing_update_id_rolls_back_everything(self):
+        response = self.client.post(BULK_URL, self._payload("01ARZ3NDEKTSV4RRFFQ69G5FAV"), format="json")
+
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(list(Task.objects.values_list("title", flat=True)), ["Existing"])
+        self.task.refresh_from_db()
+        self.assertEqual(self.task.reminder_version, 0)
+        self.assertFalse(ReminderOutboxEntry.objects.exists())
+
+    def test_foreign_task_rolls_back_everything(self):
+        stranger = User.objects.create_user("stranger")
+        foreign = Task.objects.create(title="Foreign", description="d", user=stranger)
+        response = self.client.post(BULK_URL, self._payload(foreign.id), format="json")
+
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(Task.objects.filter(user=self.user).count(), 1)
+        self.assertFalse(Task.objects.get(id=foreign.id).is_completed)
+        self.assertFalse(ReminderOutboxEntry.objects.exists())
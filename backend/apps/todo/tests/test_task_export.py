@@ -0,0 +1,125 @@
+import csv
+import io
+import json
+from datetime import datetime, timezone as dt_timezone
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase, override_settings
+from rest_framework.test import APIClient
+
+from apps.todo.application.dto.task_dto import TaskDTO
+from apps.todo.infrastructure.cache.category_catalog import category_catalog
+from apps.todo.infrastructure.persistence.models import Category, Task
+from apps.todo.presentation.api.v1.serializers import task_export
+from apps.todo.presentation.api.v1.serializers.task_export import (
+    CSV_FIELDS,
+    CsvEncoder,
+    NdjsonEncoder,
+    stream_export,
+)
+
+LOCMEM_CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+TRICKY_DESCRIPTION = 'first, second\n"quoted" line\r\nlast'
+
+
+def make_dto(i, description="d", category_name=None):
+    created = datetime(2026, 1, 2, 3, 4, 5, 600000, tzinfo=dt_timezone.utc)
+    return TaskDTO(
+        id=f"01ARZ3NDEKTSV4RRFFQ69G5FA{i}",
+        title=f"Task {i}",
+        description=description,
+        user_id=1,
+        category_id="01ARZ3NDEKTSV4RRFFQ69G5FAZ" if category_name else None,
+        category_name=category_name,
+        due_date=None,
+        is_completed=bool(i % 2),
+        created_at=created,
+        updated_at=created,
+    )
+
+
+@override_settings(USE_TZ=True, TIME_ZONE="UTC")
+class ExportEncoderTest(SimpleTestCase):
+    """Encoders round-trip descriptions with commas, quotes and newlines; chunks flush early."""
+
+    def test_csv(self):
+        tasks = [make_dto(1, TRICKY_DESCRIPTION, "Work, home"), make_dto(2)]
+        content = b"".join(stream_export(CsvEncoder(), tasks)).decode()
+
+        rows = list(csv.reader(io.StringIO(content, newline="")))
+        self.assertEqual(rows[0], list(CSV_FIELDS))
+        self.assertEqual(rows[1], [
+            tasks[0].id, "Task 1", TRICKY_DESCRIPTION, "01ARZ3NDEKTSV4RRFFQ69G5FAZ", "Work, home",
+            "", "true", "2026-01-02T03:04:05.600000Z", "2026-01-02T03:04:05.600000Z",
+        ])
+        self.assertEqual(rows[2][2:7], ["d", "", "", "", "false"])
+        self.assertEqual(len(rows), 3)
+
+    def test_ndjson(self):
+        tasks = [make_dto(1, TRICKY_DESCRIPTION), make_dto(2, "plain", "Work")]
+        lines = b"".join(stream_export(NdjsonEncoder(), tasks)).decode().split("\n")
+
+        self.assertEqual(lines[-1], "")
+        records = [json.loads(line) for line in lines[:-1]]
+        self.assertEqual([r["description"] for r in records], [TRICKY_DESCRIPTION, "plain"])
+        self.assertEqual([r["category_name"] for r in records], [None, "Work"])
+
+    def test_empty_export_has_header_only(self):
+        self.assertEqual(b"".join(stream_export(CsvEncoder(), [])), CsvEncoder().header())
+        self.assertEqual(list(stream_export(NdjsonEncoder(), [])), [b""])
+
+    def test_first_row_is_flushed_then_chunks(self):
+        tasks = [make_dto(i % 10) for i in range(50)]
+        with mock.patch.object(task_export, "EXPORT_FLUSH_BYTES", 1024):
+            chunks = list(stream_export(NdjsonEncoder(), tasks))
+        self.assertEqual(chunks[0].count(b"\n"), 1)
+        self.assertGreater(len(chunks), 2)
+        self.assertEqual(sum(c.count(b"\n") for c in chunks), 50)
+
+
+@override_settings(CACHES=LOCMEM_CACHES, CATEGORY_CATALOG_PUBSUB=False)
+class TaskExportViewTest(TestCase):
+    """GET /tasks/export/ streams only the user's tasks, oldest first."""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user("export_user")
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        category = Category.objects.create(name="Work", description="")
+        # The catalog is per process; drop whatever earlier tests loaded into it
+        category_catalog.invalidate()
+        self.tasks = [
+            Task.objects.create(title="First", description=TRICKY_DESCRIPTION, user=self.user, category=category),
+            Task.objects.create(title="Second", description="d", user=self.user),
+        ]
+        Task.objects.create(title="Foreign", description="d", user=User.objects.create_user("other"))
+        # Export order is by ULID; tasks created within one millisecond may sort either way
+        self.tasks.sort(key=lambda t: t.id)
+
+    def _export(self, export_type):
+        response = self.client.get(f"/api/v1/tasks/export/?type={export_type}")
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        return response, b"".join(response.streaming_content).decode()
+
+    def test_ndjson_matches_task_api(self):
+        response, content = self._export("ndjson")
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        records = [json.loads(line) for line in content.splitlines()]
+        expected = [self.client.get(f"/api/v1/tasks/{t.id}/").json() for t in self.tasks]
+        self.assertEqual(records, expected)
+
+    def test_csv(self):
+        response, content = self._export("csv")
+        self.assertEqual(response["Content-Disposition"], 'attachment; filename="tasks.csv"')
+        rows = list(csv.DictReader(io.StringIO(content, newline="")))
+        self.assertEqual([r["title"] for r in rows], [t.title for t in self.tasks])
+        first = next(r for r in rows if r["title"] == "First")
+        self.assertEqual(first["description"], TRICKY_DESCRIPTION)
+        self.assertEqual(first["category_name"], "Work")
+
+    def test_unknown_type(self):
+        self.assertEqual(self.client.get("/api/v1/tasks/export/?type=xml").status_code, 400)
@@ -0,0 +1,37 @@
+from asgiref.sync import async_to_sync
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from apps.todo.infrastructure.cache.task_list_cache import TaskListCache
+
+LOCMEM_CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class TaskListCacheInvalidationTest(TestCase):
+    """Version bumps happen only after COMMIT, for the sync and async entry points alike."""
+
+    def setUp(self):
+        cache.clear()
+        self.list_cache = TaskListCache()
+
+    def test_invalidate_waits_for_commit(self):
+        tag = self.list_cache.get_version_tag(1)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.list_cache.invalidate(1)
+            self.assertEqual(self.list_cache.get_version_tag(1), tag)
+        self.assertNotEqual(self.list_cache.get_version_tag(1), tag)
+
+    def test_ainvalidate_waits_for_commit(self):
+        tag = self.list_cache.get_version_tag(1)
+        with self.captureOnCommitCallbacks(execute=True):
+            async_to_sync(self.list_cache.ainvalidate)(1)
+            self.assertEqual(self.list_cache.get_version_tag(1), tag)
+        self.assertNotEqual(self.list_cache.get_version_tag(1), tag)
+
+    def test_evicted_counter_is_recreated(self):
+        tag = self.list_cache.get_version_tag(1)
+        cache.delete(TaskListCache.USER_VERSION_KEY.format(user_id=1))
+        with self.captureOnCommitCallbacks(execute=True):
+            self.list_cache.invalidate(1)
+        self.assertNotEqual(self.list_cache.get_version_tag(1), tag)
@@ -0,0 +1,102 @@
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+LOCMEM_CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+@override_settings(CACHES=LOCMEM_CACHES, CATEGORY_CATALOG_PUBSUB=False)
+class TaskListETagTest(TestCase):
+    """A conditional GET of a task list page returns 304 only while the page is unchanged."""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user("etag_user")
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.task_ids = [
+            self.client.post(
+                "/api/v1/tasks/", {"title": f"Task {i}", "description": "d"}, format="json"
+            ).json()["id"]
+            for i in range(25)
+        ]
+
+    def _etag(self, url: str) -> str:
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return response["ETag"]
+
+    def test_unchanged_page_is_not_modified(self):
+        url = "/api/v1/tasks/?status=open&limit=20"
+        etag = self._etag(url)
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+    def test_delete_changes_etag(self):
+        url = "/api/v1/tasks/?limit=20"
+        etag = self._etag(url)
+        # Not the most recently updated task; list versions are bumped on commit
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.delete(f"/api/v1/tasks/{self.task_ids[10]}/")
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertNotIn(self.task_ids[10], [t["id"] for t in response.json()["results"]])
+
+    def test_status_change_invalidates_filtered_page(self):
+        url = "/api/v1/tasks/?status=open&limit=20"
+        etag = self._etag(url)
+        completed_id = self.task_ids[20]
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.patch(f"/api/v1/tasks/{completed_id}/", {"is_completed": True}, format="json")
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertNotIn(completed_id, [t["id"] for t in response.json()["results"]])
+
+        completed = self.client.get("/api/v1/tasks/?status=completed").json()["results"]
+        self.assertEqual([t["id"] for t in completed], [completed_id])
+
+    def test_overdue_has_no_etag(self):
+        response = self.client.get("/api/v1/tasks/?status=overdue")
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.has_header("ETag"))
+
+
+@override_settings(CACHES=LOCMEM_CACHES, CATEGORY_CATALOG_PUBSUB=False)
+class TaskDetailETagTest(TestCase):
+    """The task detail ETag comes from the loaded task: one query for 200, 304 and 404 alike."""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user("detail_etag_user")
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        task_id = self.client.post("/api/v1/tasks/", {"title": "Task", "description": "d"}, format="json").json()["id"]
+        self.url = f"/api/v1/tasks/{task_id}/"
+
+    def test_single_query_and_not_modified(self):
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        etag = response["ETag"]
+
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+    def test_missing_task_is_one_query(self):
+        with self.assertNumQueries(1):
+            response = self.client.get("/api/v1/tasks/01ARZ3NDEKTSV4RRFFQ69G5FAV/")
+        self.assertEqual(response.status_code, 404)
+
+    def test_update_changes_etag(self):
+        etag = self.client.get(self.url)["ETag"]
+        self.client.patch(self.url, {"title": "Renamed"}, format="json")
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(response.json()["title"], "Renamed")
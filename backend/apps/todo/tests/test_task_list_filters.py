@@ -0,0 +1,49 @@
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from apps.todo.infrastructure.cache.category_catalog import category_catalog
+from apps.todo.infrastructure.persistence.models import Category
+
+LOCMEM_CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+@override_settings(CACHES=LOCMEM_CACHES, CATEGORY_CATALOG_PUBSUB=False)
+class TaskListFilterTest(TestCase):
+    """Invalid list query parameters are rejected with 400 instead of returning an empty page."""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user("filter_user")
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.category = Category.objects.create(name="Work", description="")
+        category_catalog.invalidate()
+        for category_id in (self.category.id, None):
+            self.client.post(
+                "/api/v1/tasks/", {"title": "Task", "description": "d", "category_id": category_id}, format="json"
+            )
+
+    def test_category_filter(self):
+        for category_id in (self.category.id, self.category.id.lower()):
+            response = self.client.get(f"/api/v1/tasks/?category_id={category_id}")
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(
+                [t["category_id"] for t in response.json()["results"]], [self.category.id]
+            )
+
+    def test_malformed_category_id(self):
+        response = self.client.get("/api/v1/tasks/?category_id=nonexistent")
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("category_id", response.json()["error"])
+
+    def test_unknown_category_id(self):
+        response = self.client.get("/api/v1/tasks/?category_id=01ARZ3NDEKTSV4RRFFQ69G5FAV")
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()["error"], {"category_id": ["Category not found"]})
+
+    def test_other_invalid_parameters(self):
+        for query in ("status=unknown", "limit=abc", "after=bad", "due_before=yesterday"):
+            with self.subTest(query=query):
+                self.assertEqual(self.client.get(f"/api/v1/tasks/?{query}").status_code, 400)
@@ -0,0 +1,83 @@
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from apps.todo.application.use_cases.list_tasks import ListTasksUseCase
+from apps.todo.domain.value_objects.task_id import ULIDGenerator
+from apps.todo.infrastructure.cache.category_catalog import category_catalog
+from apps.todo.infrastructure.persistence.models import Category, Task
+from apps.todo.infrastructure.persistence.repositories.category_repository_impl import CategoryRepository
+from apps.todo.infrastructure.persistence.repositories.task_repository_impl import TaskRepository
+
+LOCMEM_CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+SIZES = (10, 1_000, 10_000)
+PAGE_SIZE = 100
+CATEGORIES = 20
+
+
+@override_settings(CACHES=LOCMEM_CACHES, CATEGORY_CATALOG_PUBSUB=False)
+class TaskListQueryCountTest(TestCase):
+    """The task list costs the same number of queries however many tasks the user has."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user("list_queries")
+        cls.category_ids = [
+            category.id for category in Category.objects.bulk_create([
+                Category(id=ULIDGenerator.generate(), name=f"Category {i}", description="")
+                for i in range(CATEGORIES)
+            ])
+        ]
+
+    def setUp(self):
+        cache.clear()
+        category_catalog.invalidate()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def _grow_to(self, size: int) -> None:
+        """Add tasks, every one of them in a category, until the user has size tasks."""
+        existing = Task.objects.filter(user=self.user).count()
+        ids = ULIDGenerator.generate_many(size - existing)
+        Task.objects.bulk_create(
+            [
+                Task(
+                    id=task_id,
+                    title=f"Task {existing + i}",
+                    description="",
+                    user=self.user,
+                    category_id=self.category_ids[(existing + i) % CATEGORIES],
+                )
+                for i, task_id in enumerate(ids)
+            ],
+            batch_size=1000,
+        )
+
+    def test_use_case_resolves_categories_in_one_query(self):
+        use_case = ListTasksUseCase(TaskRepository(), CategoryRepository())
+        for size in SIZES:
+            with self.subTest(tasks=size):
+                self._grow_to(size)
+                # The page and one get_many for its categories
+                with self.assertNumQueries(2):
+                    page = use_case.execute(self.user.id, limit=PAGE_SIZE)
+                self.assertEqual(len(page.items), min(size, PAGE_SIZE))
+                self.assertTrue(all(task.category_name for task in page.items))
+
+    def test_api_list_query_count_is_constant(self):
+        # Warm the category catalog, then measure cold list cache pages
+        self.client.get("/api/v1/tasks/")
+        for size in SIZES:
+            with self.subTest(tasks=size):
+                self._grow_to(size)
+                cache.clear()
+                with self.assertNumQueries(1):
+                    response = self.client.get(f"/api/v1/tasks/?limit={PAGE_SIZE}")
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(len(response.json()["results"]), min(size, PAGE_SIZE))
+
+                # Served from the list cache without touching the database
+                with self.assertNumQueries(0):
+                    self.client.get(f"/api/v1/tasks/?limit={PAGE_SIZE}")
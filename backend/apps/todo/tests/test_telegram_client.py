@@ -0,0 +1,66 @@
+import os
+
+import httpx
+from django.test import SimpleTestCase, override_settings
+
+from apps.todo.infrastructure.telegram.client import TelegramClient, TelegramSendError
+
+
+class FakeRateLimiter:
+    def __init__(self, acquire_error=None):
+        self.acquire_error = acquire_error
+        self.paused = []
+
+    def acquire(self, chat_id, timeout):
+        if self.acquire_error:
+            raise self.acquire_error
+        return True
+
+    def pause(self, seconds):
+        self.paused.append(seconds)
+
+
+@override_settings(TELEGRAM_BOT_TOKEN="token", TELEGRAM_ACQUIRE_TIMEOUT=1)
+class TelegramClientTest(SimpleTestCase):
+    """Temporary failures always surface as TelegramSendError, so reminders are retried."""
+
+    def _client(self, response: httpx.Response, rate_limiter=None) -> TelegramClient:
+        client = TelegramClient(rate_limiter or FakeRateLimiter())
+        client._http = httpx.Client(
+            base_url="https://api.telegram.org",
+            transport=httpx.MockTransport(lambda request: response),
+        )
+        client._pid = os.getpid()
+        return client
+
+    def _send_error(self, client: TelegramClient) -> TelegramSendError:
+        with self.assertRaises(TelegramSendError) as ctx:
+            client.send_message(42, "text")
+        return ctx.exception
+
+    def test_sent(self):
+        self.assertTrue(self._client(httpx.Response(200, json={"ok": True})).send_message(42, "text"))
+
+    def test_rejected(self):
+        self.assertFalse(self._client(httpx.Response(403, json={"ok": False})).send_message(42, "text"))
+
+    def test_429_json_retry_after(self):
+        limiter = FakeRateLimiter()
+        response = httpx.Response(429, json={"ok": False, "parameters": {"retry_after": 7}})
+        self.assertEqual(self._send_error(self._client(response, limiter)).retry_after, 7)
+        self.assertEqual(limiter.paused, [7])
+
+    def test_429_html_uses_retry_after_header(self):
+        response = httpx.Response(429, text="<html>Too Many Requests</html>", headers={"Retry-After": "5"})
+        self.assertEqual(self._send_error(self._client(response)).retry_after, 5)
+
+    def test_429_without_hints_waits_one_second(self):
+        response = httpx.Response(429, text="<html>Too Many Requests</html>")
+        self.assertEqual(self._send_error(self._client(response)).retry_after, 1)
+
+    def test_server_error(self):
+        self._send_error(self._client(httpx.Response(502, text="Bad Gateway")))
+
+    def test_rate_limiter_outage(self):
+        limiter = FakeRateLimiter(acquire_error=ConnectionError("redis down"))
+        self.assertEqual(self._send_error(self._client(httpx.Response(200), limiter)).retry_after, 1)
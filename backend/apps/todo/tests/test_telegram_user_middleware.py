@@ -0,0 +1,70 @@
+from asgiref.sync import async_to_sync
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+
+from apps.todo.infrastructure.middleware.telegram_user_middleware import TelegramUserMiddleware
+from apps.todo.infrastructure.persistence.models import UserProfile
+
+LOCMEM_CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class TelegramUserMiddlewareTest(TestCase):
+    """The profile is written only for a new or changed (user, telegram_id) mapping."""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user("tg_user")
+        self.factory = RequestFactory()
+
+    def _middleware(self):
+        return TelegramUserMiddleware(lambda request: HttpResponse())
+
+    def _request(self, telegram_id):
+        request = self.factory.get("/api/v1/tasks/", HTTP_X_TELEGRAM_USER_ID=str(telegram_id))
+        request.user = self.user
+        return request
+
+    def test_new_mapping_is_stored(self):
+        self._middleware()(self._request(42))
+        self.assertEqual(UserProfile.objects.get(user=self.user).telegram_id, 42)
+
+    def test_unchanged_mapping_is_not_written(self):
+        middleware = self._middleware()
+        middleware(self._request(42))
+
+        # Same process: the local cache answers
+        with self.assertNumQueries(0):
+            middleware(self._request(42))
+        # Another worker: Redis answers
+        with self.assertNumQueries(0):
+            self._middleware()(self._request(42))
+
+    def test_cache_miss_with_same_mapping_only_reads(self):
+        UserProfile.objects.create(user=self.user, telegram_id=42)
+        with self.assertNumQueries(1):
+            self._middleware()(self._request(42))
+
+    def test_changed_mapping_is_updated(self):
+        middleware = self._middleware()
+        middleware(self._request(42))
+        middleware(self._request(43))
+        self.assertEqual(UserProfile.objects.get(user=self.user).telegram_id, 43)
+
+    def test_async_known_mapping_stays_in_event_loop(self):
+        async def get_response(request):
+            return HttpResponse()
+
+        middleware = TelegramUserMiddleware(get_response)
+        async_to_sync(middleware)(self._request(42))
+        self.assertEqual(UserProfile.objects.get(user=self.user).telegram_id, 42)
+
+        with self.assertNumQueries(0):
+            async_to_sync(middleware)(self._request(42))
+
+    def test_invalid_header_is_ignored(self):
+        request = self._request("not-a-number")
+        self._middleware()(request)
+        self.assertFalse(UserProfile.objects.exists())
@@ -1,5 +1,6 @@
 import os
 from celery import Celery
+from celery.signals import task_postrun
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
 
@@ -10,6 +11,14 @@ app.config_from_object('django.conf:settings', namespace='CELERY')
 app.autodiscover_tasks()
 
 
+@task_postrun.connect
+def report_db_pool_stats(**kwargs):
+    """Periodically log the worker's DB pool stats to size DB_POOL_MAX_SIZE."""
+    from apps.todo.infrastructure.persistence.pool import report_pool_stats
+
+    report_pool_stats()
+
+
 @app.task(bind=True)
 def debug_task(self):
     """Debug task for testing Celery."""
@@ -26,6 +26,8 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    # gunicorn/uvicorn не раздают /static/ — админка (CSS/JS, autocomplete) берёт их отсюда
+    'whitenoise.middleware.WhiteNoiseMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -64,9 +66,35 @@ DATABASES = {
         'PASSWORD': config('DB_PASSWORD', default='postgres'),
         'HOST': config('DB_HOST', default='localhost'),
         'PORT': config('DB_PORT', default='5432'),
+        # Проверять соединение перед выдачей из пула
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {},
     }
 }
 
+# Пул соединений psycopg3 на процесс (gunicorn-воркер, Celery-воркер):
+# соединение возвращается в пул в конце запроса/задачи, а не закрывается
+DB_POOL_ENABLED = config('DB_POOL_ENABLED', default=True, cast=bool)
+if DB_POOL_ENABLED:
+    DATABASES['default']['OPTIONS']['pool'] = {
+        'min_size': config('DB_POOL_MIN_SIZE', default=1, cast=int),
+        'max_size': config('DB_POOL_MAX_SIZE', default=4, cast=int),
+        # Сколько ждать свободное соединение, прежде чем упасть с PoolTimeout
+        'timeout': config('DB_POOL_TIMEOUT', default=10.0, cast=float),
+        # Пересоздавать соединения раз в max_lifetime, закрывать простаивающие сверх min_size
+        'max_lifetime': config('DB_POOL_MAX_LIFETIME', default=1800.0, cast=float),
+        'max_idle': config('DB_POOL_MAX_IDLE', default=300.0, cast=float),
+    }
+
+# За PgBouncer в режиме transaction: server-side курсоры не переживают смену
+# соединения между транзакциями (prepared statements Django и так отключает)
+DB_PGBOUNCER = config('DB_PGBOUNCER', default=False, cast=bool)
+if DB_PGBOUNCER:
+    DATABASES['default']['DISABLE_SERVER_SIDE_CURSORS'] = True
+
+# Как часто Celery-воркеры пишут статистику пула в лог (секунды)
+DB_POOL_STATS_INTERVAL = config('DB_POOL_STATS_INTERVAL', default=300, cast=int)
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator',
@@ -91,12 +119,19 @@ USE_TZ = True
 
 STATIC_URL = 'static/'
 STATIC_ROOT = BASE_DIR / 'staticfiles'
+# Файлы собирает collectstatic при старте контейнера; без manifest, чтобы тесты
+# и бенчмарки работали без collectstatic
+STORAGES = {
+    'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+    'staticfiles': {'BACKEND': 'whitenoise.storage.CompressedStaticFilesStorage'},
+}
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
         'rest_framework.authentication.SessionAuthentication',
+        'apps.todo.infrastructure.authentication.service_authentication.ServiceSignatureAuthentication',
         'rest_framework.authentication.BasicAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
@@ -109,6 +144,25 @@ REST_FRAMEWORK = {
     'PAGE_SIZE': 20,
 }
 
+# HMAC-подпись запросов бота (см. ServiceSignatureAuthentication)
+SERVICE_AUTH_SECRET = config('SERVICE_AUTH_SECRET', default='')
+SERVICE_AUTH_MAX_SKEW = config('SERVICE_AUTH_MAX_SKEW', default=300, cast=int)
+SERVICE_AUTH_USER_CACHE_TTL = config('SERVICE_AUTH_USER_CACHE_TTL', default=60, cast=int)
+
+# Upper bound for ?limit= on keyset-paginated task lists
+TASKS_MAX_PAGE_SIZE = config('TASKS_MAX_PAGE_SIZE', default=100, cast=int)
+
+# Upper bound for items in one POST /api/v1/tasks/bulk/
+TASKS_BULK_MAX_ITEMS = config('TASKS_BULK_MAX_ITEMS', default=1000, cast=int)
+
+# Upper bound for ?q= length on GET /api/v1/tasks/search/
+TASKS_SEARCH_MAX_QUERY_LENGTH = config('TASKS_SEARCH_MAX_QUERY_LENGTH', default=200, cast=int)
+
+# Admin: above this planner estimate the changelist shows it instead of an exact COUNT(*)
+ADMIN_ESTIMATED_COUNT_THRESHOLD = config('ADMIN_ESTIMATED_COUNT_THRESHOLD', default=100_000, cast=int)
+# Admin: the category filter lists categories only up to this many
+ADMIN_CATEGORY_FILTER_MAX_CHOICES = config('ADMIN_CATEGORY_FILTER_MAX_CHOICES', default=50, cast=int)
+
 CORS_ALLOWED_ORIGINS = config(
     'CORS_ALLOWED_ORIGINS',
     default='http://localhost:3000,http://127.0.0.1:3000'
@@ -125,13 +179,73 @@ CELERY_TIMEZONE = TIME_ZONE
 CELERY_ENABLE_UTC = False
 CELERY_IMPORTS = ['apps.todo.infrastructure.tasks.notifications']
 
-CELERY_BEAT_SCHEDULE = {}
+# Напоминания хранятся в Redis ZSET, beat раз в REMINDER_POLL_INTERVAL секунд
+# забирает наступившие (см. ReminderScheduler)
+REMINDER_REDIS_URL = config('REDIS_URL', default='redis://localhost:6379/1')
+REMINDER_POLL_INTERVAL = config('REMINDER_POLL_INTERVAL', default=1.0, cast=float)
+REMINDER_DISPATCH_BATCH_SIZE = config('REMINDER_DISPATCH_BATCH_SIZE', default=500, cast=int)
+REMINDER_DISPATCH_MAX_BATCHES = config('REMINDER_DISPATCH_MAX_BATCHES', default=20, cast=int)
+# API и админка пишут напоминания в outbox (таблица reminder_outbox) в транзакции
+# задачи, relay_reminder_outbox переносит их в Redis (см. ReminderOutbox)
+REMINDER_OUTBOX_BATCH_SIZE = config('REMINDER_OUTBOX_BATCH_SIZE', default=500, cast=int)
+REMINDER_OUTBOX_MAX_BATCHES = config('REMINDER_OUTBOX_MAX_BATCHES', default=20, cast=int)
+
+# Страховка от потерянных напоминаний (Redis без персистентности, падение воркера
+# между claim_due и отправкой): sweep_missed_reminders раз в REMINDER_SWEEP_INTERVAL
+# секунд проходит просроченные задачи, по которым не уведомляли, старше
+# REMINDER_SWEEP_GRACE и не старше REMINDER_SWEEP_LOOKBACK секунд
+REMINDER_SWEEP_INTERVAL = config('REMINDER_SWEEP_INTERVAL', default=300.0, cast=float)
+REMINDER_SWEEP_GRACE = config('REMINDER_SWEEP_GRACE', default=120, cast=int)
+REMINDER_SWEEP_LOOKBACK = config('REMINDER_SWEEP_LOOKBACK', default=24 * 60 * 60, cast=int)
+REMINDER_SWEEP_CHUNK_SIZE = config('REMINDER_SWEEP_CHUNK_SIZE', default=1000, cast=int)
+REMINDER_SWEEP_MAX_TASKS = config('REMINDER_SWEEP_MAX_TASKS', default=20000, cast=int)
+# Захват напоминания на время отправки; старше — считается брошенным упавшим воркером
+REMINDER_CLAIM_TIMEOUT = config('REMINDER_CLAIM_TIMEOUT', default=600, cast=int)
+
+CELERY_BEAT_SCHEDULE = {
+    'dispatch-due-reminders': {
+        'task': 'dispatch_due_reminders',
+        'schedule': REMINDER_POLL_INTERVAL,
+        # Если воркеры лежат, не копим тики поллера в очереди
+        'options': {'expires': max(REMINDER_POLL_INTERVAL * 10, 10)},
+    },
+    'relay-reminder-outbox': {
+        'task': 'relay_reminder_outbox',
+        'schedule': REMINDER_POLL_INTERVAL,
+        'options': {'expires': max(REMINDER_POLL_INTERVAL * 10, 10)},
+    },
+    'sweep-missed-reminders': {
+        'task': 'sweep_missed_reminders',
+        'schedule': REMINDER_SWEEP_INTERVAL,
+        'options': {'expires': REMINDER_SWEEP_INTERVAL},
+    },
+}
 
 TELEGRAM_BOT_TOKEN = config('TELEGRAM_BOT_TOKEN', default='')
 
+# Общий для воркеров лимит отправки в Telegram (см. TelegramRateLimiter)
+TELEGRAM_RATE_LIMIT_REDIS_URL = config('REDIS_URL', default='redis://localhost:6379/1')
+TELEGRAM_GLOBAL_RATE = config('TELEGRAM_GLOBAL_RATE', default=30.0, cast=float)
+TELEGRAM_GLOBAL_BURST = config('TELEGRAM_GLOBAL_BURST', default=30, cast=int)
+TELEGRAM_CHAT_RATE = config('TELEGRAM_CHAT_RATE', default=1.0, cast=float)
+TELEGRAM_CHAT_BURST = config('TELEGRAM_CHAT_BURST', default=1, cast=int)
+TELEGRAM_ACQUIRE_TIMEOUT = config('TELEGRAM_ACQUIRE_TIMEOUT', default=5.0, cast=float)
+TELEGRAM_POOL_MAX_CONNECTIONS = config('TELEGRAM_POOL_MAX_CONNECTIONS', default=4, cast=int)
+TELEGRAM_SEND_MAX_RETRIES = config('TELEGRAM_SEND_MAX_RETRIES', default=10, cast=int)
+
 CACHES = {
     'default': {
         'BACKEND': 'django.core.cache.backends.redis.RedisCache',
         'LOCATION': config('REDIS_URL', default='redis://localhost:6379/1'),
     }
 }
+
+# Read-through кеш списков задач (см. TaskListCache)
+TASK_LIST_CACHE_TTL = config('TASK_LIST_CACHE_TTL', default=300, cast=int)
+TASK_LIST_CACHE_LOCK_TIMEOUT = config('TASK_LIST_CACHE_LOCK_TIMEOUT', default=10, cast=int)
+TASK_LIST_CACHE_LOCK_WAIT = config('TASK_LIST_CACHE_LOCK_WAIT', default=2.0, cast=float)
+
+# Каталог категорий в памяти процесса, инвалидация через Redis pub/sub
+CATEGORY_CATALOG_TTL = config('CATEGORY_CATALOG_TTL', default=60, cast=int)
+CATEGORY_CATALOG_PUBSUB = config('CATEGORY_CATALOG_PUBSUB', default=True, cast=bool)
+CATEGORY_CATALOG_REDIS_URL = config('REDIS_URL', default='redis://localhost:6379/1')
@@ -0,0 +1,25 @@
+"""
+Settings for `manage.py benchmark`.
+
+Uses the regular Postgres settings, or SQLite with BENCHMARK_DB=sqlite;
+caches are in-process so no Redis is needed.
+"""
+import os
+
+os.environ.setdefault('SECRET_KEY', 'benchmark-only-secret-key')
+
+from config.settings import *  # noqa: E402,F401,F403
+from config.settings import BASE_DIR, DATABASES, config  # noqa: E402
+
+if config('BENCHMARK_DB', default='postgres') == 'sqlite':
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': BASE_DIR / 'benchmark.sqlite3',
+            # Файловая тестовая БД, чтобы --keepdb переиспользовал засеянные данные
+            'TEST': {'NAME': BASE_DIR / 'test_benchmark.sqlite3'},
+        }
+    }
+
+CACHES = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+CATEGORY_CATALOG_PUBSUB = False
@@ -24,11 +24,12 @@ class CreateTaskSG(StatesGroup):
     due_date_input = State()
 
 
-async def get_categories_data(dialog_manager: DialogManager, **kwargs):
+async def get_categories_data(
+    dialog_manager: DialogManager, backend_client: BackendAPIClient, **kwargs
+):
     """Получить список категорий для диалога."""
     try:
-        async with BackendAPIClient() as client:
-            categories = await client.get_categories()
+        categories = await backend_client.get_categories()
         return {
             "categories": [(cat.id, cat.name) for cat in categories],
             "has_categories": bool(categories),
@@ -98,15 +99,16 @@ async def _create_task(message: Message, dialog_manager: DialogManager):
     """Создать задачу с собранными данными."""
     data = dialog_manager.dialog_data
     telegram_user_id = dialog_manager.middleware_data.get("event_from_user").id
+    backend_client: BackendAPIClient = dialog_manager.middleware_data["backend_client"]
 
     try:
-        async with BackendAPIClient(telegram_user_id=telegram_user_id) as client:
-            task = await client.create_task(
-                title=data["title"],
-                description=data["description"],
-                category_id=data.get("category_id"),
-                due_date=data.get("due_date"),
-            )
+        task = await backend_client.create_task(
+            title=data["title"],
+            description=data["description"],
+            category_id=data.get("category_id"),
+            due_date=data.get("due_date"),
+            telegram_user_id=telegram_user_id,
+        )
 
         due_text = ""
         if task.due_date:
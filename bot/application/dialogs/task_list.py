@@ -1,61 +1,155 @@
+import html
+from typing import Optional
 from datetime import datetime, timezone, timedelta
 
 ADAK_TZ = timezone(timedelta(hours=-10))
-from aiogram import Router
-from aiogram.filters import Command
-from aiogram.types import Message
+from aiogram import F, Router
+from aiogram.filters import Command, CommandObject
+from aiogram.types import CallbackQuery, InlineKeyboardButton, InlineKeyboardMarkup, Message
 
 from infrastructure.api_client.backend_client import BackendAPIClient
 
 router = Router()
 
 
+def _format_tasks(tasks, header: str) -> str:
+    """Текст списка задач с датой создания и сроком."""
+    text = header
+    for i, task in enumerate(tasks, 1):
+        status = "[выполнена]" if task.is_completed else "[в работе]"
+        category_info = f" [{task.category_name}]" if task.category_name else ""
+
+        created_date = datetime.fromisoformat(task.created_at.replace("Z", "+00:00"))
+        date_str = created_date.astimezone(ADAK_TZ).strftime("%d.%m.%Y %H:%M")
+
+        text += (
+            f"{i}. {status} <b>{task.title}</b>{category_info}\n"
+            f"   {task.description}\n"
+            f"   Создана: {date_str}\n"
+        )
+
+        if task.due_date:
+            due_date = datetime.fromisoformat(task.due_date.replace("Z", "+00:00"))
+            due_str = due_date.astimezone(ADAK_TZ).strftime("%d.%m.%Y %H:%M")
+            text += f"   Срок: {due_str} (Adak)\n"
+
+        text += "\n"
+    return text
+
+
+# Аргумент /list -> (status для API, заголовок, текст для пустого списка)
+LIST_FILTERS = {
+    "": (None, "Ваши задачи:\n\n", "У вас пока нет задач.\n\nИспользуйте /create, чтобы добавить первую задачу."),
+    "open": ("open", "Задачи в работе:\n\n", "Незавершённых задач нет."),
+    "done": ("completed", "Выполненные задачи:\n\n", "Выполненных задач пока нет."),
+    "overdue": ("overdue", "Просроченные задачи:\n\n", "Просроченных задач нет."),
+}
+
+
+# callback_data кнопки «Ещё»: list:<аргумент /list>:<курсор>; id задачи — 26 символов,
+# так что укладываемся в лимит Telegram в 64 байта
+LIST_MORE_PREFIX = "list:"
+
+
+def _more_keyboard(arg: str, next_cursor: str) -> InlineKeyboardMarkup:
+    """Кнопка для загрузки следующей страницы списка."""
+    return InlineKeyboardMarkup(inline_keyboard=[[
+        InlineKeyboardButton(text="Ещё задачи", callback_data=f"{LIST_MORE_PREFIX}{arg}:{next_cursor}")
+    ]])
+
+
+async def _send_task_page(
+    message: Message,
+    telegram_user_id: int,
+    arg: str,
+    backend_client: BackendAPIClient,
+    after: Optional[str] = None
+):
+    """Отправить одну страницу /list; если есть продолжение — с кнопкой «Ещё задачи»."""
+    status, header, empty_text = LIST_FILTERS[arg]
+
+    tasks, next_cursor = await backend_client.get_tasks(
+        telegram_user_id=telegram_user_id, status=status, after=after
+    )
+
+    if not tasks:
+        await message.answer(empty_text if after is None else "Больше задач нет.")
+        return
+
+    if after is not None:
+        header = header.replace(":", " (продолжение):", 1)
+    text = _format_tasks(tasks, header)
+    reply_markup = None
+    if next_cursor:
+        text += "Показаны не все задачи."
+        reply_markup = _more_keyboard(arg, next_cursor)
+
+    await message.answer(text, parse_mode="HTML", reply_markup=reply_markup)
+
+
 @router.message(Command("list"))
-async def cmd_list_tasks(message: Message):
-    """Показать список задач пользователя."""
+async def cmd_list_tasks(message: Message, command: CommandObject, backend_client: BackendAPIClient):
+    """Показать список задач пользователя: /list [open|done|overdue]."""
+    arg = (command.args or "").strip().lower()
+    if arg not in LIST_FILTERS:
+        await message.answer("Использование: /list [open|done|overdue]")
+        return
+
     try:
-        async with BackendAPIClient(telegram_user_id=message.from_user.id) as client:
-            tasks = await client.get_tasks()
+        await _send_task_page(message, message.from_user.id, arg, backend_client)
 
-        if not tasks:
-            await message.answer(
-                "У вас пока нет задач.\n\nИспользуйте /create, чтобы добавить первую задачу."
-            )
-            return
+    except Exception as e:
+        await message.answer(f"Ошибка при загрузке задач: {str(e)}")
 
-        text = "Ваши задачи:\n\n"
-        for i, task in enumerate(tasks, 1):
-            status = "[выполнена]" if task.is_completed else "[в работе]"
-            category_info = f" [{task.category_name}]" if task.category_name else ""
 
-            created_date = datetime.fromisoformat(task.created_at.replace("Z", "+00:00"))
-            date_str = created_date.astimezone(ADAK_TZ).strftime("%d.%m.%Y %H:%M")
+@router.callback_query(F.data.startswith(LIST_MORE_PREFIX))
+async def cb_list_more(callback: CallbackQuery, backend_client: BackendAPIClient):
+    """Следующая страница /list по кнопке «Ещё задачи»."""
+    arg, _, after = callback.data[len(LIST_MORE_PREFIX):].partition(":")
+    if arg not in LIST_FILTERS or not after:
+        await callback.answer("Список устарел, повторите /list", show_alert=True)
+        return
 
-            text += (
-                f"{i}. {status} <b>{task.title}</b>{category_info}\n"
-                f"   {task.description}\n"
-                f"   Создана: {date_str}\n"
-            )
+    await callback.answer()
+    # Убираем кнопку со старой страницы, чтобы её не нажали повторно
+    await callback.message.edit_reply_markup(reply_markup=None)
+
+    try:
+        await _send_task_page(callback.message, callback.from_user.id, arg, backend_client, after=after)
 
-            if task.due_date:
-                due_date = datetime.fromisoformat(task.due_date.replace("Z", "+00:00"))
-                due_str = due_date.astimezone(ADAK_TZ).strftime("%d.%m.%Y %H:%M")
-                text += f"   Срок: {due_str} (Adak)\n"
+    except Exception as e:
+        await callback.message.answer(f"Ошибка при загрузке задач: {str(e)}")
 
-            text += "\n"
 
-        await message.answer(text, parse_mode="HTML")
+@router.message(Command("find"))
+async def cmd_find_tasks(message: Message, command: CommandObject, backend_client: BackendAPIClient):
+    """Найти задачи по словам из названия и описания: /find <запрос>."""
+    query = (command.args or "").strip()
+    if not query:
+        await message.answer("Укажите, что искать: /find <слова из названия или описания>")
+        return
+
+    try:
+        tasks = await backend_client.search_tasks(query, telegram_user_id=message.from_user.id)
+
+        if not tasks:
+            await message.answer(f"По запросу «{html.escape(query)}» ничего не найдено.", parse_mode="HTML")
+            return
+
+        await message.answer(
+            _format_tasks(tasks, f"Найдено по запросу «{html.escape(query)}»:\n\n"),
+            parse_mode="HTML"
+        )
 
     except Exception as e:
-        await message.answer(f"Ошибка при загрузке задач: {str(e)}")
+        await message.answer(f"Ошибка при поиске задач: {str(e)}")
 
 
 @router.message(Command("categories"))
-async def cmd_list_categories(message: Message):
+async def cmd_list_categories(message: Message, backend_client: BackendAPIClient):
     """Показать список категорий."""
     try:
-        async with BackendAPIClient(telegram_user_id=message.from_user.id) as client:
-            categories = await client.get_categories()
+        categories = await backend_client.get_categories(telegram_user_id=message.from_user.id)
 
         if not categories:
             await message.answer(
@@ -11,7 +11,8 @@ async def cmd_start(message: Message):
     await message.answer(
         "Привет! Это бот для управления задачами.\n\n"
         "Доступные команды:\n"
-        "  /list — Мои задачи\n"
+        "  /list — Мои задачи (/list open | done | overdue)\n"
+        "  /find — Поиск по задачам\n"
         "  /create — Создать задачу\n"
         "  /categories — Список категорий"
     )
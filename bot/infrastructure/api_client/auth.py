@@ -0,0 +1,41 @@
+import hashlib
+import hmac
+import secrets
+import time
+from typing import Generator
+
+import httpx
+
+
+class ServiceSignatureAuth(httpx.Auth):
+    """
+    HMAC request signing for the backend API.
+
+    Mirrors ServiceSignatureAuthentication on the Django side:
+    Authorization: Service <username>:<timestamp>:<nonce>:<signature>
+
+    The X-Telegram-User-Id header is part of the signed message, and every
+    request gets a fresh nonce, since the backend rejects a nonce it has seen.
+    """
+
+    requires_request_body = True
+
+    def __init__(self, username: str, secret: str):
+        self.username = username
+        self.secret = secret.encode()
+
+    def auth_flow(self, request: httpx.Request) -> Generator[httpx.Request, httpx.Response, None]:
+        timestamp = str(int(time.time()))
+        nonce = secrets.token_urlsafe(18)
+        message = "\n".join([
+            request.method.upper(),
+            request.url.raw_path.decode("ascii"),
+            timestamp,
+            nonce,
+            self.username,
+            request.headers.get("X-Telegram-User-Id", ""),
+            hashlib.sha256(request.content).hexdigest(),
+        ])
+        signature = hmac.new(self.secret, message.encode(), hashlib.sha256).hexdigest()
+        request.headers["Authorization"] = f"Service {self.username}:{timestamp}:{nonce}:{signature}"
+        yield request
@@ -1,57 +1,146 @@
 import httpx
-from typing import List, Optional, Dict, Any
+from collections import OrderedDict
+from typing import List, Optional, Dict, Any, Tuple
 from decouple import config
 
 from core.models.task import Task, Category
+from infrastructure.api_client.auth import ServiceSignatureAuth
 
 
 class BackendAPIClient:
-    """Client for Django backend API."""
+    """
+    Client for Django backend API.
 
-    def __init__(self, telegram_user_id: Optional[int] = None):
+    One instance per process, created in main.py and shared by all handlers:
+    it owns a pooled keep-alive httpx.AsyncClient, so commands reuse open
+    connections. The Telegram user is passed per call. GET responses with
+    an ETag are kept in a small LRU cache and revalidated with If-None-Match.
+    """
+
+    def __init__(self):
         self.base_url = config('BACKEND_API_URL', default='http://localhost:8000')
         self.username = config('BACKEND_USERNAME', default='')
         self.password = config('BACKEND_PASSWORD', default='')
-        self.telegram_user_id = telegram_user_id
-        self.session: Optional[httpx.AsyncClient] = None
-
-    async def __aenter__(self):
-        """Context manager entry."""
-        headers = {}
-        if self.telegram_user_id:
-            headers["X-Telegram-User-Id"] = str(self.telegram_user_id)
+        self.service_secret = config('SERVICE_AUTH_SECRET', default='')
+        self._etag_cache: "OrderedDict[Tuple, Tuple[str, Any]]" = OrderedDict()
+        self._etag_cache_size = config('BACKEND_ETAG_CACHE_SIZE', default=256, cast=int)
 
         self.session = httpx.AsyncClient(
             base_url=self.base_url,
-            auth=(self.username, self.password) if self.username else None,
-            headers=headers,
-            timeout=30.0
+            auth=self._build_auth(),
+            timeout=config('BACKEND_TIMEOUT', default=30.0, cast=float),
+            limits=httpx.Limits(
+                max_connections=config('BACKEND_POOL_MAX_CONNECTIONS', default=20, cast=int),
+                max_keepalive_connections=config('BACKEND_POOL_MAX_KEEPALIVE', default=10, cast=int),
+                keepalive_expiry=config('BACKEND_POOL_KEEPALIVE_EXPIRY', default=30.0, cast=float),
+            ),
         )
+
+    def _build_auth(self) -> Optional[httpx.Auth]:
+        """HMAC request signing if SERVICE_AUTH_SECRET is set, Basic Auth otherwise."""
+        if not self.username:
+            return None
+        if self.service_secret:
+            return ServiceSignatureAuth(self.username, self.service_secret)
+        return httpx.BasicAuth(self.username, self.password)
+
+    @staticmethod
+    def _headers(telegram_user_id: Optional[int]) -> Dict[str, str]:
+        """Per-call headers identifying the Telegram user."""
+        if telegram_user_id:
+            return {"X-Telegram-User-Id": str(telegram_user_id)}
+        return {}
+
+    async def _get_json(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        telegram_user_id: Optional[int] = None
+    ) -> Any:
+        """Conditional GET: reuse the cached body when the backend answers 304."""
+        key = (url, tuple(sorted((params or {}).items())), telegram_user_id)
+        headers = self._headers(telegram_user_id)
+        cached = self._etag_cache.get(key)
+        if cached:
+            headers["If-None-Match"] = cached[0]
+
+        response = await self.session.get(url, params=params, headers=headers)
+        if response.status_code == 304 and cached:
+            self._etag_cache.move_to_end(key)
+            return cached[1]
+        response.raise_for_status()
+
+        data = response.json()
+        etag = response.headers.get("ETag")
+        if etag:
+            self._etag_cache[key] = (etag, data)
+            self._etag_cache.move_to_end(key)
+            while len(self._etag_cache) > self._etag_cache_size:
+                self._etag_cache.popitem(last=False)
+        return data
+
+    async def aclose(self) -> None:
+        """Close pooled connections on shutdown."""
+        await self.session.aclose()
+
+    async def __aenter__(self):
+        """Context manager entry."""
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
-        if self.session:
-            await self.session.aclose()
+        await self.aclose()
 
-    async def get_tasks(self, category_id: Optional[str] = None) -> List[Task]:
-        """Get tasks list."""
+    async def get_tasks(
+        self,
+        telegram_user_id: Optional[int] = None,
+        category_id: Optional[str] = None,
+        after: Optional[str] = None,
+        limit: Optional[int] = None,
+        status: Optional[str] = None
+    ) -> Tuple[List[Task], Optional[str]]:
+        """
+        Get one page of tasks, newest first; status is open, completed or overdue.
+
+        Returns (tasks, next_cursor); pass next_cursor back as ``after`` to get
+        the following page, None means this was the last one.
+        """
         params = {}
         if category_id:
             params['category_id'] = category_id
+        if status:
+            params['status'] = status
+        if after:
+            params['after'] = after
+        if limit:
+            params['limit'] = limit
 
-        response = await self.session.get('/api/v1/tasks/', params=params)
-        response.raise_for_status()
+        page = await self._get_json('/api/v1/tasks/', params, telegram_user_id)
 
-        tasks_data = response.json()
-        return [Task(**task) for task in tasks_data]
+        tasks_data = page['results']
+        return [Task(**task) for task in tasks_data], page.get('next')
+
+    async def search_tasks(
+        self,
+        query: str,
+        telegram_user_id: Optional[int] = None,
+        limit: Optional[int] = None
+    ) -> List[Task]:
+        """Full-text search over the user's tasks, best matches first."""
+        params = {'q': query}
+        if limit:
+            params['limit'] = limit
+
+        data = await self._get_json('/api/v1/tasks/search/', params, telegram_user_id)
+        return [Task(**task) for task in data['results']]
 
     async def create_task(
         self,
         title: str,
         description: str,
         category_id: Optional[str] = None,
-        due_date: Optional[str] = None
+        due_date: Optional[str] = None,
+        telegram_user_id: Optional[int] = None
     ) -> Task:
         """Create a new task."""
         data = {
@@ -63,24 +152,22 @@ class BackendAPIClient:
         if due_date:
             data['due_date'] = due_date
 
-        response = await self.session.post('/api/v1/tasks/', json=data)
+        response = await self.session.post(
+            '/api/v1/tasks/',
+            json=data,
+            headers=self._headers(telegram_user_id)
+        )
         response.raise_for_status()
 
         task_data = response.json()
         return Task(**task_data)
 
-    async def get_categories(self) -> List[Category]:
+    async def get_categories(self, telegram_user_id: Optional[int] = None) -> List[Category]:
         """Get categories list."""
-        response = await self.session.get('/api/v1/categories/')
-        response.raise_for_status()
-
-        categories_data = response.json()
+        categories_data = await self._get_json('/api/v1/categories/', telegram_user_id=telegram_user_id)
         return [Category(**cat) for cat in categories_data]
 
-    async def get_task(self, task_id: str) -> Task:
+    async def get_task(self, task_id: str, telegram_user_id: Optional[int] = None) -> Task:
         """Get task by ID."""
-        response = await self.session.get(f'/api/v1/tasks/{task_id}/')
-        response.raise_for_status()
-
-        task_data = response.json()
+        task_data = await self._get_json(f'/api/v1/tasks/{task_id}/', telegram_user_id=telegram_user_id)
         return Task(**task_data)
@@ -10,6 +10,7 @@ from redis.asyncio import Redis
 from application.handlers import start
 from application.dialogs import task_list
 from application.dialogs.task_create import router as create_router, create_task_dialog
+from infrastructure.api_client.backend_client import BackendAPIClient
 
 # Configure logging
 logging.basicConfig(
@@ -28,7 +29,10 @@ async def main():
     redis = Redis.from_url(redis_url)
     storage = RedisStorage(redis, key_builder=DefaultKeyBuilder(with_destiny=True))
 
-    dp = Dispatcher(storage=storage)
+    # Один пул соединений к backend на весь процесс; хендлеры получают его как backend_client
+    backend_client = BackendAPIClient()
+
+    dp = Dispatcher(storage=storage, backend_client=backend_client)
 
     # Регистрация роутеров
     dp.include_router(start.router)
@@ -45,6 +49,7 @@ async def main():
         await dp.start_polling(bot, allowed_updates=dp.resolve_used_update_types())
     finally:
         await bot.session.close()
+        await backend_client.aclose()
         await redis.aclose()
 
 